@@ -1,8 +1,10 @@
 import os
+import sys
 import json
-import argparse
 import time
 import requests
+from requests.adapters import HTTPAdapter
+from functools import lru_cache
 from typing import Optional, List, Dict, Any, Annotated
 from urllib.parse import urlencode, parse_qs, urlparse
 from dotenv import load_dotenv
@@ -22,9 +24,31 @@ if os.path.exists(env_path):
 else:
     print(f"Warning: .env file not found at: {env_path}")
 
+# One long-lived session for all Graph API calls, so requests reuse keep-alive
+# connections instead of paying a TCP + TLS handshake each time
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=16, pool_maxsize=64))
+
+# Environment lookups are cached; os.environ only changes when this module writes
+# to it, and every such write goes through _env_set() which keeps the cache current.
+_env_cache: Dict[str, str] = {}
+
+def _env_get(key: str) -> str:
+    """Return an environment variable ("" if unset), cached after the first lookup."""
+    try:
+        return _env_cache[key]
+    except KeyError:
+        value = _env_cache[key] = os.environ.get(key, "")
+        return value
+
+def _env_set(key: str, value: str) -> None:
+    """Set an environment variable and update the lookup cache."""
+    os.environ[key] = value
+    _env_cache[key] = value
+
 def get_env(var: str, default: Optional[str] = None) -> Optional[str]:
     """Fetch environment variable or return default if missing."""
-    value = os.getenv(var)
+    value = _env_get(var)
     if not value and default is not None:
         return default
     if not value:
@@ -34,7 +58,7 @@ def get_env(var: str, default: Optional[str] = None) -> Optional[str]:
 def get_access_token() -> str:
     """Get Instagram access token from environment, persistent storage, or OAuth2."""
     # First try direct access token from environment
-    direct_token = os.getenv("INSTAGRAM_ACCESS_TOKEN")
+    direct_token = _env_get("INSTAGRAM_ACCESS_TOKEN")
     if direct_token:
         return direct_token
     
@@ -46,7 +70,7 @@ def get_access_token() -> str:
     if stored_access_token:
         if _is_token_expired():
             # Try to refresh the token
-            refresh_token = stored_tokens.get("refresh_token") or os.getenv("INSTAGRAM_OAUTH_REFRESH_TOKEN")
+            refresh_token = stored_tokens.get("refresh_token") or _env_get("INSTAGRAM_OAUTH_REFRESH_TOKEN")
             if refresh_token and _is_oauth2_enabled():
                 try:
                     new_token = _refresh_oauth2_token(refresh_token)
@@ -59,13 +83,13 @@ def get_access_token() -> str:
         return stored_access_token
     
     # Try OAuth2 token from environment (backward compatibility)
-    oauth_token = os.getenv("INSTAGRAM_OAUTH_ACCESS_TOKEN")
+    oauth_token = _env_get("INSTAGRAM_OAUTH_ACCESS_TOKEN")
     if oauth_token:
         return oauth_token
     
     # If using OAuth2, check if we need to refresh
     if _is_oauth2_enabled():
-        oauth_refresh_token = os.getenv("INSTAGRAM_OAUTH_REFRESH_TOKEN")
+        oauth_refresh_token = _env_get("INSTAGRAM_OAUTH_REFRESH_TOKEN")
         if oauth_refresh_token:
             # Try to refresh the token
             try:
@@ -129,13 +153,13 @@ def _save_tokens(tokens: Dict[str, Any]) -> None:
         
         # Also update environment variables for backward compatibility
         if "access_token" in tokens:
-            os.environ["INSTAGRAM_OAUTH_ACCESS_TOKEN"] = tokens["access_token"]
+            _env_set("INSTAGRAM_OAUTH_ACCESS_TOKEN", tokens["access_token"])
         if "refresh_token" in tokens:
-            os.environ["INSTAGRAM_OAUTH_REFRESH_TOKEN"] = tokens["refresh_token"]
+            _env_set("INSTAGRAM_OAUTH_REFRESH_TOKEN", tokens["refresh_token"])
         if "page_access_token" in tokens:
-            os.environ["INSTAGRAM_PAGE_ACCESS_TOKEN"] = tokens["page_access_token"]
+            _env_set("INSTAGRAM_PAGE_ACCESS_TOKEN", tokens["page_access_token"])
         if "facebook_page_id" in tokens:
-            os.environ["FACEBOOK_PAGE_ID"] = tokens["facebook_page_id"]
+            _env_set("FACEBOOK_PAGE_ID", tokens["facebook_page_id"])
             
     except IOError as e:
         print(f"Warning: Failed to save tokens to {token_file}: {e}")
@@ -211,7 +235,7 @@ def _exchange_oauth2_code(code: str) -> Dict[str, Any]:
     }
     
     try:
-        response = requests.post(token_url, params=params, timeout=30)
+        response = _SESSION.post(token_url, params=params, timeout=30)
         response.raise_for_status()
         token_data = response.json()
         
@@ -229,7 +253,7 @@ def _exchange_oauth2_code(code: str) -> Dict[str, Any]:
             }
             
             try:
-                long_lived_response = requests.get(token_url, params=long_lived_params, timeout=30)
+                long_lived_response = _SESSION.get(token_url, params=long_lived_params, timeout=30)
                 long_lived_response.raise_for_status()
                 long_lived_data = long_lived_response.json()
                 
@@ -262,11 +286,11 @@ def _exchange_oauth2_code(code: str) -> Dict[str, Any]:
         tokens_to_save = {}
         if "access_token" in token_data:
             tokens_to_save["access_token"] = token_data["access_token"]
-            os.environ["INSTAGRAM_OAUTH_ACCESS_TOKEN"] = token_data["access_token"]
+            _env_set("INSTAGRAM_OAUTH_ACCESS_TOKEN", token_data["access_token"])
         
         if "refresh_token" in token_data:
             tokens_to_save["refresh_token"] = token_data["refresh_token"]
-            os.environ["INSTAGRAM_OAUTH_REFRESH_TOKEN"] = token_data["refresh_token"]
+            _env_set("INSTAGRAM_OAUTH_REFRESH_TOKEN", token_data["refresh_token"])
         
         if "expires_in" in token_data:
             tokens_to_save["expires_in"] = token_data["expires_in"]
@@ -284,9 +308,9 @@ def _exchange_oauth2_code(code: str) -> Dict[str, Any]:
                     tokens_to_save["page_access_token"] = page_token_info.get("page_access_token")
                     tokens_to_save["facebook_page_id"] = page_token_info.get("page_id")
                     if tokens_to_save.get("page_access_token"):
-                        os.environ["INSTAGRAM_PAGE_ACCESS_TOKEN"] = tokens_to_save["page_access_token"]
+                        _env_set("INSTAGRAM_PAGE_ACCESS_TOKEN", tokens_to_save["page_access_token"])
                     if tokens_to_save.get("facebook_page_id"):
-                        os.environ["FACEBOOK_PAGE_ID"] = tokens_to_save["facebook_page_id"]
+                        _env_set("FACEBOOK_PAGE_ID", tokens_to_save["facebook_page_id"])
                     _save_tokens(tokens_to_save)
                     print("Page Access Token automatically retrieved and saved")
             except Exception as e:
@@ -321,7 +345,7 @@ def _refresh_oauth2_token(refresh_token: str) -> Optional[str]:
     }
     
     try:
-        response = requests.get(token_url, params=params, timeout=30)
+        response = _SESSION.get(token_url, params=params, timeout=30)
         response.raise_for_status()
         token_data = response.json()
         
@@ -353,11 +377,11 @@ def _refresh_oauth2_token(refresh_token: str) -> Optional[str]:
                 print(f"Warning: Could not refresh Page Access Token: {e}")
             
             _save_tokens(tokens_to_save)
-            os.environ["INSTAGRAM_OAUTH_ACCESS_TOKEN"] = token_data["access_token"]
+            _env_set("INSTAGRAM_OAUTH_ACCESS_TOKEN", token_data["access_token"])
             if tokens_to_save.get("page_access_token"):
-                os.environ["INSTAGRAM_PAGE_ACCESS_TOKEN"] = tokens_to_save["page_access_token"]
+                _env_set("INSTAGRAM_PAGE_ACCESS_TOKEN", tokens_to_save["page_access_token"])
             if tokens_to_save.get("facebook_page_id"):
-                os.environ["FACEBOOK_PAGE_ID"] = tokens_to_save["facebook_page_id"]
+                _env_set("FACEBOOK_PAGE_ID", tokens_to_save["facebook_page_id"])
             print("Token refreshed and saved automatically")
             return token_data["access_token"]
         
@@ -366,10 +390,25 @@ def _refresh_oauth2_token(refresh_token: str) -> Optional[str]:
         print(f"Warning: Failed to refresh token: {e}")
         return None
 
-def make_api_request(method: str, endpoint: str, params: Dict[str, Any] = None, data: Dict[str, Any] = None) -> Dict[str, Any]:
-    """Make a request to Instagram Graph API."""
-    access_token = get_access_token()
-    base_url = get_base_url()
+def make_api_request(
+    method: str,
+    endpoint: str,
+    params: Dict[str, Any] = None,
+    data: Dict[str, Any] = None,
+    access_token: Optional[str] = None,
+    graph_api_version: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Make a request to Instagram Graph API.
+
+    access_token and graph_api_version override the configured token/version for
+    this request only (e.g. a Page Access Token for the messaging endpoints).
+    """
+    if access_token is None:
+        access_token = get_access_token()
+    if graph_api_version:
+        base_url = f"https://graph.facebook.com/{graph_api_version}"
+    else:
+        base_url = get_base_url()
     url = f"{base_url}/{endpoint.lstrip('/')}"
     
     if params is None:
@@ -378,11 +417,11 @@ def make_api_request(method: str, endpoint: str, params: Dict[str, Any] = None,
     
     try:
         if method.upper() == "GET":
-            response = requests.get(url, params=params, timeout=30)
+            response = _SESSION.get(url, params=params, timeout=30)
         elif method.upper() == "POST":
-            response = requests.post(url, params=params, json=data, timeout=30)
+            response = _SESSION.post(url, params=params, json=data, timeout=30)
         elif method.upper() == "DELETE":
-            response = requests.delete(url, params=params, timeout=30)
+            response = _SESSION.delete(url, params=params, timeout=30)
         else:
             raise ValueError(f"Unsupported HTTP method: {method}")
         
@@ -401,14 +440,14 @@ def make_api_request(method: str, endpoint: str, params: Dict[str, Any] = None,
 # Initialize MCP server
 mcp = FastMCP("instagram-mcp")
 
-def _validate_required(params: Dict[str, Any], required: List[str]):
+def _validate_required(values: tuple, required: tuple):
     """Raise ValueError if any required params are missing/blank.
 
+    values holds the parameter values in the same order as the names in required.
     Treats empty strings, None, and empty lists as missing.
     """
     missing = []
-    for key in required:
-        value = params.get(key)
+    for key, value in zip(required, values):
         if value is None:
             missing.append(key)
         elif isinstance(value, str) and value.strip() == "":
@@ -419,6 +458,31 @@ def _validate_required(params: Dict[str, Any], required: List[str]):
         raise ValueError(f"Missing required parameter(s): {', '.join(missing)}")
     return None
 
+def _ok(data: Any, **extra: Any) -> Dict[str, Any]:
+    """Build a successful tool response; extra keys (e.g. paging) follow "data"."""
+    return {"data": data, **extra, "error": "", "successful": True}
+
+def _error(message: str, data: Any = None, **extra: Any) -> Dict[str, Any]:
+    """Build a failed tool response; data defaults to an empty dict."""
+    return {"data": {} if data is None else data, **extra, "error": message, "successful": False}
+
+# Required-parameter names for _validate_required()
+_REQ_CONVERSATION_ID = ("conversation_id",)
+_REQ_CREATION_ID = ("creation_id",)
+_REQ_IG_COMMENT_ID = ("ig_comment_id",)
+_REQ_IG_COMMENT_ID_MESSAGE = ("ig_comment_id", "message")
+_REQ_IG_MEDIA_ID = ("ig_media_id",)
+_REQ_IG_MEDIA_ID_MESSAGE = ("ig_media_id", "message")
+_REQ_IG_MEDIA_ID_METRIC = ("ig_media_id", "metric")
+_REQ_IG_POST_ID = ("ig_post_id",)
+_REQ_MEDIA_ID_MESSAGE = ("media_id", "message")
+_REQ_METRIC = ("metric",)
+_REQ_RECIPIENT_ID = ("recipient_id",)
+_REQ_RECIPIENT_ID_IMAGE_URL = ("recipient_id", "image_url")
+_REQ_RECIPIENT_ID_TEXT = ("recipient_id", "text")
+_REQ_RECIPIENT_IDS_IMAGE_URL = ("recipient_ids", "image_url")
+_REQ_USERNAME = ("username",)
+
 def _get_instagram_user_id(provided_id: Optional[str] = None) -> str:
     """Auto-detect Instagram user ID from access token. No env var needed."""
     if provided_id:
@@ -464,7 +528,8 @@ def _get_instagram_user_id(provided_id: Optional[str] = None) -> str:
     except Exception as e:
         # API call failed - provide helpful error
         error_msg = str(e)
-        if "permission" in error_msg.lower() or "access" in error_msg.lower():
+        lowered = error_msg.lower()
+        if "permission" in lowered or "access" in lowered:
             raise RuntimeError(
                 f"Failed to access Facebook Pages: {error_msg}\n"
                 "To fix this:\n"
@@ -490,7 +555,7 @@ def _get_page_access_token_from_user_token(user_access_token: str) -> Optional[D
             "fields": "id,access_token,instagram_business_account{id}"
         }
         
-        response = requests.get(url, params=params, timeout=30)
+        response = _SESSION.get(url, params=params, timeout=30)
         response.raise_for_status()
         accounts_data = response.json()
         
@@ -531,14 +596,14 @@ def _get_page_for_ig_account(ig_user_id: str) -> Dict[str, Optional[str]]:
     # Use stored tokens if available (they take priority)
     if stored_page_token and stored_page_id:
         # Set in environment for immediate use
-        os.environ["INSTAGRAM_PAGE_ACCESS_TOKEN"] = stored_page_token
-        os.environ["FACEBOOK_PAGE_ID"] = stored_page_id
+        _env_set("INSTAGRAM_PAGE_ACCESS_TOKEN", stored_page_token)
+        _env_set("FACEBOOK_PAGE_ID", stored_page_id)
         print(f"Loaded Page Access Token from storage (Page ID: {stored_page_id})")
         return {"page_id": stored_page_id, "page_access_token": stored_page_token}
     
     # Fallback to environment variables
-    page_id = os.getenv("FACEBOOK_PAGE_ID")
-    page_access_token = os.getenv("INSTAGRAM_PAGE_ACCESS_TOKEN")
+    page_id = _env_get("FACEBOOK_PAGE_ID")
+    page_access_token = _env_get("INSTAGRAM_PAGE_ACCESS_TOKEN")
     
     # If we have both from env, use them
     if page_access_token and page_id:
@@ -547,10 +612,10 @@ def _get_page_for_ig_account(ig_user_id: str) -> Dict[str, Optional[str]]:
     # If we have partial info, combine env and stored
     if not page_access_token and stored_page_token:
         page_access_token = stored_page_token
-        os.environ["INSTAGRAM_PAGE_ACCESS_TOKEN"] = stored_page_token
+        _env_set("INSTAGRAM_PAGE_ACCESS_TOKEN", stored_page_token)
     if not page_id and stored_page_id:
         page_id = stored_page_id
-        os.environ["FACEBOOK_PAGE_ID"] = stored_page_id
+        _env_set("FACEBOOK_PAGE_ID", stored_page_id)
     
     # If we now have both, return them
     if page_access_token and page_id:
@@ -645,18 +710,10 @@ def INSTAGRAM_CREATE_MEDIA_CONTAINER(
         
         result = make_api_request("POST", f"{ig_user_id}/media", data=params)
         
-        return {
-            "data": result,
-            "error": "",
-            "successful": True
-        }
+        return _ok(result)
         
     except Exception as e:
-        return {
-            "data": {},
-            "error": f"Failed to create media container: {str(e)}",
-            "successful": False
-        }
+        return _error(f"Failed to create media container: {str(e)}")
 
 @mcp.tool(
     "POST_IG_USER_MEDIA",
@@ -728,18 +785,10 @@ def INSTAGRAM_POST_IG_USER_MEDIA(
         
         result = make_api_request("POST", f"{ig_user_id}/media", data=params)
         
-        return {
-            "data": result,
-            "error": "",
-            "successful": True
-        }
+        return _ok(result)
         
     except Exception as e:
-        return {
-            "data": {},
-            "error": f"Failed to create media container: {str(e)}",
-            "successful": False
-        }
+        return _error(f"Failed to create media container: {str(e)}")
 
 @mcp.tool(
     "CREATE_CAROUSEL_CONTAINER",
@@ -801,18 +850,10 @@ def INSTAGRAM_CREATE_CAROUSEL_CONTAINER(
 
         result = make_api_request("POST", f"{ig_user_id}/media", data=params)
         
-        return {
-            "data": result,
-            "error": "",
-            "successful": True
-        }
+        return _ok(result)
         
     except Exception as e:
-        return {
-            "data": {},
-            "error": f"Failed to create carousel container: {str(e)}",
-            "successful": False
-        }
+        return _error(f"Failed to create carousel container: {str(e)}")
 
 @mcp.tool(
     "GET_POST_STATUS",
@@ -823,7 +864,7 @@ def INSTAGRAM_GET_POST_STATUS(
 ):
     """Check the processing status of a draft post container."""
     try:
-        _validate_required({"creation_id": creation_id}, ["creation_id"])
+        _validate_required((creation_id,), _REQ_CREATION_ID)
         
         params = {
             "fields": "status_code"
@@ -831,27 +872,15 @@ def INSTAGRAM_GET_POST_STATUS(
         
         result = make_api_request("GET", creation_id, params=params)
         
-        return {
-            "data": result,
-            "error": "",
-            "successful": True
-        }
+        return _ok(result)
         
     except requests.exceptions.Timeout as e:
-        return {
-            "data": {},
-            "error": f"Request timed out while checking post status. The API may be slow. Try again in a few moments. Error: {str(e)}",
-            "successful": False
-        }
+        return _error(f"Request timed out while checking post status. The API may be slow. Try again in a few moments. Error: {str(e)}")
     except Exception as e:
         error_msg = str(e)
         if "timeout" in error_msg.lower():
             error_msg = f"Request timed out. The API may be slow. Try again in a few moments. {error_msg}"
-        return {
-            "data": {},
-            "error": f"Failed to get post status: {error_msg}",
-            "successful": False
-        }
+        return _error(f"Failed to get post status: {error_msg}")
 
 @mcp.tool(
     "CREATE_POST",
@@ -862,7 +891,7 @@ def INSTAGRAM_CREATE_POST(
 ):
     """Publish a draft media container to Instagram (final publishing step)."""
     try:
-        _validate_required({"creation_id": creation_id}, ["creation_id"])
+        _validate_required((creation_id,), _REQ_CREATION_ID)
         ig_user_id = _get_instagram_user_id(None)
         
         # Check status first and wait if needed
@@ -878,11 +907,7 @@ def INSTAGRAM_CREATE_POST(
             if status_code == "FINISHED":
                 break
             if status_code == "ERROR":
-                return {
-                    "data": {},
-                    "error": "Media container processing failed",
-                    "successful": False
-                }
+                return _error("Media container processing failed")
 
             if attempt < max_retries - 1:
                 time.sleep(retry_delay)
@@ -895,18 +920,10 @@ def INSTAGRAM_CREATE_POST(
         
         result = make_api_request("POST", f"{ig_user_id}/media_publish", data=params)
         
-        return {
-            "data": result,
-            "error": "",
-            "successful": True
-        }
+        return _ok(result)
         
     except Exception as e:
-        return {
-            "data": {},
-            "error": f"Failed to create post: {str(e)}",
-            "successful": False
-        }
+        return _error(f"Failed to create post: {str(e)}")
 
 @mcp.tool(
     "POST_IG_USER_MEDIA_PUBLISH",
@@ -919,7 +936,7 @@ def INSTAGRAM_POST_IG_USER_MEDIA_PUBLISH(
 ):
     """Publish a media container to an Instagram Business account with automatic polling."""
     try:
-        _validate_required({"creation_id": creation_id}, ["creation_id"])
+        _validate_required((creation_id,), _REQ_CREATION_ID)
         ig_user_id = _get_instagram_user_id(None)
         
         # Limit max_wait to stay under typical MCP client timeout (60s)
@@ -934,11 +951,7 @@ def INSTAGRAM_POST_IG_USER_MEDIA_PUBLISH(
             # Check if we've exceeded max wait time
             elapsed = time.time() - start_time
             if elapsed >= max_wait:
-                return {
-                    "data": {},
-                    "error": f"Media container did not finish processing within {max_wait} seconds. Status may still be IN_PROGRESS. Try again later or check status manually.",
-                    "successful": False
-                }
+                return _error(f"Media container did not finish processing within {max_wait} seconds. Status may still be IN_PROGRESS. Try again later or check status manually.")
             
             # Check status
             status_params = {"fields": "status_code"}
@@ -948,11 +961,7 @@ def INSTAGRAM_POST_IG_USER_MEDIA_PUBLISH(
             if status_code == "FINISHED":
                 break
             if status_code == "ERROR":
-                return {
-                    "data": {},
-                    "error": "Media container processing failed with ERROR status",
-                    "successful": False
-                }
+                return _error("Media container processing failed with ERROR status")
             
             # Wait before next poll (except on last attempt)
             if attempt < max_retries - 1:
@@ -963,11 +972,7 @@ def INSTAGRAM_POST_IG_USER_MEDIA_PUBLISH(
         final_status = make_api_request("GET", creation_id, params=status_params)
         
         if final_status.get("status_code") != "FINISHED":
-            return {
-                "data": {},
-                "error": f"Media container status is '{final_status.get('status_code')}', not FINISHED. Processing may still be in progress.",
-                "successful": False
-            }
+            return _error(f"Media container status is '{final_status.get('status_code')}', not FINISHED. Processing may still be in progress.")
         
         # Publish the media
         params = {
@@ -976,27 +981,15 @@ def INSTAGRAM_POST_IG_USER_MEDIA_PUBLISH(
         
         result = make_api_request("POST", f"{ig_user_id}/media_publish", data=params)
         
-        return {
-            "data": result,
-            "error": "",
-            "successful": True
-        }
+        return _ok(result)
         
     except requests.exceptions.Timeout as e:
-        return {
-            "data": {},
-            "error": f"Request timed out during media publishing. The polling may have taken too long. Try using GET_POST_STATUS to check status manually, then publish when ready. Error: {str(e)}",
-            "successful": False
-        }
+        return _error(f"Request timed out during media publishing. The polling may have taken too long. Try using GET_POST_STATUS to check status manually, then publish when ready. Error: {str(e)}")
     except Exception as e:
         error_msg = str(e)
         if "timeout" in error_msg.lower():
             error_msg = f"Request timed out. The polling may have taken too long. Try reducing max_wait_seconds or use GET_POST_STATUS to check status manually. {error_msg}"
-        return {
-            "data": {},
-            "error": f"Failed to publish media: {error_msg}",
-            "successful": False
-        }
+        return _error(f"Failed to publish media: {error_msg}")
 
 @mcp.tool(
     "GET_USER_INFO",
@@ -1014,24 +1007,17 @@ def INSTAGRAM_GET_USER_INFO(
         
         result = make_api_request("GET", ig_user_id, params=params)
         
-        return {
-            "data": result,
-            "error": "",
-            "successful": True
-        }
+        return _ok(result)
         
     except Exception as e:
         error_msg = str(e)
+        lowered = error_msg.lower()
         
         # Provide helpful guidance for field errors
-        if "nonexisting field" in error_msg.lower() or "#100" in error_msg:
+        if "nonexisting field" in lowered or "#100" in error_msg:
             error_msg += " Note: Some fields may not be available for all account types or may require specific permissions."
         
-        return {
-            "data": {},
-            "error": f"Failed to get user info: {error_msg}",
-            "successful": False
-        }
+        return _error(f"Failed to get user info: {error_msg}")
 
 @mcp.tool(
     "GET_USER_INSIGHTS",
@@ -1048,7 +1034,7 @@ def INSTAGRAM_GET_USER_INSIGHTS(
 ):
     """Get Instagram account-level insights and analytics."""
     try:
-        _validate_required({"metric": metric}, ["metric"])
+        _validate_required((metric,), _REQ_METRIC)
         ig_user_id = _get_instagram_user_id(None)
         
         params = {
@@ -1069,36 +1055,27 @@ def INSTAGRAM_GET_USER_INSIGHTS(
         
         result = make_api_request("GET", f"{ig_user_id}/insights", params=params)
         
-        return {
-            "data": result.get("data", []),
-            "paging": result.get("paging", {}),
-            "error": "",
-            "successful": True
-        }
+        return _ok(result.get("data", []), paging=result.get("paging", {}))
         
     except Exception as e:
         error_msg = str(e)
+        lowered = error_msg.lower()
         
         # Provide helpful guidance for common errors
-        if "must be one of the following values" in error_msg.lower():
+        if "must be one of the following values" in lowered:
             error_msg += " Valid metrics for user insights: reach, follower_count, website_clicks, profile_views, online_followers, accounts_engaged, total_interactions, likes, comments, shares, saves, replies, views, profile_links_taps, follows_and_unfollows, and demographics metrics. Note: 'impressions' is NOT valid for user insights (only for media insights)."
-        elif "should be specified with parameter metric_type" in error_msg.lower():
-            if "total_value" in error_msg.lower():
+        elif "should be specified with parameter metric_type" in lowered:
+            if "total_value" in lowered:
                 error_msg += " Solution: Some metrics (like 'profile_views', 'reach') REQUIRE metric_type='total_value', while others (like 'follower_count') don't support it. You cannot mix these in one request. Make separate requests: 1) For metrics requiring total_value: use metric_type='total_value' with ['profile_views', 'reach'], 2) For follower_count: omit metric_type or use metric_type='time_series'."
-        elif "incompatible with the metric type" in error_msg.lower() or "incompatible" in error_msg.lower():
-            if "total_value" in error_msg.lower():
+        elif "incompatible with the metric type" in lowered or "incompatible" in lowered:
+            if "total_value" in lowered:
                 error_msg += " Solution: Some metrics like 'follower_count' don't support metric_type='total_value'. Try removing metric_type or use metric_type='time_series', or use different metrics that support total_value (e.g., 'profile_views', 'reach')."
-            elif "time_series" in error_msg.lower():
+            elif "time_series" in lowered:
                 error_msg += " Solution: Some metrics don't support time_series. Try using metric_type='total_value' or remove metric_type parameter."
-        elif "permission" in error_msg.lower() or "#10" in error_msg:
+        elif "permission" in lowered or "#10" in error_msg:
             error_msg += " To fix: Generate a new token with 'instagram_manage_insights' permission from Graph API Explorer."
         
-        return {
-            "data": [],
-            "paging": {},
-            "error": f"Failed to get user insights: {error_msg}",
-            "successful": False
-        }
+        return _error(f"Failed to get user insights: {error_msg}", data=[], paging={})
 
 @mcp.tool(
     "GET_USER_MEDIA",
@@ -1121,20 +1098,10 @@ def INSTAGRAM_GET_USER_MEDIA(
         
         result = make_api_request("GET", f"{ig_user_id}/media", params=params)
         
-        return {
-            "data": result.get("data", []),
-            "paging": result.get("paging", {}),
-            "error": "",
-            "successful": True
-        }
+        return _ok(result.get("data", []), paging=result.get("paging", {}))
         
     except Exception as e:
-        return {
-            "data": [],
-            "paging": {},
-            "error": f"Failed to get user media: {str(e)}",
-            "successful": False
-        }
+        return _error(f"Failed to get user media: {str(e)}", data=[], paging={})
 
 @mcp.tool(
     "GET_IG_USER_MEDIA",
@@ -1169,20 +1136,10 @@ def INSTAGRAM_GET_IG_USER_MEDIA(
         
         result = make_api_request("GET", f"{ig_user_id}/media", params=params)
         
-        return {
-            "data": result.get("data", []),
-            "paging": result.get("paging", {}),
-            "error": "",
-            "successful": True
-        }
+        return _ok(result.get("data", []), paging=result.get("paging", {}))
         
     except Exception as e:
-        return {
-            "data": [],
-            "paging": {},
-            "error": f"Failed to get user media: {str(e)}",
-            "successful": False
-        }
+        return _error(f"Failed to get user media: {str(e)}", data=[], paging={})
 
 @mcp.tool(
     "GET_IG_USER_STORIES",
@@ -1211,20 +1168,10 @@ def INSTAGRAM_GET_IG_USER_STORIES(
         
         result = make_api_request("GET", f"{ig_user_id}/stories", params=params)
         
-        return {
-            "data": result.get("data", []),
-            "paging": result.get("paging", {}),
-            "error": "",
-            "successful": True
-        }
+        return _ok(result.get("data", []), paging=result.get("paging", {}))
         
     except Exception as e:
-        return {
-            "data": [],
-            "paging": {},
-            "error": f"Failed to get user stories: {str(e)}",
-            "successful": False
-        }
+        return _error(f"Failed to get user stories: {str(e)}", data=[], paging={})
 
 @mcp.tool(
     "GET_IG_USER_TAGS",
@@ -1253,20 +1200,10 @@ def INSTAGRAM_GET_IG_USER_TAGS(
         
         result = make_api_request("GET", f"{ig_user_id}/tags", params=params)
         
-        return {
-            "data": result.get("data", []),
-            "paging": result.get("paging", {}),
-            "error": "",
-            "successful": True
-        }
+        return _ok(result.get("data", []), paging=result.get("paging", {}))
         
     except Exception as e:
-        return {
-            "data": [],
-            "paging": {},
-            "error": f"Failed to get user tags: {str(e)}",
-            "successful": False
-        }
+        return _error(f"Failed to get user tags: {str(e)}", data=[], paging={})
 
 @mcp.tool(
     "GET_IG_USER_CONTENT_PUBLISHING_LIMIT",
@@ -1285,18 +1222,10 @@ def INSTAGRAM_GET_IG_USER_CONTENT_PUBLISHING_LIMIT(
         
         result = make_api_request("GET", f"{ig_user_id}/content_publishing_limit", params=params)
         
-        return {
-            "data": result.get("data", []),
-            "error": "",
-            "successful": True
-        }
+        return _ok(result.get("data", []))
         
     except Exception as e:
-        return {
-            "data": [],
-            "error": f"Failed to get content publishing limit: {str(e)}",
-            "successful": False
-        }
+        return _error(f"Failed to get content publishing limit: {str(e)}", data=[])
 
 @mcp.tool(
     "GET_IG_USER_LIVE_MEDIA",
@@ -1318,25 +1247,12 @@ def INSTAGRAM_GET_IG_USER_LIVE_MEDIA(
         # Check if there's no live broadcast (empty data array)
         live_media_data = result.get("data", [])
         if not live_media_data:
-            return {
-                "data": result,
-                "error": "",
-                "successful": True,
-                "message": "No active live broadcast found. The account is not currently live streaming."
-            }
+            return _ok(result, message="No active live broadcast found. The account is not currently live streaming.")
         
-        return {
-            "data": result,
-            "error": "",
-            "successful": True
-        }
+        return _ok(result)
         
     except Exception as e:
-        return {
-            "data": {},
-            "error": f"Failed to get live media: {str(e)}",
-            "successful": False
-        }
+        return _error(f"Failed to get live media: {str(e)}")
 
 @mcp.tool(
     "GET_IG_MEDIA_COMMENTS",
@@ -1351,7 +1267,7 @@ def INSTAGRAM_GET_IG_MEDIA_COMMENTS(
 ):
     """Retrieve comments on an Instagram media object."""
     try:
-        _validate_required({"ig_media_id": ig_media_id}, ["ig_media_id"])
+        _validate_required((ig_media_id,), _REQ_IG_MEDIA_ID)
         
         params = {
             "fields": fields or "id,text,username,timestamp,like_count,from,hidden,media,parent_id"
@@ -1365,20 +1281,10 @@ def INSTAGRAM_GET_IG_MEDIA_COMMENTS(
         
         result = make_api_request("GET", f"{ig_media_id}/comments", params=params)
         
-        return {
-            "data": result.get("data", []),
-            "paging": result.get("paging", {}),
-            "error": "",
-            "successful": True
-        }
+        return _ok(result.get("data", []), paging=result.get("paging", {}))
         
     except Exception as e:
-        return {
-            "data": [],
-            "paging": {},
-            "error": f"Failed to get media comments: {str(e)}",
-            "successful": False
-        }
+        return _error(f"Failed to get media comments: {str(e)}", data=[], paging={})
 
 @mcp.tool(
     "GET_POST_COMMENTS",
@@ -1391,7 +1297,7 @@ def INSTAGRAM_GET_POST_COMMENTS(
 ):
     """Get comments on an Instagram post."""
     try:
-        _validate_required({"ig_post_id": ig_post_id}, ["ig_post_id"])
+        _validate_required((ig_post_id,), _REQ_IG_POST_ID)
         
         params = {}
         if limit:
@@ -1401,20 +1307,10 @@ def INSTAGRAM_GET_POST_COMMENTS(
         
         result = make_api_request("GET", f"{ig_post_id}/comments", params=params)
         
-        return {
-            "data": result.get("data", []),
-            "paging": result.get("paging", {}),
-            "error": "",
-            "successful": True
-        }
+        return _ok(result.get("data", []), paging=result.get("paging", {}))
         
     except Exception as e:
-        return {
-            "data": [],
-            "paging": {},
-            "error": f"Failed to get post comments: {str(e)}",
-            "successful": False
-        }
+        return _error(f"Failed to get post comments: {str(e)}", data=[], paging={})
 
 @mcp.tool(
     "GET_POST_INSIGHTS",
@@ -1427,7 +1323,7 @@ def INSTAGRAM_GET_POST_INSIGHTS(
 ):
     """Get Instagram post insights/analytics."""
     try:
-        _validate_required({"ig_post_id": ig_post_id}, ["ig_post_id"])
+        _validate_required((ig_post_id,), _REQ_IG_POST_ID)
         
         params = {}
         
@@ -1439,28 +1335,19 @@ def INSTAGRAM_GET_POST_INSIGHTS(
         
         result = make_api_request("GET", f"{ig_post_id}/insights", params=params)
         
-        return {
-            "data": result.get("data", []),
-            "paging": result.get("paging", {}),
-            "error": "",
-            "successful": True
-        }
+        return _ok(result.get("data", []), paging=result.get("paging", {}))
         
     except Exception as e:
         error_msg = str(e)
+        lowered = error_msg.lower()
         
         # Provide helpful guidance for common errors
-        if "impressions" in error_msg.lower() and "no longer supported" in error_msg.lower():
+        if "impressions" in lowered and "no longer supported" in lowered:
             error_msg += " Solution: Remove 'impressions' from your metrics list. Use 'reach' instead, or specify graph_api_version='v21.0' to use an older API version that supports impressions."
-        elif "permission" in error_msg.lower() or "#10" in error_msg:
+        elif "permission" in lowered or "#10" in error_msg:
             error_msg += " To fix: Generate a new token with 'instagram_manage_insights' permission from Graph API Explorer."
         
-        return {
-            "data": [],
-            "paging": {},
-            "error": f"Failed to get post insights: {error_msg}",
-            "successful": False
-        }
+        return _error(f"Failed to get post insights: {error_msg}", data=[], paging={})
 
 @mcp.tool(
     "GET_IG_MEDIA",
@@ -1472,7 +1359,7 @@ def INSTAGRAM_GET_IG_MEDIA(
 ):
     """Get a published Instagram media object."""
     try:
-        _validate_required({"ig_media_id": ig_media_id}, ["ig_media_id"])
+        _validate_required((ig_media_id,), _REQ_IG_MEDIA_ID)
 
         params = {
             "fields": fields or "id"
@@ -1480,17 +1367,9 @@ def INSTAGRAM_GET_IG_MEDIA(
 
         result = make_api_request("GET", ig_media_id, params=params)
 
-        return {
-            "data": result,
-            "error": "",
-            "successful": True
-        }
+        return _ok(result)
     except Exception as e:
-        return {
-            "data": {},
-            "error": f"Failed to get IG media: {str(e)}",
-            "successful": False
-        }
+        return _error(f"Failed to get IG media: {str(e)}")
 
 @mcp.tool(
     "GET_IG_MEDIA_CHILDREN",
@@ -1502,7 +1381,7 @@ def INSTAGRAM_GET_IG_MEDIA_CHILDREN(
 ):
     """Get children of a carousel/album post."""
     try:
-        _validate_required({"ig_media_id": ig_media_id}, ["ig_media_id"])
+        _validate_required((ig_media_id,), _REQ_IG_MEDIA_ID)
 
         params = {
             "fields": fields or "id,media_type,media_url,permalink,timestamp"
@@ -1512,17 +1391,9 @@ def INSTAGRAM_GET_IG_MEDIA_CHILDREN(
 
         result = make_api_request("GET", endpoint, params=params)
 
-        return {
-            "data": result.get("data", []),
-            "error": "",
-            "successful": True
-        }
+        return _ok(result.get("data", []))
     except Exception as e:
-        return {
-            "data": [],
-            "error": f"Failed to get media children: {str(e)}",
-            "successful": False
-        }
+        return _error(f"Failed to get media children: {str(e)}", data=[])
 
 @mcp.tool(
     "POST_IG_MEDIA_COMMENTS",
@@ -1534,7 +1405,7 @@ def INSTAGRAM_POST_IG_MEDIA_COMMENTS(
 ):
     """Create a comment on an Instagram media object."""
     try:
-        _validate_required({"ig_media_id": ig_media_id, "message": message}, ["ig_media_id", "message"])
+        _validate_required((ig_media_id, message), _REQ_IG_MEDIA_ID_MESSAGE)
         
         params = {
             "message": message
@@ -1542,18 +1413,10 @@ def INSTAGRAM_POST_IG_MEDIA_COMMENTS(
         
         result = make_api_request("POST", f"{ig_media_id}/comments", data=params)
         
-        return {
-            "data": result,
-            "error": "",
-            "successful": True
-        }
+        return _ok(result)
         
     except Exception as e:
-        return {
-            "data": {},
-            "error": f"Failed to post media comment: {str(e)}",
-            "successful": False
-        }
+        return _error(f"Failed to post media comment: {str(e)}")
 
 @mcp.tool(
     "POST_IG_COMMENT_REPLIES",
@@ -1565,7 +1428,7 @@ def INSTAGRAM_POST_IG_COMMENT_REPLIES(
 ):
     """Create a reply to an Instagram comment."""
     try:
-        _validate_required({"ig_comment_id": ig_comment_id, "message": message}, ["ig_comment_id", "message"])
+        _validate_required((ig_comment_id, message), _REQ_IG_COMMENT_ID_MESSAGE)
         
         params = {
             "message": message
@@ -1573,18 +1436,10 @@ def INSTAGRAM_POST_IG_COMMENT_REPLIES(
         
         result = make_api_request("POST", f"{ig_comment_id}/replies", data=params)
         
-        return {
-            "data": result,
-            "error": "",
-            "successful": True
-        }
+        return _ok(result)
         
     except Exception as e:
-        return {
-            "data": {},
-            "error": f"Failed to post comment reply: {str(e)}",
-            "successful": False
-        }
+        return _error(f"Failed to post comment reply: {str(e)}")
 
 @mcp.tool(
     "POST_IG_USER_MENTIONS",
@@ -1597,7 +1452,7 @@ def INSTAGRAM_POST_IG_USER_MENTIONS(
 ):
     """Reply to a mention of your Instagram Business or Creator account."""
     try:
-        _validate_required({"media_id": media_id, "message": message}, ["media_id", "message"])
+        _validate_required((media_id, message), _REQ_MEDIA_ID_MESSAGE)
         ig_user_id = _get_instagram_user_id(None)
         
         params = {
@@ -1612,18 +1467,10 @@ def INSTAGRAM_POST_IG_USER_MENTIONS(
         
         result = make_api_request("POST", endpoint, data=params)
         
-        return {
-            "data": result,
-            "error": "",
-            "successful": True
-        }
+        return _ok(result)
         
     except Exception as e:
-        return {
-            "data": {},
-            "error": f"Failed to reply to mention: {str(e)}",
-            "successful": False
-        }
+        return _error(f"Failed to reply to mention: {str(e)}")
 
 @mcp.tool(
     "REPLY_TO_COMMENT",
@@ -1635,7 +1482,7 @@ def INSTAGRAM_REPLY_TO_COMMENT(
 ):
     """Reply to a comment on Instagram media."""
     try:
-        _validate_required({"ig_comment_id": ig_comment_id, "message": message}, ["ig_comment_id", "message"])
+        _validate_required((ig_comment_id, message), _REQ_IG_COMMENT_ID_MESSAGE)
         
         params = {
             "message": message
@@ -1643,18 +1490,10 @@ def INSTAGRAM_REPLY_TO_COMMENT(
         
         result = make_api_request("POST", f"{ig_comment_id}/replies", data=params)
         
-        return {
-            "data": result,
-            "error": "",
-            "successful": True
-        }
+        return _ok(result)
         
     except Exception as e:
-        return {
-            "data": {},
-            "error": f"Failed to reply to comment: {str(e)}",
-            "successful": False
-        }
+        return _error(f"Failed to reply to comment: {str(e)}")
 
 @mcp.tool(
     "GET_IG_COMMENT_REPLIES",
@@ -1669,7 +1508,7 @@ def INSTAGRAM_GET_IG_COMMENT_REPLIES(
 ):
     """Get replies to a specific Instagram comment."""
     try:
-        _validate_required({"ig_comment_id": ig_comment_id}, ["ig_comment_id"])
+        _validate_required((ig_comment_id,), _REQ_IG_COMMENT_ID)
 
         params = {
             "fields": fields or "id,text,username,timestamp,like_count,hidden,from,media,parent_id,legacy_instagram_comment_id",
@@ -1685,19 +1524,9 @@ def INSTAGRAM_GET_IG_COMMENT_REPLIES(
 
         result = make_api_request("GET", endpoint, params=params)
 
-        return {
-            "data": result.get("data", []),
-            "paging": result.get("paging", {}),
-            "error": "",
-            "successful": True
-        }
+        return _ok(result.get("data", []), paging=result.get("paging", {}))
     except Exception as e:
-        return {
-            "data": [],
-            "paging": {},
-            "error": f"Failed to get comment replies: {str(e)}",
-            "successful": False
-        }
+        return _error(f"Failed to get comment replies: {str(e)}", data=[], paging={})
 
 @mcp.tool(
     "DELETE_COMMENT",
@@ -1708,22 +1537,14 @@ def INSTAGRAM_DELETE_COMMENT(
 ):
     """Delete a comment on Instagram media."""
     try:
-        _validate_required({"ig_comment_id": ig_comment_id}, ["ig_comment_id"])
+        _validate_required((ig_comment_id,), _REQ_IG_COMMENT_ID)
         
         result = make_api_request("DELETE", ig_comment_id)
         
-        return {
-            "data": result if result else {"success": True},
-            "error": "",
-            "successful": True
-        }
+        return _ok(result if result else {"success": True})
         
     except Exception as e:
-        return {
-            "data": {},
-            "error": f"Failed to delete comment: {str(e)}",
-            "successful": False
-        }
+        return _error(f"Failed to delete comment: {str(e)}")
 
 @mcp.tool(
     "GET_IG_MEDIA_INSIGHTS",
@@ -1736,7 +1557,7 @@ def INSTAGRAM_GET_IG_MEDIA_INSIGHTS(
 ):
     """Get insights for an Instagram media object."""
     try:
-        _validate_required({"ig_media_id": ig_media_id, "metric": metric}, ["ig_media_id", "metric"])
+        _validate_required((ig_media_id, metric), _REQ_IG_MEDIA_ID_METRIC)
         
         # Get the API version being used
         api_version = get_graph_api_version()
@@ -1760,29 +1581,20 @@ def INSTAGRAM_GET_IG_MEDIA_INSIGHTS(
 
         result = make_api_request("GET", f"{ig_media_id}/insights", params=params)
 
-        return {
-            "data": result.get("data", []),
-            "paging": result.get("paging", {}),
-            "error": "",
-            "successful": True
-        }
+        return _ok(result.get("data", []), paging=result.get("paging", {}))
     except Exception as e:
         error_msg = str(e)
+        lowered = error_msg.lower()
         
         # Provide helpful guidance for common errors
-        if "impressions" in error_msg.lower() and "no longer supported" in error_msg.lower():
+        if "impressions" in lowered and "no longer supported" in lowered:
             error_msg += " Solution: Remove 'impressions' from your metrics list. Use 'reach' instead, or specify graph_api_version='v21.0' to use an older API version that supports impressions."
-        elif "metric" in error_msg.lower() and "must be one of" in error_msg.lower():
+        elif "metric" in lowered and "must be one of" in lowered:
             error_msg += " Common valid metrics for v22.0+: reach, likes, comments, shares, saved, video_views, plays, total_interactions, views, replies."
-        elif "permission" in error_msg.lower() or "#10" in error_msg:
+        elif "permission" in lowered or "#10" in error_msg:
             error_msg += " To fix: Generate a new token with 'instagram_manage_insights' permission from Graph API Explorer."
         
-        return {
-            "data": [],
-            "paging": {},
-            "error": f"Failed to get IG media insights: {error_msg}",
-            "successful": False
-        }
+        return _error(f"Failed to get IG media insights: {error_msg}", data=[], paging={})
 
 @mcp.tool(
     "GET_CONVERSATION",
@@ -1793,7 +1605,7 @@ def INSTAGRAM_GET_CONVERSATION(
 ):
     """Get details about a specific Instagram DM conversation."""
     try:
-        _validate_required({"conversation_id": conversation_id}, ["conversation_id"])
+        _validate_required((conversation_id,), _REQ_CONVERSATION_ID)
 
         params = {
             "fields": "id,participants,updated_time"
@@ -1814,49 +1626,13 @@ def INSTAGRAM_GET_CONVERSATION(
                 "or set INSTAGRAM_PAGE_ACCESS_TOKEN environment variable."
             )
         
-        # Store original tokens to restore later
-        original_token = os.environ.get("INSTAGRAM_ACCESS_TOKEN")
-        original_oauth_token = os.environ.get("INSTAGRAM_OAUTH_ACCESS_TOKEN")
-        original_version = os.environ.get("INSTAGRAM_GRAPH_API_VERSION")
-        
-        try:
-            # CRITICAL: Set page access token to INSTAGRAM_ACCESS_TOKEN so get_access_token() uses it
-            os.environ["INSTAGRAM_ACCESS_TOKEN"] = page_access_token
-            os.environ["INSTAGRAM_OAUTH_ACCESS_TOKEN"] = page_access_token
-            
-            # Make the API request
-            result = make_api_request("GET", endpoint, params=params)
-            
-        finally:
-            # Restore original tokens
-            if original_token:
-                os.environ["INSTAGRAM_ACCESS_TOKEN"] = original_token
-            elif "INSTAGRAM_ACCESS_TOKEN" in os.environ:
-                del os.environ["INSTAGRAM_ACCESS_TOKEN"]
-            
-            if original_oauth_token:
-                os.environ["INSTAGRAM_OAUTH_ACCESS_TOKEN"] = original_oauth_token
-            elif "INSTAGRAM_OAUTH_ACCESS_TOKEN" in os.environ:
-                del os.environ["INSTAGRAM_OAUTH_ACCESS_TOKEN"]
-            
-            # Restore graph API version
-            if original_version:
-                os.environ["INSTAGRAM_GRAPH_API_VERSION"] = original_version
-            elif "INSTAGRAM_GRAPH_API_VERSION" in os.environ:
-                del os.environ["INSTAGRAM_GRAPH_API_VERSION"]
+        # Instagram Conversations API requires Page Access Token
+        result = make_api_request("GET", endpoint, params=params, access_token=page_access_token)
         
-        return {
-            "data": result,
-            "error": "",
-            "successful": True
-        }
+        return _ok(result)
         
     except Exception as e:
-        return {
-            "data": {},
-            "error": f"Failed to get conversation: {str(e)}",
-            "successful": False
-        }
+        return _error(f"Failed to get conversation: {str(e)}")
 
 @mcp.tool(
     "GET_CONVERSATIONS",
@@ -1897,48 +1673,11 @@ def INSTAGRAM_GET_CONVERSATIONS(
         endpoint = f"{page_id_value}/conversations"
 
         # Instagram Conversations API requires Page Access Token
-        # Store original tokens to restore later
-        original_token = os.environ.get("INSTAGRAM_ACCESS_TOKEN")
-        original_oauth_token = os.environ.get("INSTAGRAM_OAUTH_ACCESS_TOKEN")
-        original_version = os.environ.get("INSTAGRAM_GRAPH_API_VERSION")
-        
-        try:
-            # CRITICAL: Set page access token to INSTAGRAM_ACCESS_TOKEN so get_access_token() uses it
-            os.environ["INSTAGRAM_ACCESS_TOKEN"] = page_access_token
-            os.environ["INSTAGRAM_OAUTH_ACCESS_TOKEN"] = page_access_token
-            
-            # Make the API request
-            result = make_api_request("GET", endpoint, params=params)
-            
-        finally:
-            # Restore original tokens
-            if original_token:
-                os.environ["INSTAGRAM_ACCESS_TOKEN"] = original_token
-            elif "INSTAGRAM_ACCESS_TOKEN" in os.environ:
-                del os.environ["INSTAGRAM_ACCESS_TOKEN"]
-            
-            if original_oauth_token:
-                os.environ["INSTAGRAM_OAUTH_ACCESS_TOKEN"] = original_oauth_token
-            elif "INSTAGRAM_OAUTH_ACCESS_TOKEN" in os.environ:
-                del os.environ["INSTAGRAM_OAUTH_ACCESS_TOKEN"]
-            
-            # Restore graph API version
-            if original_version:
-                os.environ["INSTAGRAM_GRAPH_API_VERSION"] = original_version
-            elif "INSTAGRAM_GRAPH_API_VERSION" in os.environ:
-                del os.environ["INSTAGRAM_GRAPH_API_VERSION"]
+        result = make_api_request("GET", endpoint, params=params, access_token=page_access_token)
 
-        return {
-            "data": result,
-            "error": "",
-            "successful": True
-        }
+        return _ok(result)
     except Exception as e:
-        return {
-            "data": {},
-            "error": f"Failed to get conversations: {str(e)}",
-            "successful": False
-        }
+        return _error(f"Failed to get conversations: {str(e)}")
 
 @mcp.tool(
     "LIST_ALL_CONVERSATIONS",
@@ -1977,55 +1716,9 @@ def INSTAGRAM_LIST_ALL_CONVERSATIONS(
         
         endpoint = f"{page_id}/conversations"
         
-        # Instagram Conversations API requires Page Access Token
-        # Store original tokens to restore later
-        original_token = os.environ.get("INSTAGRAM_ACCESS_TOKEN")
-        original_oauth_token = os.environ.get("INSTAGRAM_OAUTH_ACCESS_TOKEN")
-        original_version = os.environ.get("INSTAGRAM_GRAPH_API_VERSION")
-        
-        try:
-            # Use page access token (we already verified it exists above)
-            # Instagram Conversations API requires a Page Access Token, not a User Access Token
-            if page_access_token:
-                # We have a page access token - use it
-                # CRITICAL: Set it in INSTAGRAM_ACCESS_TOKEN so get_access_token() uses it
-                # get_access_token() checks INSTAGRAM_ACCESS_TOKEN first
-                os.environ["INSTAGRAM_ACCESS_TOKEN"] = page_access_token
-                # Also set in OAuth location as backup
-                os.environ["INSTAGRAM_OAUTH_ACCESS_TOKEN"] = page_access_token
-                print(f"Using Page Access Token for conversations API (Page ID: {page_id})")
-            else:
-                # This should never happen since we check above, but just in case
-                raise ValueError(
-                    "Page Access Token is required for conversations API. "
-                    "The auto-detection failed to find a page access token. "
-                    "To fix: 1) Ensure your Instagram account is connected to a Facebook Page, "
-                    "2) Make sure your access token has 'pages_messaging' permission, "
-                    "3) Or set INSTAGRAM_PAGE_ACCESS_TOKEN environment variable directly, "
-                    "4) Or run: uv run instagram-mcp/get_page_token.py"
-                )
-            
-            # Make the API request
-            # get_access_token() will now return the page_access_token we just set
-            result = make_api_request("GET", endpoint, params=params)
-            
-        finally:
-            # Restore original tokens
-            if original_token:
-                os.environ["INSTAGRAM_ACCESS_TOKEN"] = original_token
-            elif "INSTAGRAM_ACCESS_TOKEN" in os.environ and not page_info.get("page_access_token"):
-                del os.environ["INSTAGRAM_ACCESS_TOKEN"]
-            
-            if original_oauth_token:
-                os.environ["INSTAGRAM_OAUTH_ACCESS_TOKEN"] = original_oauth_token
-            elif "INSTAGRAM_OAUTH_ACCESS_TOKEN" in os.environ and not page_info.get("page_access_token"):
-                del os.environ["INSTAGRAM_OAUTH_ACCESS_TOKEN"]
-            
-            # Restore graph API version
-            if original_version:
-                os.environ["INSTAGRAM_GRAPH_API_VERSION"] = original_version
-            elif "INSTAGRAM_GRAPH_API_VERSION" in os.environ:
-                del os.environ["INSTAGRAM_GRAPH_API_VERSION"]
+        # Instagram Conversations API requires a Page Access Token, not a User Access Token
+        print(f"Using Page Access Token for conversations API (Page ID: {page_id})")
+        result = make_api_request("GET", endpoint, params=params, access_token=page_access_token)
         
         # Check if result has data
         conversations_data = result.get("data", [])
@@ -2039,28 +1732,19 @@ def INSTAGRAM_LIST_ALL_CONVERSATIONS(
                 "successful": True  # Still successful, just no data
             }
         
-        return {
-            "data": conversations_data,
-            "paging": result.get("paging", {}),
-            "error": "",
-            "successful": True
-        }
+        return _ok(conversations_data, paging=result.get("paging", {}))
         
     except Exception as e:
         error_msg = str(e)
+        lowered = error_msg.lower()
         
         # Provide more specific error messages
-        if "permission" in error_msg.lower() or "access" in error_msg.lower():
+        if "permission" in lowered or "access" in lowered:
             error_msg += " Ensure your access token has 'pages_messaging' permission and you're using a Page Access Token."
-        elif "page" in error_msg.lower():
+        elif "page" in lowered:
             error_msg += " Make sure your Instagram account is connected to a Facebook Page and you have a valid Page Access Token."
         
-        return {
-            "data": [],
-            "paging": {},
-            "error": f"Failed to list conversations: {error_msg}",
-            "successful": False
-        }
+        return _error(f"Failed to list conversations: {error_msg}", data=[], paging={})
 
 @mcp.tool(
     "LIST_ALL_MESSAGES",
@@ -2073,7 +1757,7 @@ def INSTAGRAM_LIST_ALL_MESSAGES(
 ):
     """List all messages from a specific Instagram DM conversation."""
     try:
-        _validate_required({"conversation_id": conversation_id}, ["conversation_id"])
+        _validate_required((conversation_id,), _REQ_CONVERSATION_ID)
         
         params = {
             "fields": "id,message,from,created_time,attachments"
@@ -2090,33 +1774,54 @@ def INSTAGRAM_LIST_ALL_MESSAGES(
         
         endpoint = f"{conversation_id}/messages"
         
-        if page_info.get("page_access_token"):
-            original_token = os.environ.get("INSTAGRAM_ACCESS_TOKEN")
-            os.environ["INSTAGRAM_ACCESS_TOKEN"] = page_info["page_access_token"]
-        else:
-            original_token = None
-        try:
-            result = make_api_request("GET", endpoint, params=params)
-        finally:
-            if original_token:
-                os.environ["INSTAGRAM_ACCESS_TOKEN"] = original_token
-            elif page_info.get("page_access_token") and "INSTAGRAM_ACCESS_TOKEN" in os.environ:
-                del os.environ["INSTAGRAM_ACCESS_TOKEN"]
+        # Falls back to the regular access token when no Page Access Token is available
+        result = make_api_request("GET", endpoint, params=params, access_token=page_info.get("page_access_token"))
         
-        return {
-            "data": result.get("data", []),
-            "paging": result.get("paging", {}),
-            "error": "",
-            "successful": True
-        }
+        return _ok(result.get("data", []), paging=result.get("paging", {}))
         
     except Exception as e:
-        return {
-            "data": [],
-            "paging": {},
-            "error": f"Failed to list messages: {str(e)}",
-            "successful": False
-        }
+        return _error(f"Failed to list messages: {str(e)}", data=[], paging={})
+
+# Guidance appended to messaging errors: (lowercase substrings to match, hint), first match wins
+_SEND_MESSAGE_ERROR_HINTS = (
+    (("(#3)", "does not have the capability"),
+     " The recipient must message you first, or your app needs App Review for Instagram Messaging."),
+    (("(#100)", "no matching user found"),
+     "\n\nPossible causes:\n"
+     "1. The recipient hasn't messaged you first (24-hour window expired or never initiated)\n"
+     "2. The recipient_id is incorrect\n"
+     "3. The recipient must be a Business or Creator account\n"
+     "4. Use INSTAGRAM_GET_USER_BY_USERNAME to find the correct recipient_id"),
+    (("permission", "#10", "#200"),
+     "\n\nSolution: Your access token needs 'pages_messaging' and 'instagram_manage_messages' permissions. "
+     "Ensure your OAuth2 scopes include these, or generate a new token with these permissions."),
+)
+
+_MARK_SEEN_ERROR_HINTS = (
+    (("500", "internal server error"),
+     " This may indicate that the sender_action feature is not supported for your Instagram account or the specific recipient. The mark_seen feature may have limited support on Instagram."),
+    (("permission", "#10"),
+     " To fix: Generate a new token with 'instagram_manage_messages' permission from Graph API Explorer."),
+    (("24", "messaging window"),
+     " The recipient must have an active 24-hour messaging window open. They need to message you first."),
+)
+
+def _error_hint(error_msg: str, hints) -> str:
+    """Return the hint for the first matching pattern group in hints, or ""."""
+    lowered = error_msg.lower()
+    for patterns, hint in hints:
+        if any(pattern in lowered for pattern in patterns):
+            return hint
+    return ""
+
+@lru_cache(maxsize=128)
+def _recipient_field(recipient_id: str) -> str:
+    """Encode the Send API 'recipient' form field; only the ID varies, so skip building a dict."""
+    return '{"id": ' + json.dumps(recipient_id) + '}'
+
+def _image_message_field(image_url: str) -> str:
+    """Encode the Send API 'message' form field for an image attachment."""
+    return '{"attachment": {"type": "image", "payload": {"url": ' + json.dumps(image_url) + '}}}'
 
 @mcp.tool(
     "SEND_TEXT_MESSAGE",
@@ -2129,7 +1834,7 @@ def INSTAGRAM_SEND_TEXT_MESSAGE(
 ):
     """Send a text message to an Instagram user via DM."""
     try:
-        _validate_required({"recipient_id": recipient_id, "text": text}, ["recipient_id", "text"])
+        _validate_required((recipient_id, text), _REQ_RECIPIENT_ID_TEXT)
         
         ig_user_id = _get_instagram_user_id(None)
         
@@ -2137,7 +1842,7 @@ def INSTAGRAM_SEND_TEXT_MESSAGE(
         page_info = _get_page_for_ig_account(ig_user_id)
         
         params = {
-            "recipient": json.dumps({"id": recipient_id}),
+            "recipient": _recipient_field(recipient_id),
             "message": json.dumps({"text": text})
         }
         
@@ -2146,60 +1851,23 @@ def INSTAGRAM_SEND_TEXT_MESSAGE(
         
         endpoint = f"{ig_user_id}/messages"
         
-        # Use page access token if available (required for messaging)
-        if page_info.get("page_access_token"):
-            # Temporarily use page access token for this request
-            original_token = os.getenv("INSTAGRAM_ACCESS_TOKEN") or os.getenv("INSTAGRAM_OAUTH_ACCESS_TOKEN")
-            original_oauth_token = os.getenv("INSTAGRAM_OAUTH_ACCESS_TOKEN")
-            
-            # Set page access token
-            if "INSTAGRAM_ACCESS_TOKEN" in os.environ:
-                os.environ["INSTAGRAM_ACCESS_TOKEN"] = page_info["page_access_token"]
-            else:
-                os.environ["INSTAGRAM_OAUTH_ACCESS_TOKEN"] = page_info["page_access_token"]
-            
-            try:
-                result = make_api_request("POST", endpoint, data=params)
-            finally:
-                # Restore original token
-                if original_token:
-                    if "INSTAGRAM_ACCESS_TOKEN" in os.environ:
-                        os.environ["INSTAGRAM_ACCESS_TOKEN"] = original_token
-                    if original_oauth_token:
-                        os.environ["INSTAGRAM_OAUTH_ACCESS_TOKEN"] = original_oauth_token
-                    elif "INSTAGRAM_OAUTH_ACCESS_TOKEN" in os.environ and not original_oauth_token:
-                        del os.environ["INSTAGRAM_OAUTH_ACCESS_TOKEN"]
-        else:
-            # No page access token available, try with regular token
-            result = make_api_request("POST", endpoint, data=params)
+        # Use page access token if available (required for messaging),
+        # otherwise fall back to the regular token
+        result = make_api_request("POST", endpoint, data=params, access_token=page_info.get("page_access_token"))
         
-        return {
-            "data": result,
-            "error": "",
-            "successful": True
-        }
+        return _ok(result)
         
     except Exception as e:
         error_msg = str(e)
         
         # Provide helpful guidance for common errors
-        if "(#3)" in error_msg or "does not have the capability" in error_msg.lower():
-            error_msg += " The recipient must message you first, or your app needs App Review for Instagram Messaging."
-        elif "(#100)" in error_msg or "no matching user found" in error_msg.lower():
-            error_msg += "\n\nPossible causes:\n"
-            error_msg += "1. The recipient hasn't messaged you first (24-hour window expired or never initiated)\n"
-            error_msg += "2. The recipient_id is incorrect\n"
-            error_msg += "3. The recipient must be a Business or Creator account\n"
-            error_msg += "4. Use INSTAGRAM_GET_USER_BY_USERNAME to find the correct recipient_id"
-        elif "permission" in error_msg.lower() or "#10" in error_msg or "#200" in error_msg:
-            error_msg += "\n\nSolution: Your access token needs 'pages_messaging' and 'instagram_manage_messages' permissions. "
-            error_msg += "Ensure your OAuth2 scopes include these, or generate a new token with these permissions."
+        error_msg += _error_hint(error_msg, _SEND_MESSAGE_ERROR_HINTS)
         
-        return {
-            "data": {},
-            "error": f"Failed to send text message: {error_msg}",
-            "successful": False
-        }
+        return _error(f"Failed to send text message: {error_msg}")
+
+# Business Discovery profile fields returned by GET_USER_BY_USERNAME ("id" is exposed as instagram_user_id)
+_USER_FIELDS = ("username", "name", "profile_picture_url", "biography", "followers_count", "follows_count", "media_count")
+_USER_FIELDS_PARAM = ",".join(("id",) + _USER_FIELDS)
 
 @mcp.tool(
     "GET_USER_BY_USERNAME",
@@ -2210,7 +1878,7 @@ def INSTAGRAM_GET_USER_BY_USERNAME(
 ):
     """Find an Instagram user's ID by their username using Business Discovery API."""
     try:
-        _validate_required({"username": username}, ["username"])
+        _validate_required((username,), _REQ_USERNAME)
         
         ig_user_id = _get_instagram_user_id(None)
         
@@ -2218,41 +1886,23 @@ def INSTAGRAM_GET_USER_BY_USERNAME(
         username = username.lstrip('@')
         
         params = {
-            "fields": f"business_discovery.username({username}){{id,username,name,profile_picture_url,biography,followers_count,follows_count,media_count}}"
+            "fields": f"business_discovery.username({username}){{{_USER_FIELDS_PARAM}}}"
         }
         
         result = make_api_request("GET", ig_user_id, params=params)
         
         # Extract the user info from business_discovery
-        if "business_discovery" in result:
-            user_info = result["business_discovery"]
-            return {
-                "data": {
-                    "instagram_user_id": user_info.get("id"),
-                    "username": user_info.get("username"),
-                    "name": user_info.get("name"),
-                    "profile_picture_url": user_info.get("profile_picture_url"),
-                    "biography": user_info.get("biography"),
-                    "followers_count": user_info.get("followers_count"),
-                    "follows_count": user_info.get("follows_count"),
-                    "media_count": user_info.get("media_count")
-                },
-                "error": "",
-                "successful": True
-            }
+        user_info = result.get("business_discovery")
+        if user_info is not None:
+            return _ok({
+                "instagram_user_id": user_info.get("id"),
+                **{field: user_info.get(field) for field in _USER_FIELDS}
+            })
         else:
-            return {
-                "data": {},
-                "error": "User not found or account is not a Business/Creator account",
-                "successful": False
-            }
+            return _error("User not found or account is not a Business/Creator account")
         
     except Exception as e:
-        return {
-            "data": {},
-            "error": f"Failed to get user by username: {str(e)}",
-            "successful": False
-        }
+        return _error(f"Failed to get user by username: {str(e)}")
 
 @mcp.tool(
     "SEND_IMAGE",
@@ -2264,31 +1914,80 @@ def INSTAGRAM_SEND_IMAGE(
 ):
     """Send an image via Instagram DM to a specific user."""
     try:
-        _validate_required({"recipient_id": recipient_id, "image_url": image_url}, ["recipient_id", "image_url"])
+        _validate_required((recipient_id, image_url), _REQ_RECIPIENT_ID_IMAGE_URL)
         
         ig_user_id = _get_instagram_user_id(None)
         
         params = {
-            "recipient": json.dumps({"id": recipient_id}),
-            "message": json.dumps({"attachment": {"type": "image", "payload": {"url": image_url}}})
+            "recipient": _recipient_field(recipient_id),
+            "message": _image_message_field(image_url)
         }
         
         endpoint = f"{ig_user_id}/messages"
         
         result = make_api_request("POST", endpoint, data=params)
         
-        return {
-            "data": result,
-            "error": "",
-            "successful": True
-        }
+        return _ok(result)
         
     except Exception as e:
+        return _error(f"Failed to send image: {str(e)}")
+
+# Graph API batch requests accept at most 50 sub-requests
+_BATCH_LIMIT = 50
+
+@mcp.tool(
+    "SEND_IMAGE_BATCH",
+    description="Send Image Batch. Send the same image via Instagram DM to several users using Graph API batch requests (up to 50 recipients per HTTP call). PARAMETERS: recipient_ids (required) - List of recipient IDs, each from LIST_ALL_CONVERSATIONS -> 'participants' -> 'id' or GET_USER_BY_USERNAME -> 'instagram_user_id'. image_url (required) - Public URL of the image to send. RETURNS: One entry per recipient with 'recipient_id', 'successful', and the message 'data' or 'error'. NOTE: Each recipient must have an open 24-hour messaging window.",
+)
+def INSTAGRAM_SEND_IMAGE_BATCH(
+    recipient_ids: Annotated[List[str], "Recipient Instagram user IDs (required)"],
+    image_url: Annotated[str, "Image URL to send (required)"],
+):
+    """Send an image via Instagram DM to several users with batched Graph API requests."""
+    try:
+        _validate_required((recipient_ids, image_url), _REQ_RECIPIENT_IDS_IMAGE_URL)
+        
+        ig_user_id = _get_instagram_user_id(None)
+        
+        relative_url = f"{ig_user_id}/messages"
+        message = _image_message_field(image_url)
+        
+        results = []
+        for start in range(0, len(recipient_ids), _BATCH_LIMIT):
+            chunk = recipient_ids[start:start + _BATCH_LIMIT]
+            batch = [
+                {
+                    "method": "POST",
+                    "relative_url": relative_url,
+                    "body": urlencode({"recipient": _recipient_field(rid), "message": message}),
+                }
+                for rid in chunk
+            ]
+            responses = make_api_request("POST", "", data={"batch": json.dumps(batch)})
+            
+            for rid, response in zip(chunk, responses):
+                if response is None:
+                    results.append({"recipient_id": rid, "data": {}, "error": "No response for batch item", "successful": False})
+                    continue
+                try:
+                    body = json.loads(response.get("body") or "{}")
+                except ValueError:
+                    body = {}
+                if response.get("code") == 200:
+                    results.append({"recipient_id": rid, "data": body, "error": "", "successful": True})
+                else:
+                    error = body.get("error", {}).get("message") or f"HTTP {response.get('code')}"
+                    results.append({"recipient_id": rid, "data": {}, "error": error, "successful": False})
+        
+        failed = sum(1 for r in results if not r["successful"])
         return {
-            "data": {},
-            "error": f"Failed to send image: {str(e)}",
-            "successful": False
+            "data": results,
+            "error": f"{failed} of {len(results)} messages failed" if failed else "",
+            "successful": not failed
         }
+        
+    except Exception as e:
+        return _error(f"Failed to send image batch: {str(e)}", data=[])
 
 @mcp.tool(
     "MARK_SEEN",
@@ -2299,12 +1998,12 @@ def INSTAGRAM_MARK_SEEN(
 ):
     """Mark Instagram DM messages as read/seen for a specific user."""
     try:
-        _validate_required({"recipient_id": recipient_id}, ["recipient_id"])
+        _validate_required((recipient_id,), _REQ_RECIPIENT_ID)
         
         ig_user_id = _get_instagram_user_id(None)
         
         params = {
-            "recipient": json.dumps({"id": recipient_id}),
+            "recipient": _recipient_field(recipient_id),
             "sender_action": "mark_seen"
         }
         
@@ -2312,52 +2011,55 @@ def INSTAGRAM_MARK_SEEN(
         
         result = make_api_request("POST", endpoint, data=params)
         
-        return {
-            "data": result,
-            "error": "",
-            "successful": True
-        }
+        return _ok(result)
         
     except Exception as e:
         error_msg = str(e)
         
         # Provide helpful guidance for common errors
-        if "500" in error_msg or "internal server error" in error_msg.lower():
-            error_msg += " This may indicate that the sender_action feature is not supported for your Instagram account or the specific recipient. The mark_seen feature may have limited support on Instagram."
-        elif "permission" in error_msg.lower() or "#10" in error_msg:
-            error_msg += " To fix: Generate a new token with 'instagram_manage_messages' permission from Graph API Explorer."
-        elif "24" in error_msg.lower() or "messaging window" in error_msg.lower():
-            error_msg += " The recipient must have an active 24-hour messaging window open. They need to message you first."
+        error_msg += _error_hint(error_msg, _MARK_SEEN_ERROR_HINTS)
         
-        return {
-            "data": {},
-            "error": f"Failed to mark messages as seen: {error_msg}",
-            "successful": False
-        }
+        return _error(f"Failed to mark messages as seen: {error_msg}")
 
 # -------------------- MAIN --------------------
 
 def parse_env_args():
-    """Parse command line arguments for environment variables."""
-    parser = argparse.ArgumentParser(description='Instagram MCP Server')
-    parser.add_argument('--env', action='append', help='Environment variables in KEY=VALUE format')
-
-    args = parser.parse_args()
-
-    # Set environment variables from command line
-    if args.env:
-        for env_var in args.env:
-            if '=' in env_var:
-                key, value = env_var.split('=', 1)
-                os.environ[key] = value
-                print(f"Set environment variable: {key}")
-            else:
-                print(f"Warning: Invalid environment variable format: {env_var}")
+    """Parse --env KEY=VALUE (or --env=KEY=VALUE) command line arguments into the environment.
 
-if __name__ == "__main__":
+    The grammar is trivial, so sys.argv is scanned directly instead of importing argparse.
+    """
+    argv = sys.argv[1:]
+    env_vars = []
+    i = 0
+    while i < len(argv):
+        arg = argv[i]
+        if arg == "--env" and i + 1 < len(argv):
+            env_vars.append(argv[i + 1])
+            i += 2
+            continue
+        if arg.startswith("--env="):
+            env_vars.append(arg[len("--env="):])
+        i += 1
+
+    if not env_vars:
+        return
+
+    set_keys = []
+    for env_var in env_vars:
+        key, sep, value = env_var.partition('=')
+        if sep and key:
+            _env_set(key, value)
+            set_keys.append(key)
+        else:
+            print(f"Warning: Invalid environment variable format: {env_var}")
+    if set_keys:
+        print(f"Set environment variables: {', '.join(set_keys)}")
+
+def main():
+    """Main entry point."""
     # Parse command line environment variables before running MCP
     parse_env_args()
     mcp.run()
 
-def main():
-    mcp.run()
+if __name__ == "__main__":
+    main()
@@ -11,12 +11,10 @@ This script handles the complete OAuth flow automatically:
 
 import os
 import sys
-import time
-import webbrowser
 import threading
+import html
 from urllib.parse import urlparse, parse_qs
 import http.server
-import socketserver
 from dotenv import load_dotenv
 
 # Add the current directory to path to import from instagram_mcp_server
@@ -39,27 +37,11 @@ from instagram_mcp_server import (
 PORT = 8080
 captured_code = None
 captured_state = None
-server_ready = threading.Event()
+code_received = threading.Event()
+httpd = None
 
-class OAuthCallbackHandler(http.server.SimpleHTTPRequestHandler):
-    def do_GET(self):
-        global captured_code, captured_state
-        
-        # Parse the URL
-        parsed_url = urlparse(self.path)
-        query_params = parse_qs(parsed_url.query)
-        
-        # Check for error
-        if 'error' in query_params:
-            error = query_params['error'][0]
-            error_reason = query_params.get('error_reason', [''])[0]
-            error_description = query_params.get('error_description', [''])[0]
-            
-            self.send_response(200)
-            self.send_header('Content-type', 'text/html')
-            self.end_headers()
-            
-            html = f"""
+# Callback pages; only the error page has dynamic fields, the others are encoded once
+_ERROR_HTML = """
             <!DOCTYPE html>
             <html>
             <head>
@@ -80,19 +62,8 @@ class OAuthCallbackHandler(http.server.SimpleHTTPRequestHandler):
             </body>
             </html>
             """
-            self.wfile.write(html.encode())
-            return
-        
-        # Check for authorization code
-        if 'code' in query_params:
-            captured_code = query_params['code'][0]
-            captured_state = query_params.get('state', [None])[0]
-            
-            self.send_response(200)
-            self.send_header('Content-type', 'text/html')
-            self.end_headers()
-            
-            html = """
+
+_SUCCESS_HTML = """
             <!DOCTYPE html>
             <html>
             <head>
@@ -110,24 +81,9 @@ class OAuthCallbackHandler(http.server.SimpleHTTPRequestHandler):
                 </div>
             </body>
             </html>
-            """
-            self.wfile.write(html.encode())
-            
-            print(f"\n{'='*60}")
-            print("✅ Authorization code captured!")
-            print(f"{'='*60}")
-            print(f"Code: {captured_code}")
-            if captured_state:
-                print(f"State: {captured_state}")
-            print(f"{'='*60}\n")
-            
-        else:
-            # No code in URL
-            self.send_response(200)
-            self.send_header('Content-type', 'text/html')
-            self.end_headers()
-            
-            html = """
+            """.encode()
+
+_WAITING_HTML = """
             <!DOCTYPE html>
             <html>
             <head>
@@ -141,31 +97,94 @@ class OAuthCallbackHandler(http.server.SimpleHTTPRequestHandler):
                 <p>Waiting for authorization code...</p>
             </body>
             </html>
-            """
-            self.wfile.write(html.encode())
+            """.encode()
+
+class OAuthCallbackHandler(http.server.BaseHTTPRequestHandler):
+    def _send_html(self, body: bytes):
+        """Send a complete HTML response."""
+        self.send_response(200)
+        self.send_header('Content-type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+    
+    def do_GET(self):
+        global captured_code, captured_state
+        
+        # Parse the URL
+        parsed_url = urlparse(self.path)
+        query_params = parse_qs(parsed_url.query)
+        
+        # Check for error (values are echoed back, so escape them)
+        if 'error' in query_params:
+            page = _ERROR_HTML.format_map({
+                "error": html.escape(query_params['error'][0]),
+                "error_reason": html.escape(query_params.get('error_reason', [''])[0]),
+                "error_description": html.escape(query_params.get('error_description', [''])[0]),
+            })
+            self._send_html(page.encode())
+            return
+        
+        # Check for authorization code
+        if 'code' in query_params:
+            captured_code = query_params['code'][0]
+            captured_state = query_params.get('state', [None])[0]
+            
+            # shutdown() blocks until serve_forever() returns, so it must not run on this thread
+            threading.Thread(target=self.server.shutdown).start()
+            code_received.set()
+            
+            self._send_html(_SUCCESS_HTML)
+            
+            print(f"\n{'='*60}")
+            print("✅ Authorization code captured!")
+            print(f"{'='*60}")
+            print(f"Code: {captured_code}")
+            if captured_state:
+                print(f"State: {captured_state}")
+            print(f"{'='*60}\n")
+            
+        else:
+            # No code in URL
+            self._send_html(_WAITING_HTML)
     
     def log_message(self, format, *args):
         # Suppress default logging
         pass
 
+class ReusableServer(http.server.ThreadingHTTPServer):
+    """Threaded callback server that can rebind the port while an old socket is in TIME_WAIT."""
+    # HTTPServer already sets this; kept explicit because quick re-runs depend on it
+    allow_reuse_address = True
+
 def run_callback_server():
-    """Start the OAuth callback server in a separate thread."""
-    global captured_code
-    
-    def server_thread():
-        with socketserver.TCPServer(("", PORT), OAuthCallbackHandler) as httpd:
-            server_ready.set()
-            httpd.timeout = 0.5
-            while captured_code is None:
-                httpd.handle_request()
-    
-    thread = threading.Thread(target=server_thread, daemon=True)
-    thread.start()
-    server_ready.wait()
+    """Start the OAuth callback server; it stops serving once a code is captured."""
+    global httpd
+    httpd = ReusableServer(("", PORT), OAuthCallbackHandler)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
     print(f"✅ Callback server started on http://localhost:{PORT}/callback")
 
+def stop_callback_server():
+    """Stop the callback server if it is running and release its socket."""
+    global httpd
+    if httpd is None:
+        return
+    httpd.shutdown()
+    httpd.server_close()
+    httpd = None
+
 def main():
     """Main OAuth setup flow."""
+    # Only needed when run as a script, so not imported at module level
+    import argparse
+    import webbrowser
+    
+    parser = argparse.ArgumentParser(description='Instagram OAuth2 automated setup')
+    parser.add_argument('--force', action='store_true',
+                        help='Re-authenticate without prompting even if tokens already exist')
+    args = parser.parse_args()
+    force = args.force or os.getenv("INSTAGRAM_FORCE_REAUTH") == "1"
+    
     print(f"\n{'='*60}")
     print("Instagram OAuth2 Automated Setup")
     print(f"{'='*60}\n")
@@ -182,8 +201,11 @@ def main():
     
     # Check if tokens already exist
     token_file = _get_token_storage_path()
-    if os.path.exists(token_file):
+    if os.path.exists(token_file) and not force:
         print("⚠️  Warning: Tokens already exist in storage.")
+        if not sys.stdin.isatty():
+            print("Keeping existing tokens. Re-run with --force (or INSTAGRAM_FORCE_REAUTH=1) to re-authenticate.")
+            sys.exit(0)
         response = input("Do you want to re-authenticate? (y/N): ").strip().lower()
         if response != 'y':
             print("Keeping existing tokens. Exiting.")
@@ -198,7 +220,6 @@ def main():
         # Step 2: Start callback server
         print("Step 2: Starting callback server...")
         run_callback_server()
-        time.sleep(1)  # Give server a moment to start
         print()
         
         # Step 3: Open browser
@@ -211,12 +232,9 @@ def main():
         
         # Step 4: Wait for authorization code
         timeout = 300  # 5 minutes
-        start_time = time.time()
-        while captured_code is None:
-            if time.time() - start_time > timeout:
-                print("\n❌ Timeout: No authorization code received within 5 minutes.")
-                sys.exit(1)
-            time.sleep(0.5)
+        if not code_received.wait(timeout=timeout):
+            print("\n❌ Timeout: No authorization code received within 5 minutes.")
+            sys.exit(1)
         
         # Step 5: Exchange code for tokens
         print("\nStep 4: Exchanging authorization code for tokens...")
@@ -249,6 +267,8 @@ def main():
     except Exception as e:
         print(f"\n❌ Error during setup: {e}")
         sys.exit(1)
+    finally:
+        stop_callback_server()
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Generate src/_manifest.py from tools_manifest.json.
+
+The generated module imports every tool function directly and exposes a static
+TOOLS tuple, so the modular server does not parse JSON or resolve targets with
+importlib at startup. Re-run this script whenever tools_manifest.json changes:
+
+    uv run instagram-mcp/scripts/build_manifest.py
+"""
+
+import json
+import pprint
+import sys
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+MANIFEST_PATH = ROOT_DIR / "tools_manifest.json"
+OUTPUT_PATH = ROOT_DIR / "src" / "_manifest.py"
+
+HEADER = '''"""
+Static tool table generated from tools_manifest.json.
+
+Do not edit by hand - regenerate with: uv run instagram-mcp/scripts/build_manifest.py
+"""
+
+'''
+
+
+def build(manifest: dict) -> str:
+    """Return the source of the generated module for the given manifest."""
+    imports = {}
+    entries = []
+    for entry in manifest.get("tools", []):
+        tool_id = entry.get("id")
+        target = entry.get("target")
+        if not tool_id or not target:
+            continue
+        module_name, func_name = target.split(":")
+        alias = f"_{module_name.rsplit('.', 1)[-1]}_{func_name}"
+        imports.setdefault(module_name, []).append((func_name, alias))
+        schema = pprint.pformat(entry.get("input_schema"), indent=4, width=100, sort_dicts=False)
+        schema = schema.replace("\n", "\n        ")
+        entries.append(
+            f"    (\n"
+            f"        {tool_id!r},\n"
+            f"        {alias},\n"
+            f"        {entry.get('description')!r},\n"
+            f"        {schema},\n"
+            f"    ),\n"
+        )
+
+    lines = [HEADER]
+    for module_name, names in imports.items():
+        lines.append(f"from {module_name} import (\n")
+        for func_name, alias in names:
+            lines.append(f"    {func_name} as {alias},\n")
+        lines.append(")\n")
+    lines.append("\n# (tool_id, function, description, input_schema)\n")
+    lines.append("TOOLS = (\n")
+    lines.extend(entries)
+    lines.append(")\n")
+    return "".join(lines)
+
+
+def main():
+    """Read tools_manifest.json and write src/_manifest.py."""
+    try:
+        with open(MANIFEST_PATH, "r") as f:
+            manifest = json.load(f)
+    except (OSError, json.JSONDecodeError) as e:
+        print(f"Error: Failed to load manifest {MANIFEST_PATH}: {e}")
+        sys.exit(1)
+
+    OUTPUT_PATH.write_text(build(manifest))
+    print(f"Wrote {OUTPUT_PATH} ({len(manifest.get('tools', []))} tools)")
+
+
+if __name__ == "__main__":
+    main()
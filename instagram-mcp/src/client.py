@@ -5,15 +5,54 @@ Singleton client that handles all Instagram Graph API operations.
 """
 
 import os
+import sys
 import json
+import asyncio
+import functools
 import time
 import logging
 import requests
-from typing import Optional, Dict, Any
+from requests.adapters import HTTPAdapter
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, Any, List
 from pathlib import Path
 
+from src import json_compat
+from src.cache import TTLCache
+
 logger = logging.getLogger("instagram.client")
 
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+def _api_worker_count() -> int:
+    """Worker threads for async API calls.
+
+    With the GIL, threads only overlap network waits, so the asyncio default is enough.
+    Free-threaded builds (python3.13t+) also decode responses in parallel, so allow more.
+    """
+    cpus = os.cpu_count() or 1
+    gil_enabled = getattr(sys, "_is_gil_enabled", lambda: True)()
+    if gil_enabled:
+        return min(32, cpus + 4)
+    return min(64, cpus * 4)
+
+
+API_WORKERS = _api_worker_count()
+
+# Keep one keep-alive connection per API worker, so concurrent tool calls reuse
+# TLS sessions instead of handshaking for connections the pool would discard
+HTTP_POOL_MAXSIZE = API_WORKERS
+
+# Graph API batch requests accept at most 50 sub-requests
+BATCH_LIMIT = 50
+
+# How long an auto-detected Instagram user ID is reused before being resolved again
+USER_ID_CACHE_TTL = 300
+
+# How long a resolved Facebook Page ID / Page Access Token pair is reused
+PAGE_INFO_CACHE_TTL = 600
+
 
 class InstagramClient:
     """Client for Instagram Graph API operations."""
@@ -29,23 +68,46 @@ class InstagramClient:
         self.settings = settings
         self.token_provider = token_provider
         self._token_cache: Dict[str, Any] = {}
+        self._session = self._create_session()
+        self._executor = ThreadPoolExecutor(max_workers=API_WORKERS, thread_name_prefix="instagram-api")
+        self._user_id_cache = TTLCache(maxsize=1, ttl=USER_ID_CACHE_TTL)
+        self._page_info_cache = TTLCache(maxsize=32, ttl=PAGE_INFO_CACHE_TTL)
+        self._inflight: Dict[tuple, "asyncio.Future"] = {}
         
         logger.info("InstagramClient initialized")
     
+    @staticmethod
+    def _create_session() -> requests.Session:
+        """Create a persistent HTTP session so Graph API calls reuse keep-alive connections."""
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=HTTP_POOL_MAXSIZE)
+        session.mount("https://", adapter)
+        return session
+    
     def _get_token_storage_path(self) -> Path:
         """Get the path to the token storage file."""
         return Path(__file__).parent.parent / '.instagram_tokens.json'
     
     def _load_tokens(self) -> Dict[str, Any]:
-        """Load tokens from persistent storage."""
+        """Load tokens from persistent storage; the parsed file is reused until it changes on disk."""
         token_file = self._get_token_storage_path()
-        if token_file.exists():
-            try:
-                with open(token_file, 'r') as f:
-                    return json.load(f)
-            except Exception as e:
-                logger.warning(f"Failed to load tokens: {e}")
-        return {}
+        try:
+            mtime = token_file.stat().st_mtime_ns
+        except OSError:
+            return {}
+        
+        cached = self._token_cache.get("stored")
+        if cached is not None and cached[0] == mtime:
+            return dict(cached[1])
+        
+        try:
+            with open(token_file, 'r') as f:
+                tokens = json.load(f)
+        except Exception as e:
+            logger.warning(f"Failed to load tokens: {e}")
+            return {}
+        self._token_cache["stored"] = (mtime, tokens)
+        return dict(tokens)
     
     def _save_tokens(self, tokens: Dict[str, Any]) -> None:
         """Save tokens to persistent storage."""
@@ -56,6 +118,7 @@ class InstagramClient:
         
         with open(token_file, 'w') as f:
             json.dump(existing, f, indent=2)
+        self._token_cache.pop("stored", None)
         
         logger.info("Tokens saved to storage")
     
@@ -89,9 +152,9 @@ class InstagramClient:
         }
         
         try:
-            response = requests.get(token_url, params=params, timeout=30)
+            response = self._session.get(token_url, params=params, timeout=30)
             response.raise_for_status()
-            token_data = response.json()
+            token_data = json_compat.loads(response.content)
             
             if "access_token" in token_data:
                 tokens_to_save = {
@@ -157,10 +220,12 @@ class InstagramClient:
         method: str,
         endpoint: str,
         params: Dict[str, Any] = None,
-        data: Dict[str, Any] = None
+        data: Dict[str, Any] = None,
+        access_token: Optional[str] = None
     ) -> Dict[str, Any]:
-        """Make a request to Instagram Graph API."""
-        access_token = self.get_access_token()
+        """Make a request to Instagram Graph API; access_token overrides the account token (e.g. a Page token)."""
+        if not access_token:
+            access_token = self.get_access_token()
         url = f"{self.get_base_url()}/{endpoint.lstrip('/')}"
         
         if params is None:
@@ -169,32 +234,119 @@ class InstagramClient:
         
         try:
             if method.upper() == "GET":
-                response = requests.get(url, params=params, timeout=30)
+                response = self._session.get(url, params=params, timeout=30)
             elif method.upper() == "POST":
-                response = requests.post(url, params=params, json=data, timeout=30)
+                # Encode the body ourselves so json_compat (orjson when installed) is used
+                body = None if data is None else json_compat.dumps(data)
+                response = self._session.post(url, params=params, data=body, headers=_JSON_HEADERS, timeout=30)
             elif method.upper() == "DELETE":
-                response = requests.delete(url, params=params, timeout=30)
+                response = self._session.delete(url, params=params, timeout=30)
             else:
                 raise ValueError(f"Unsupported HTTP method: {method}")
             
             response.raise_for_status()
-            return response.json()
+            return json_compat.loads(response.content)
             
         except requests.exceptions.RequestException as e:
             error_msg = str(e)
             if hasattr(e, 'response') and e.response is not None:
                 try:
-                    error_data = e.response.json()
+                    error_data = json_compat.loads(e.response.content)
                     error_msg = error_data.get("error", {}).get("message", error_msg)
                 except:
                     pass
             raise Exception(f"API request failed: {error_msg}")
     
+    async def _run_in_executor(self, func, *args):
+        """Run a blocking client call on the API worker pool."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(func, *args))
+    
+    async def async_make_api_request(
+        self,
+        method: str,
+        endpoint: str,
+        params: Dict[str, Any] = None,
+        data: Dict[str, Any] = None,
+        access_token: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Async make_api_request; the blocking call runs on the API worker pool so tool calls overlap.
+        
+        Concurrent identical GETs share one in-flight request (callers get the same response
+        object, so they must not mutate it).
+        """
+        key = None
+        if method.upper() == "GET":
+            try:
+                key = (endpoint, tuple(sorted((params or {}).items())), access_token)
+                pending = self._inflight.get(key)
+            except TypeError:  # unhashable param value; don't coalesce
+                key = pending = None
+            if pending is not None:
+                return await asyncio.shield(pending)
+        
+        call = self._run_in_executor(self.make_api_request, method, endpoint, params, data, access_token)
+        if key is None:
+            return await call
+        
+        task = asyncio.ensure_future(call)
+        self._inflight[key] = task
+        try:
+            # Shielded so a cancelled first caller doesn't cancel the request for the others
+            return await asyncio.shield(task)
+        finally:
+            if self._inflight.get(key) is task:
+                del self._inflight[key]
+    
+    def make_batch_request(self, requests: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Execute several Graph API calls through the batch endpoint.
+        
+        Args:
+            requests: Sub-requests such as {"method": "GET", "relative_url": "me?fields=id"}
+        
+        Returns:
+            One {"code": int, "body": dict} entry per sub-request, in order. Sub-requests
+            the API did not answer get code None.
+        """
+        results = []
+        for start in range(0, len(requests), BATCH_LIMIT):
+            chunk = requests[start:start + BATCH_LIMIT]
+            responses = self.make_api_request(
+                "POST", "",
+                data={"batch": json_compat.dumps(chunk), "include_headers": False}
+            )
+            for response in responses:
+                if response is None:
+                    results.append({"code": None, "body": {}})
+                    continue
+                try:
+                    body = json_compat.loads(response.get("body") or "{}")
+                except ValueError:
+                    body = {}
+                results.append({"code": response.get("code"), "body": body})
+        return results
+    
+    async def async_make_batch_request(self, requests: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Async make_batch_request; the blocking call runs on the API worker pool."""
+        return await self._run_in_executor(self.make_batch_request, requests)
+    
     def get_instagram_user_id(self, provided_id: Optional[str] = None) -> str:
         """Auto-detect Instagram user ID."""
         if provided_id:
             return provided_id
         
+        cached_id = self._user_id_cache.get("__self__")
+        if cached_id:
+            return cached_id
+        
+        user_id = self._resolve_instagram_user_id()
+        self._user_id_cache.set("__self__", user_id)
+        return user_id
+    
+    def _resolve_instagram_user_id(self) -> str:
+        """Look up the account's Instagram user ID from env, storage, or the API."""
         env_id = os.getenv("INSTAGRAM_USER_ID")
         if env_id:
             return env_id
@@ -222,8 +374,36 @@ class InstagramClient:
             "Set INSTAGRAM_USER_ID environment variable."
         )
     
+    async def async_get_instagram_user_id(self, provided_id: Optional[str] = None) -> str:
+        """Async get_instagram_user_id; auto-detection may hit the API, so it runs on the API worker pool."""
+        if provided_id:
+            return provided_id
+        cached_id = self._user_id_cache.get("__self__")
+        if cached_id:
+            return cached_id
+        
+        # Tools called together (e.g. a carousel flow) share one lookup instead of each resolving the ID
+        key = ("__user_id__",)
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._run_in_executor(self.get_instagram_user_id, provided_id))
+            self._inflight[key] = task
+            task.add_done_callback(lambda t: self._inflight.pop(key, None) if self._inflight.get(key) is t else None)
+        return await asyncio.shield(task)
+    
     def get_page_for_ig_account(self, ig_user_id: str) -> Dict[str, Optional[str]]:
         """Get Facebook Page ID and Page Access Token for Instagram account."""
+        cached = self._page_info_cache.get(ig_user_id)
+        if cached:
+            return dict(cached)
+        
+        result = self._resolve_page_for_ig_account(ig_user_id)
+        if result["page_id"] and result["page_access_token"]:
+            self._page_info_cache.set(ig_user_id, dict(result))
+        return result
+    
+    def _resolve_page_for_ig_account(self, ig_user_id: str) -> Dict[str, Optional[str]]:
+        """Look up the Page ID and Page Access Token from storage, env, or the API."""
         stored = self._load_tokens()
         
         result = {
@@ -255,6 +435,13 @@ class InstagramClient:
         
         return result
     
+    async def async_get_page_for_ig_account(self, ig_user_id: str) -> Dict[str, Optional[str]]:
+        """Async get_page_for_ig_account; storage reads and auto-detection run on the API worker pool."""
+        cached = self._page_info_cache.get(ig_user_id)
+        if cached:
+            return dict(cached)
+        return await self._run_in_executor(self.get_page_for_ig_account, ig_user_id)
+    
     def load_tokens(self) -> Dict[str, Any]:
         """Public method to load tokens (for messaging tools)."""
         return self._load_tokens()
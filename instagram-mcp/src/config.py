@@ -5,11 +5,12 @@ Settings loaded from environment variables.
 """
 
 import os
+import functools
 from dataclasses import dataclass
 from typing import Optional
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Settings:
     """Configuration settings for Instagram MCP."""
     
@@ -30,18 +31,24 @@ class Settings:
     
     @classmethod
     def from_env(cls) -> "Settings":
-        """Create settings from environment variables."""
-        return cls(
-            graph_api_version=os.getenv("INSTAGRAM_GRAPH_API_VERSION", "v21.0"),
-            oauth2_client_id=os.getenv("OAUTH2_CLIENT_ID"),
-            oauth2_client_secret=os.getenv("OAUTH2_CLIENT_SECRET"),
-            oauth2_redirect_uri=os.getenv("OAUTH2_REDIRECT_URI", "http://localhost:8080/callback"),
-            oauth2_scopes=os.getenv("OAUTH2_SCOPES", "instagram_basic,instagram_content_publish,instagram_manage_comments,instagram_manage_insights,pages_show_list,pages_read_engagement,pages_messaging,instagram_manage_messages"),
-            backend_api_url=os.getenv("BACKEND_API_URL"),
-            backend_api_key=os.getenv("BACKEND_API_KEY"),
-            mcp_identifier=os.getenv("MCP_IDENTIFIER", "instagram-mcp"),
-            agent_id=os.getenv("AGENT_ID"),
-        )
+        """Create settings from environment variables (read once, then cached)."""
+        return _load_settings()
+
+
+@functools.lru_cache(maxsize=1)
+def _load_settings() -> Settings:
+    """Read settings from the environment; Settings is immutable, so one instance is shared."""
+    return Settings(
+        graph_api_version=os.getenv("INSTAGRAM_GRAPH_API_VERSION", "v21.0"),
+        oauth2_client_id=os.getenv("OAUTH2_CLIENT_ID"),
+        oauth2_client_secret=os.getenv("OAUTH2_CLIENT_SECRET"),
+        oauth2_redirect_uri=os.getenv("OAUTH2_REDIRECT_URI", "http://localhost:8080/callback"),
+        oauth2_scopes=os.getenv("OAUTH2_SCOPES", "instagram_basic,instagram_content_publish,instagram_manage_comments,instagram_manage_insights,pages_show_list,pages_read_engagement,pages_messaging,instagram_manage_messages"),
+        backend_api_url=os.getenv("BACKEND_API_URL"),
+        backend_api_key=os.getenv("BACKEND_API_KEY"),
+        mcp_identifier=os.getenv("MCP_IDENTIFIER", "instagram-mcp"),
+        agent_id=os.getenv("AGENT_ID"),
+    )
 
 
 # Singleton settings instance
@@ -0,0 +1,30 @@
+"""
+JSON Compatibility Layer
+
+Uses orjson when it is installed and falls back to the standard library otherwise.
+"""
+
+import json
+
+try:
+    import orjson
+except ImportError:  # orjson is an optional speed-up
+    orjson = None
+
+
+if orjson is not None:
+    def loads(data):
+        """Parse JSON from str or bytes."""
+        return orjson.loads(data)
+
+    def dumps(obj) -> str:
+        """Serialize obj to a compact JSON string."""
+        return orjson.dumps(obj).decode()
+else:
+    def loads(data):
+        """Parse JSON from str or bytes."""
+        return json.loads(data)
+
+    def dumps(obj) -> str:
+        """Serialize obj to a compact JSON string."""
+        return json.dumps(obj, separators=(",", ":"))
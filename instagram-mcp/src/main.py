@@ -6,11 +6,12 @@ A modular MCP server using dynamic tool registration from manifest.
 Run with: uv run instagram-mcp/src/main.py
 """
 
+import functools
 import importlib
 import inspect
-import json
 import logging
 import sys
+import threading
 from pathlib import Path
 from typing import Any, Dict, Optional
 
@@ -32,27 +33,33 @@ from fastmcp.tools.tool import FunctionTool
 
 from src.config import settings
 from src.client import InstagramClient
+from src import json_compat
+from src.results import ToolResult
 
-# Configure Logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s %(levelname)s [%(name)s] %(message)s"
-)
 logger = logging.getLogger("instagram.server")
 
 # Root path for manifest loading
 ROOT_DIR = _SCRIPT_DIR
 
 # Server State
-state: Dict[str, Any] = {}
+_client: Optional[InstagramClient] = None
+_client_lock = threading.Lock()
 
 # Initialize MCP Server
 mcp = FastMCP("instagram-mcp")
 
 
 def get_client() -> InstagramClient:
-    """Get or create the singleton InstagramClient."""
-    if "client" not in state:
+    """Get or create the singleton InstagramClient (thread-safe)."""
+    global _client
+    client = _client
+    if client is not None:
+        return client
+    
+    with _client_lock:
+        if _client is not None:
+            return _client
+        
         logger.info("Initializing InstagramClient...")
         token_provider = None
         
@@ -65,27 +72,60 @@ def get_client() -> InstagramClient:
                 logger.error(f"Failed to initialize backend: {e}")
         
         try:
-            state["client"] = InstagramClient(settings, token_provider=token_provider)
+            _client = InstagramClient(settings, token_provider=token_provider)
         except Exception as e:
             logger.error(f"Failed to initialize client: {e}")
             raise
     
-    return state["client"]
+    return _client
+
+
+def _has_null(schema) -> bool:
+    """Return True if remove_null_from_schema() would change anything in schema."""
+    stack = [schema]
+    pop, push = stack.pop, stack.append
+    while stack:
+        node = pop()
+        if isinstance(node, dict):
+            for key, value in node.items():
+                if key == "type" and (value == "null" or (isinstance(value, list) and "null" in value)):
+                    return True
+                if key == "default" and value is None:
+                    return True
+                if key == "anyOf" and isinstance(value, list) and len(value) < 2:
+                    return True  # single-branch anyOf is flattened
+                if isinstance(value, (dict, list)):
+                    push(value)
+        elif isinstance(node, list):
+            for item in node:
+                if isinstance(item, (dict, list)):
+                    push(item)
+    return False
 
 
 def remove_null_from_schema(schema):
-    """Remove null types from schema to prevent MCP Inspector trim() errors."""
-    if isinstance(schema, dict):
+    """Remove null types from schema to prevent MCP Inspector trim() errors.
+
+    Schemas without any null types are returned as-is, without copying.
+    """
+    if not _has_null(schema):
+        return schema
+    return _strip_null(schema)
+
+
+def _strip_null(schema):
+    _isinstance, _dict, _list = isinstance, dict, list
+    if _isinstance(schema, _dict):
         new_schema = {}
         for key, value in schema.items():
-            if key == "anyOf" and isinstance(value, list):
-                filtered = [v for v in value if not (isinstance(v, dict) and v.get("type") == "null")]
+            if key == "anyOf" and _isinstance(value, _list):
+                filtered = [v for v in value if not (_isinstance(v, _dict) and v.get("type") == "null")]
                 if filtered:
                     if len(filtered) == 1:
                         new_schema.update(filtered[0])
                     else:
                         new_schema[key] = filtered
-            elif key == "type" and isinstance(value, list) and "null" in value:
+            elif key == "type" and _isinstance(value, _list) and "null" in value:
                 filtered = [v for v in value if v != "null"]
                 if len(filtered) == 1:
                     new_schema["type"] = filtered[0]
@@ -96,117 +136,102 @@ def remove_null_from_schema(schema):
             elif key == "default" and value is None:
                 continue
             else:
-                new_schema[key] = remove_null_from_schema(value) if isinstance(value, (dict, list)) else value
+                new_schema[key] = _strip_null(value) if _isinstance(value, (_dict, _list)) else value
         return new_schema
-    elif isinstance(schema, list):
-        return [remove_null_from_schema(item) for item in schema]
+    elif _isinstance(schema, _list):
+        return [_strip_null(item) for item in schema]
     else:
         return schema
 
 
+# Client methods injected into tool functions by parameter name
+CLIENT_PARAMS = frozenset({
+    "make_api_request", "get_instagram_user_id", "get_page_for_ig_account", "load_tokens",
+    "async_make_api_request", "async_get_instagram_user_id", "async_make_batch_request",
+    "async_get_page_for_ig_account",
+})
+
+
+@functools.lru_cache(maxsize=None)
+def _get_signature(func) -> inspect.Signature:
+    """
+    Cached inspect.signature(); tool functions are static, so each is reflected once.
+    String annotations (modules using 'from __future__ import annotations') are
+    evaluated against the tool's module, since FastMCP resolves them from the wrapper.
+    """
+    return inspect.signature(func, eval_str=True)
+
+
 def create_dynamic_wrapper(func, description, tool_id=None):
     """
     Creates a wrapper function that injects the client instance.
-    The client provides: make_api_request, get_instagram_user_id, get_page_for_ig_account, load_tokens
+    The client provides: make_api_request, get_instagram_user_id, get_page_for_ig_account, load_tokens,
+    and the async variants async_make_api_request, async_get_instagram_user_id, async_make_batch_request.
+    Coroutine tool functions get an async wrapper so FastMCP awaits them.
     """
-    sig = inspect.signature(func)
+    sig = _get_signature(func)
     params = list(sig.parameters.values())
     
     # Identify which client methods this function needs
-    client_params = {"make_api_request", "get_instagram_user_id", "get_page_for_ig_account", "load_tokens"}
-    
-    # Filter out client-injected params
-    user_params = [p for p in params if p.name not in client_params]
-    
-    # Build param string - handle various default value types
-    decl_parts = []
-    names = []
-    for p in user_params:
-        if p.default is inspect._empty:
-            decl_parts.append(p.name)
-        elif p.default is None:
-            decl_parts.append(f"{p.name}=None")
-        elif isinstance(p.default, str):
-            decl_parts.append(f"{p.name}={repr(p.default)}")
-        elif isinstance(p.default, (int, float, bool)):
-            decl_parts.append(f"{p.name}={p.default}")
-        elif isinstance(p.default, (list, dict)):
-            decl_parts.append(f"{p.name}=None")  # Handle mutable defaults safely
-        else:
-            decl_parts.append(f"{p.name}={repr(p.default)}")
-        names.append(p.name)
+    client_params_needed = tuple(p.name for p in params if p.name in CLIENT_PARAMS)
     
-    decl = ", ".join(decl_parts)
-    
-    # Build kwargs for client methods
-    client_kwargs = []
+    # Filter out client-injected params; mutable defaults are exposed as None
+    user_params = []
     for p in params:
-        if p.name == "make_api_request":
-            client_kwargs.append("'make_api_request': __get_client().make_api_request")
-        elif p.name == "get_instagram_user_id":
-            client_kwargs.append("'get_instagram_user_id': __get_client().get_instagram_user_id")
-        elif p.name == "get_page_for_ig_account":
-            client_kwargs.append("'get_page_for_ig_account': __get_client().get_page_for_ig_account")
-        elif p.name == "load_tokens":
-            client_kwargs.append("'load_tokens': __get_client().load_tokens")
-    
-    client_kwargs_str = ", ".join(client_kwargs)
-    user_kwargs_str = ", ".join([f"'{n}': {n}" for n in names])
-    
-    # Source code for wrapper
-    src = (
-        f"def wrapper({decl}):\n"
-        f"    client_kwargs = {{{client_kwargs_str}}}\n"
-        f"    user_kwargs = {{{user_kwargs_str}}}\n"
-        f"    kwargs = {{**client_kwargs, **user_kwargs}}\n"
-        f"    return __func(**kwargs)\n"
-    )
-    
-    local_ns = {}
-    global_ns = {
-        "__func": func,
-        "__get_client": get_client
-    }
+        if p.name in CLIENT_PARAMS:
+            continue
+        default = p.default
+        if isinstance(default, (list, dict)):
+            default = None
+        user_params.append(p.replace(kind=inspect.Parameter.KEYWORD_ONLY, default=default))
     
-    exec(src, global_ns, local_ns)
-    wrapper = local_ns["wrapper"]
+    if inspect.iscoroutinefunction(func):
+        async def wrapper(**user_kwargs):
+            client = get_client()
+            for name in client_params_needed:
+                user_kwargs[name] = getattr(client, name)
+            result = await func(**user_kwargs)
+            return result.to_dict() if isinstance(result, ToolResult) else result
+    else:
+        def wrapper(**user_kwargs):
+            client = get_client()
+            for name in client_params_needed:
+                user_kwargs[name] = getattr(client, name)
+            result = func(**user_kwargs)
+            return result.to_dict() if isinstance(result, ToolResult) else result
     
     # Update Metadata
     wrapper.__name__ = tool_id if tool_id else func.__name__
     wrapper.__doc__ = description or func.__doc__
+    # The wrapper always returns the response dict (ToolResults are converted above)
+    wrapper.__signature__ = sig.replace(parameters=user_params, return_annotation=Dict[str, Any])
     
-    # Update Annotations (remove client params)
-    if hasattr(func, "__annotations__"):
-        ann = dict(func.__annotations__)
-        for cp in client_params:
-            ann.pop(cp, None)
-        wrapper.__annotations__ = ann
+    # Update Annotations (remove client params), using the evaluated signature types
+    ann = {p.name: p.annotation for p in user_params if p.annotation is not inspect.Parameter.empty}
+    ann["return"] = Dict[str, Any]
+    wrapper.__annotations__ = ann
     
     return wrapper
 
 
-def register_tools():
-    """Register tools from tools_manifest.json dynamically."""
+def _load_manifest_json():
+    """Resolve tools from tools_manifest.json (used when src/_manifest.py is unavailable)."""
     manifest_path = ROOT_DIR.parent / "tools_manifest.json"
     if not manifest_path.exists():
         logger.error(f"Manifest not found at {manifest_path}")
-        return
+        return []
     
     try:
-        with open(manifest_path, 'r') as f:
-            manifest = json.load(f)
+        with open(manifest_path, 'rb') as f:
+            manifest = json_compat.loads(f.read())
     except Exception as e:
         logger.error(f"Failed to load manifest: {e}")
-        return
+        return []
     
-    logger.info("Loading tools from manifest...")
-    
-    tools_registered = 0
+    tools = []
     for entry in manifest.get("tools", []):
         tool_id = entry.get("id")
         target = entry.get("target")
-        description = entry.get("description")
-        input_schema = entry.get("input_schema")
         
         if not tool_id or not target:
             continue
@@ -219,6 +244,30 @@ def register_tools():
             logger.error(f"Failed to import {target}: {e}")
             continue
         
+        tools.append((tool_id, func, entry.get("description"), entry.get("input_schema")))
+    return tools
+
+
+def _load_manifest():
+    """Return (tool_id, func, description, input_schema) entries for every tool.
+
+    Uses the generated src/_manifest.py (see scripts/build_manifest.py) and falls
+    back to parsing tools_manifest.json if it cannot be imported.
+    """
+    try:
+        from src._manifest import TOOLS
+        return TOOLS
+    except Exception as e:
+        logger.warning(f"Generated manifest unavailable ({e}), loading tools_manifest.json")
+        return _load_manifest_json()
+
+
+def register_tools():
+    """Register tools from the tool manifest dynamically."""
+    logger.info("Loading tools from manifest...")
+    
+    tools_registered = 0
+    for tool_id, func, description, input_schema in _load_manifest():
         # Create Dynamic Wrapper
         try:
             wrapper = create_dynamic_wrapper(func, description, tool_id)
@@ -246,8 +295,17 @@ def register_tools():
     logger.info(f"Total tools registered: {tools_registered}")
 
 
+def _configure_logging():
+    """Configure root logging; done at startup so importing this module has no side effects."""
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s %(levelname)s [%(name)s] %(message)s"
+    )
+
+
 def main():
     """Main entry point."""
+    _configure_logging()
     logger.info("Starting Instagram MCP Server...")
     logger.info(f"Config: API version={settings.graph_api_version}")
     
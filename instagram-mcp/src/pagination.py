@@ -0,0 +1,54 @@
+"""
+Cursor Pagination
+
+Async iteration over cursor-paginated Graph API edges. The next page is
+requested while the caller is still processing the current one, so page
+transitions do not wait a full round trip.
+"""
+
+import asyncio
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+
+async def iter_pages(
+    async_make_api_request,
+    endpoint: str,
+    params: Optional[Dict[str, Any]] = None,
+    max_pages: Optional[int] = None,
+) -> AsyncIterator[List[Dict[str, Any]]]:
+    """
+    Yield the 'data' list of each page of a cursor-paginated edge.
+
+    Args:
+        async_make_api_request: Client coroutine used for the requests
+        endpoint: Graph API edge, e.g. "{ig_media_id}/comments"
+        params: Query params for the first page (an 'after' cursor is added for later pages)
+        max_pages: Stop after this many pages (None for all)
+    """
+    base_params = dict(params or {})
+
+    def fetch(after: Optional[str]) -> "asyncio.Task":
+        # make_api_request adds the access token to params, so each request gets its own dict
+        page_params = dict(base_params)
+        if after:
+            page_params["after"] = after
+        return asyncio.create_task(async_make_api_request("GET", endpoint, params=page_params))
+
+    pending = fetch(base_params.get("after"))
+    pages = 0
+    try:
+        while pending is not None:
+            response = await pending
+            pending = None
+            pages += 1
+
+            paging = response.get("paging") or {}
+            after = (paging.get("cursors") or {}).get("after")
+            if after and paging.get("next") and (max_pages is None or pages < max_pages):
+                pending = fetch(after)
+
+            yield response.get("data") or []
+    finally:
+        # Consumer stopped early: don't leave the prefetched request running
+        if pending is not None:
+            pending.cancel()
@@ -0,0 +1,78 @@
+"""
+Client-Side Rate Limiting
+
+Token bucket used to space out Graph API calls locally, so a busy server waits
+in-process instead of spending calls on requests the API would throttle.
+"""
+
+import asyncio
+import threading
+import time
+from typing import Optional
+
+
+class TokenBucket:
+    """Token bucket refilled at rate tokens per second, holding at most capacity tokens."""
+
+    def __init__(self, rate: float, capacity: float):
+        """
+        Initialize a full bucket.
+
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum number of tokens (the allowed burst)
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def _reserve(self, n: int, timeout: Optional[float] = None) -> Optional[float]:
+        """
+        Take n tokens, going into debt if needed; return how long the caller must wait.
+        If that wait would be longer than timeout, take nothing and return None.
+        """
+        with self._lock:
+            self._refill()
+            delay = max(0.0, (n - self._tokens) / self.rate)
+            if timeout is not None and delay > timeout:
+                return None
+            self._tokens -= n
+            return delay
+
+    @property
+    def tokens(self) -> float:
+        """Tokens currently available (negative while callers are waiting)."""
+        with self._lock:
+            self._refill()
+            return self._tokens
+
+    def refund(self, n: int = 1) -> None:
+        """Return n tokens taken for calls that were never made."""
+        with self._lock:
+            self._refill()
+            self._tokens = min(self.capacity, self._tokens + n)
+
+    def acquire(self, n: int = 1, timeout: Optional[float] = None) -> bool:
+        """Take n tokens, sleeping until they are available; False (without sleeping) if that takes longer than timeout."""
+        delay = self._reserve(n, timeout)
+        if delay is None:
+            return False
+        if delay:
+            time.sleep(delay)
+        return True
+
+    async def async_acquire(self, n: int = 1, timeout: Optional[float] = None) -> bool:
+        """Take n tokens, awaiting until they are available; False (without waiting) if that takes longer than timeout."""
+        delay = self._reserve(n, timeout)
+        if delay is None:
+            return False
+        if delay:
+            await asyncio.sleep(delay)
+        return True
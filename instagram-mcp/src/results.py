@@ -0,0 +1,105 @@
+"""
+Tool Results
+
+Immutable result type returned by the modular tools. The server converts it to
+the usual {"data", "paging", "error", "successful"} dict before responding.
+"""
+
+import functools
+import inspect
+import re
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+
+@dataclass(frozen=True, slots=True)
+class ToolResult:
+    """Outcome of a tool call; paging is only included for paginated edges, extra keys are added at the top level."""
+
+    data: Any
+    paging: Optional[Dict[str, Any]] = None
+    error: str = ""
+    successful: bool = True
+    extra: Optional[Dict[str, Any]] = None
+
+    @classmethod
+    def failure(cls, error: str, data: Any = None, paging: Optional[Dict[str, Any]] = None) -> "ToolResult":
+        """Build a failed result; data defaults to an empty dict."""
+        return cls({} if data is None else data, paging, error, False)
+
+    @classmethod
+    def page(cls, response: Dict[str, Any]) -> "ToolResult":
+        """Build a result from one page of a cursor-paginated edge."""
+        return cls(response.get("data") or [], paging=response.get("paging") or {})
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the response dict sent to MCP clients."""
+        if self.paging is None:
+            result = {"data": self.data, "error": self.error, "successful": self.successful}
+        else:
+            result = {"data": self.data, "paging": self.paging, "error": self.error, "successful": self.successful}
+        if self.extra:
+            result.update(self.extra)
+        return result
+
+
+def error_hint(error_msg: str, hints: Iterable[Tuple["re.Pattern[str]", str]]) -> str:
+    """
+    Return the hint of the first (pattern, hint) pair whose pattern is found in error_msg, or "".
+    Pairs are checked in order, so an earlier pair wins even when a later pattern matches
+    earlier in the message (e.g. "#10" inside the "(#100)" prefix of Graph API errors).
+    """
+    for pattern, hint in hints:
+        if pattern.search(error_msg):
+            return hint
+    return ""
+
+
+def tool_result(
+    action: str,
+    empty: Callable[[], Any] = dict,
+    paging: bool = False,
+    hints: Iterable[Tuple["re.Pattern[str]", str]] = (),
+):
+    """
+    Wrap a tool so it can return the raw API response and let exceptions propagate.
+
+    Args:
+        action: Used in the error message, e.g. "get user info" -> "Failed to get user info: ..."
+        empty: Factory for the data value of a failed result
+        paging: Treat the return value as a page response (data + paging)
+        hints: Ordered (pattern, note) pairs; the note of the first pattern found in
+               the error message is appended to it (see error_hint)
+
+    A ToolResult returned by the tool is passed through unchanged.
+    """
+    hints = tuple(hints)
+
+    def wrap_result(value: Any) -> ToolResult:
+        if isinstance(value, ToolResult):
+            return value
+        return ToolResult.page(value) if paging else ToolResult(value)
+
+    def wrap_error(e: Exception) -> ToolResult:
+        error_msg = str(e)
+        error_msg += error_hint(error_msg, hints)
+        return ToolResult.failure(f"Failed to {action}: {error_msg}", data=empty(), paging={} if paging else None)
+
+    def decorator(func):
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def wrapper(*args, **kwargs):
+                try:
+                    return wrap_result(await func(*args, **kwargs))
+                except Exception as e:
+                    return wrap_error(e)
+        else:
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                try:
+                    return wrap_result(func(*args, **kwargs))
+                except Exception as e:
+                    return wrap_error(e)
+        return wrapper
+
+    return decorator
@@ -7,12 +7,66 @@ Tools for analytics and performance metrics:
 - Engagement metrics
 """
 
-from typing import Optional, List, Dict, Any
+from __future__ import annotations
 
+import re
+from functools import lru_cache
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+from urllib.parse import urlencode
 
-def get_user_insights(
-    make_api_request,
-    get_instagram_user_id,
+from src.results import tool_result
+
+# Client coroutines injected by the server
+_AsyncRequest = Callable[..., Awaitable[Dict[str, Any]]]
+_AsyncUserIdResolver = Callable[[Optional[str]], Awaitable[str]]
+_AsyncBatchRequest = Callable[[List[Dict[str, Any]]], Awaitable[List[Dict[str, Any]]]]
+
+_PERMISSION_HINT = " Generate a new token with 'instagram_manage_insights' permission."
+_IMPRESSIONS_HINT = " Remove 'impressions' from metrics. Use 'reach' instead."
+
+# Error classification: (pattern, hint) pairs checked in priority order, first match wins
+_PERMISSION_RE = re.compile(r"permission|#10", re.IGNORECASE)
+_IMPRESSIONS_RE = re.compile(r"impressions.*no longer supported|no longer supported.*impressions", re.IGNORECASE | re.DOTALL)
+
+_USER_INSIGHTS_ERROR_HINTS = (
+    (re.compile(r"must be one of the following values", re.IGNORECASE),
+     " Valid metrics: reach, follower_count, website_clicks, profile_views, online_followers, accounts_engaged, total_interactions, likes, comments, shares, saves, replies, views."),
+    (re.compile(r"should be specified with parameter metric_type", re.IGNORECASE),
+     " Solution: Some metrics require metric_type='total_value'. Make separate requests for different metric types."),
+    (_PERMISSION_RE, _PERMISSION_HINT),
+)
+
+_POST_INSIGHTS_ERROR_HINTS = (
+    (_IMPRESSIONS_RE, _IMPRESSIONS_HINT),
+    (_PERMISSION_RE, _PERMISSION_HINT),
+)
+
+_MEDIA_INSIGHTS_ERROR_HINTS = (
+    (_IMPRESSIONS_RE, _IMPRESSIONS_HINT),
+    (re.compile(r"metric.*must be one of|must be one of.*metric", re.IGNORECASE | re.DOTALL),
+     " Common valid metrics: reach, likes, comments, shares, saved, video_views, plays, total_interactions."),
+    (_PERMISSION_RE, _PERMISSION_HINT),
+)
+
+
+@lru_cache(maxsize=128)
+def _encode_metrics(metrics: Tuple[str, ...], drop_impressions: bool = False) -> str:
+    """
+    Join metric names for the 'metric' query param; memoized since callers poll the same sets.
+    With drop_impressions, 'impressions' (removed for media in v22.0+) is replaced by 'reach'.
+    """
+    if drop_impressions:
+        cleaned = tuple(m for m in metrics if m != "impressions")
+        if len(cleaned) < len(metrics) and "reach" not in cleaned:
+            cleaned += ("reach",)
+        metrics = cleaned
+    return ",".join(metrics)
+
+
+@tool_result("get user insights", empty=list, paging=True, hints=_USER_INSIGHTS_ERROR_HINTS)
+async def get_user_insights(
+    async_make_api_request: _AsyncRequest,
+    async_get_instagram_user_id: _AsyncUserIdResolver,
     metric: List[str],
     period: str = "day",
     metric_type: Optional[str] = None,
@@ -31,53 +85,25 @@ def get_user_insights(
     
     Note: 'impressions' is NOT valid for user insights (only for media insights).
     """
-    try:
-        user_id = get_instagram_user_id(ig_user_id)
-        
-        params = {
-            "metric": ",".join(metric),
-            "period": period or "day"
-        }
-        
-        if metric_type:
-            params["metric_type"] = metric_type
-        if breakdown:
-            params["breakdown"] = breakdown
-        if since:
-            params["since"] = since
-        if until:
-            params["until"] = until
-        if timeframe:
-            params["timeframe"] = timeframe
-        
-        response = make_api_request("GET", f"{user_id}/insights", params=params)
-        
-        return {
-            "data": response.get("data", []),
-            "paging": response.get("paging", {}),
-            "error": "",
-            "successful": True
-        }
-    except Exception as e:
-        error_msg = str(e)
-        
-        if "must be one of the following values" in error_msg.lower():
-            error_msg += " Valid metrics: reach, follower_count, website_clicks, profile_views, online_followers, accounts_engaged, total_interactions, likes, comments, shares, saves, replies, views."
-        elif "should be specified with parameter metric_type" in error_msg.lower():
-            error_msg += " Solution: Some metrics require metric_type='total_value'. Make separate requests for different metric types."
-        elif "permission" in error_msg.lower() or "#10" in error_msg:
-            error_msg += " Generate a new token with 'instagram_manage_insights' permission."
-        
-        return {
-            "data": [],
-            "paging": {},
-            "error": f"Failed to get user insights: {error_msg}",
-            "successful": False
-        }
-
-
-def get_post_insights(
-    make_api_request,
+    user_id = await async_get_instagram_user_id(ig_user_id)
+    
+    params = {
+        "metric": _encode_metrics(tuple(metric)),
+        "period": period or "day",
+        **{k: v for k, v in (
+            ("metric_type", metric_type), ("breakdown", breakdown),
+            ("since", since), ("until", until), ("timeframe", timeframe),
+        ) if v}
+    }
+    
+    response = await async_make_api_request("GET", f"{user_id}/insights", params=params)
+    
+    return response
+
+
+@tool_result("get post insights", empty=list, paging=True, hints=_POST_INSIGHTS_ERROR_HINTS)
+async def get_post_insights(
+    async_make_api_request: _AsyncRequest,
     ig_post_id: str,
     metric_preset: str = "auto_safe",
     metric: Optional[List[str]] = None,
@@ -89,40 +115,21 @@ def get_post_insights(
     IMPORTANT: Only works for PUBLISHED posts, not container IDs.
     Use GET_USER_MEDIA to get published post IDs.
     """
-    try:
-        params = {}
-        
-        if metric:
-            params["metric"] = ",".join(metric)
-        else:
-            params["metric_preset"] = metric_preset or "auto_safe"
-        
-        response = make_api_request("GET", f"{ig_post_id}/insights", params=params)
-        
-        return {
-            "data": response.get("data", []),
-            "paging": response.get("paging", {}),
-            "error": "",
-            "successful": True
-        }
-    except Exception as e:
-        error_msg = str(e)
-        
-        if "impressions" in error_msg.lower() and "no longer supported" in error_msg.lower():
-            error_msg += " Remove 'impressions' from metrics. Use 'reach' instead."
-        elif "permission" in error_msg.lower() or "#10" in error_msg:
-            error_msg += " Generate a new token with 'instagram_manage_insights' permission."
-        
-        return {
-            "data": [],
-            "paging": {},
-            "error": f"Failed to get post insights: {error_msg}",
-            "successful": False
-        }
-
-
-def get_ig_media_insights(
-    make_api_request,
+    params = {}
+    
+    if metric:
+        params["metric"] = _encode_metrics(tuple(metric))
+    else:
+        params["metric_preset"] = metric_preset or "auto_safe"
+    
+    response = await async_make_api_request("GET", f"{ig_post_id}/insights", params=params)
+    
+    return response
+
+
+@tool_result("get IG media insights", empty=list, paging=True, hints=_MEDIA_INSIGHTS_ERROR_HINTS)
+async def get_ig_media_insights(
+    async_make_api_request: _AsyncRequest,
     ig_media_id: str,
     metric: List[str],
     period: str = "lifetime",
@@ -136,38 +143,52 @@ def get_ig_media_insights(
     
     Note: Insights data is only available for media published within the last 2 years.
     """
-    try:
-        # Auto-remove impressions for v22.0+ compatibility
-        cleaned_metric = [m for m in metric if m != "impressions"]
-        if len(cleaned_metric) < len(metric) and "reach" not in cleaned_metric:
-            cleaned_metric.append("reach")
-        
-        params = {
-            "metric": ",".join(cleaned_metric),
-            "period": period or "lifetime"
-        }
-        
-        response = make_api_request("GET", f"{ig_media_id}/insights", params=params)
-        
-        return {
-            "data": response.get("data", []),
-            "paging": response.get("paging", {}),
-            "error": "",
-            "successful": True
-        }
-    except Exception as e:
-        error_msg = str(e)
-        
-        if "impressions" in error_msg.lower() and "no longer supported" in error_msg.lower():
-            error_msg += " Remove 'impressions' from metrics. Use 'reach' instead."
-        elif "metric" in error_msg.lower() and "must be one of" in error_msg.lower():
-            error_msg += " Common valid metrics: reach, likes, comments, shares, saved, video_views, plays, total_interactions."
-        elif "permission" in error_msg.lower() or "#10" in error_msg:
-            error_msg += " Generate a new token with 'instagram_manage_insights' permission."
-        
-        return {
-            "data": [],
-            "paging": {},
-            "error": f"Failed to get IG media insights: {error_msg}",
-            "successful": False
-        }
+    # Auto-remove impressions for v22.0+ compatibility
+    params = {
+        "metric": _encode_metrics(tuple(metric), True),
+        "period": period or "lifetime"
+    }
+    
+    response = await async_make_api_request("GET", f"{ig_media_id}/insights", params=params)
+    
+    return response
+
+
+@tool_result("get IG media insights")
+async def get_ig_media_insights_bulk(
+    async_make_batch_request: _AsyncBatchRequest,
+    ig_media_ids: List[str],
+    metric: List[str],
+    period: str = "lifetime",
+    graph_api_version: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Get insights for several Instagram media objects using Graph API batch requests.
+    
+    Up to 50 media are fetched per round trip. 'data' maps each media ID to a
+    result shaped like GET_IG_MEDIA_INSIGHTS, so one failing post does not fail the rest.
+    """
+    query = urlencode({"metric": _encode_metrics(tuple(metric), True), "period": period or "lifetime"})
+    items = await async_make_batch_request([
+        {"method": "GET", "relative_url": f"{media_id}/insights?{query}"}
+        for media_id in ig_media_ids
+    ])
+    
+    results = {}
+    for media_id, item in zip(ig_media_ids, items):
+        body = item["body"]
+        if item["code"] == 200:
+            results[media_id] = {
+                "data": body.get("data", []),
+                "error": "",
+                "successful": True
+            }
+        else:
+            message = body.get("error", {}).get("message") or f"HTTP {item['code']}"
+            results[media_id] = {
+                "data": [],
+                "error": f"Failed to get IG media insights: {message}",
+                "successful": False
+            }
+    
+    return results
@@ -7,11 +7,35 @@ Tools for retrieving media information:
 - Media comments
 """
 
-from typing import Optional, Dict, Any
+from __future__ import annotations
 
+from functools import lru_cache
+from typing import Any, Awaitable, Callable, Dict, List, Optional
 
-def get_ig_media(
-    make_api_request,
+from src.cache import TTLCache
+from src.results import tool_result
+
+# Client coroutine injected by the server
+_AsyncRequest = Callable[..., Awaitable[Dict[str, Any]]]
+
+# Fields of published media that do not change after publishing
+_IMMUTABLE_MEDIA_FIELDS = frozenset({
+    "id", "media_type", "media_url", "permalink", "timestamp", "caption", "thumbnail_url"
+})
+
+# Responses made only of immutable fields are reused for a day
+_media_cache = TTLCache(maxsize=256, ttl=86400)
+
+
+@lru_cache(maxsize=64)
+def _is_cacheable(fields: str) -> bool:
+    """True if every requested field is immutable (counts like like_count are never cached)."""
+    return _IMMUTABLE_MEDIA_FIELDS.issuperset(f.strip() for f in fields.split(","))
+
+
+@tool_result("get IG media")
+async def get_ig_media(
+    async_make_api_request: _AsyncRequest,
     ig_media_id: str,
     fields: Optional[str] = None,
     graph_api_version: Optional[str] = None,
@@ -20,58 +44,49 @@ def get_ig_media(
     Get a published Instagram Media object (photo, video, story, reel, or carousel).
     NOTE: This is for published media only. For unpublished containers, use GET_POST_STATUS.
     """
-    try:
-        params = {
-            "fields": fields or "id"
-        }
-        
-        response = make_api_request("GET", ig_media_id, params=params)
-        
-        return {
-            "data": response,
-            "error": "",
-            "successful": True
-        }
-    except Exception as e:
-        return {
-            "data": {},
-            "error": f"Failed to get IG media: {str(e)}",
-            "successful": False
-        }
+    params = {
+        "fields": fields or "id"
+    }
+    
+    cache_key = (ig_media_id, params["fields"]) if _is_cacheable(params["fields"]) else None
+    response = _media_cache.get(cache_key) if cache_key else None
+    if response is None:
+        response = await async_make_api_request("GET", ig_media_id, params=params)
+        if cache_key:
+            _media_cache.set(cache_key, response)
+    
+    return response
 
 
-def get_ig_media_children(
-    make_api_request,
+@tool_result("get media children", empty=list)
+async def get_ig_media_children(
+    async_make_api_request: _AsyncRequest,
     ig_media_id: str,
     fields: Optional[str] = None,
     graph_api_version: Optional[str] = None,
-) -> Dict[str, Any]:
+) -> List[Dict[str, Any]]:
     """
     Get media objects (images/videos) that are children of an Instagram carousel/album post.
     Note: Carousel children do not support insights queries.
     """
-    try:
-        params = {
-            "fields": fields or "id,media_type,media_url,permalink,timestamp"
-        }
-        
-        response = make_api_request("GET", f"{ig_media_id}/children", params=params)
-        
-        return {
-            "data": response.get("data", []),
-            "error": "",
-            "successful": True
-        }
-    except Exception as e:
-        return {
-            "data": [],
-            "error": f"Failed to get media children: {str(e)}",
-            "successful": False
-        }
+    params = {
+        "fields": fields or "id,media_type,media_url,permalink,timestamp"
+    }
+    
+    endpoint = f"{ig_media_id}/children"
+    cache_key = (endpoint, params["fields"]) if _is_cacheable(params["fields"]) else None
+    response = _media_cache.get(cache_key) if cache_key else None
+    if response is None:
+        response = await async_make_api_request("GET", endpoint, params=params)
+        if cache_key:
+            _media_cache.set(cache_key, response)
+    
+    return response.get("data") or []
 
 
-def get_ig_media_comments(
-    make_api_request,
+@tool_result("get media comments", empty=list, paging=True)
+async def get_ig_media_comments(
+    async_make_api_request: _AsyncRequest,
     ig_media_id: str,
     fields: Optional[str] = None,
     limit: int = 25,
@@ -83,29 +98,11 @@ def get_ig_media_comments(
     Retrieve comments on an Instagram media object.
     Returns comment objects with 'id' field for use in POST_IG_COMMENT_REPLIES or DELETE_COMMENT.
     """
-    try:
-        params = {
-            "fields": fields or "id,text,username,timestamp,like_count,from,hidden,media,parent_id"
-        }
-        if limit:
-            params["limit"] = limit
-        if after:
-            params["after"] = after
-        if before:
-            params["before"] = before
-        
-        response = make_api_request("GET", f"{ig_media_id}/comments", params=params)
-        
-        return {
-            "data": response.get("data", []),
-            "paging": response.get("paging", {}),
-            "error": "",
-            "successful": True
-        }
-    except Exception as e:
-        return {
-            "data": [],
-            "paging": {},
-            "error": f"Failed to get media comments: {str(e)}",
-            "successful": False
-        }
+    params = {
+        "fields": fields or "id,text,username,timestamp,like_count,from,hidden,media,parent_id",
+        **{k: v for k, v in (("limit", limit), ("after", after), ("before", before)) if v}
+    }
+    
+    response = await async_make_api_request("GET", f"{ig_media_id}/comments", params=params)
+    
+    return response
@@ -9,13 +9,52 @@ Tools for Instagram Direct Messages:
 """
 
 import os
-from typing import Optional, Dict, Any
+import re
+from typing import Optional, Dict, Any, Tuple, Union
 
+from src import json_compat
+from src.results import ToolResult, tool_result
 
-def get_conversation(
-    make_api_request,
-    get_page_for_ig_account,
-    get_instagram_user_id,
+# Error classification: (pattern, hint) pairs checked in priority order, first match wins
+_LIST_CONVERSATIONS_ERROR_HINTS = (
+    (re.compile(r"permission|access", re.IGNORECASE), " Ensure your access token has 'pages_messaging' permission."),
+)
+
+_SEND_MESSAGE_ERROR_HINTS = (
+    (re.compile(r"\(#3\)|does not have the capability", re.IGNORECASE), " The recipient must message you first."),
+    (re.compile(r"\(#100\)"), " The recipient hasn't messaged you first or recipient_id is incorrect."),
+    (re.compile(r"permission", re.IGNORECASE), " Ensure 'pages_messaging' and 'instagram_manage_messages' permissions."),
+)
+
+_MARK_SEEN_ERROR_HINTS = (
+    (re.compile(r"500|internal server error", re.IGNORECASE), " The sender_action feature may not be supported for this account."),
+    (re.compile(r"permission", re.IGNORECASE), " Generate a token with 'instagram_manage_messages' permission."),
+)
+
+_PAGE_TOKEN_REQUIRED = "Page Access Token required. Run: uv run instagram-mcp/get_page_token.py"
+
+
+async def _resolve_page_token(
+    async_get_instagram_user_id,
+    async_get_page_for_ig_account,
+    ig_user_id: Optional[str] = None,
+) -> Tuple[str, Dict[str, Optional[str]]]:
+    """
+    Resolve the Instagram user ID and its Facebook Page info (page_id, page_access_token).
+    Messaging endpoints need the Page Access Token, so a missing token raises ValueError.
+    """
+    user_id = await async_get_instagram_user_id(ig_user_id)
+    page_info = await async_get_page_for_ig_account(user_id)
+    if not page_info.get("page_access_token"):
+        raise ValueError(_PAGE_TOKEN_REQUIRED)
+    return user_id, page_info
+
+
+@tool_result("get conversation")
+async def get_conversation(
+    async_make_api_request,
+    async_get_page_for_ig_account,
+    async_get_instagram_user_id,
     conversation_id: str,
     graph_api_version: Optional[str] = None,
 ) -> Dict[str, Any]:
@@ -23,48 +62,24 @@ def get_conversation(
     Get details about a specific Instagram DM conversation (participants, etc).
     Requires Page Access Token (automatically used).
     """
-    try:
-        ig_user_id = get_instagram_user_id(None)
-        page_info = get_page_for_ig_account(ig_user_id)
-        page_access_token = page_info.get("page_access_token")
-        
-        if not page_info.get("page_id"):
-            raise ValueError("Could not find Facebook Page ID. Connect your Instagram account to a Facebook Page or set FACEBOOK_PAGE_ID.")
-        
-        if not page_access_token:
-            raise ValueError("Page Access Token is required. Run: uv run instagram-mcp/get_page_token.py")
-        
-        # Temporarily use page token
-        original_token = os.environ.get("INSTAGRAM_ACCESS_TOKEN")
-        os.environ["INSTAGRAM_ACCESS_TOKEN"] = page_access_token
-        
-        try:
-            params = {"fields": "id,participants,updated_time"}
-            response = make_api_request("GET", conversation_id, params=params)
-            
-            return {
-                "data": response,
-                "error": "",
-                "successful": True
-            }
-        finally:
-            if original_token:
-                os.environ["INSTAGRAM_ACCESS_TOKEN"] = original_token
-            elif "INSTAGRAM_ACCESS_TOKEN" in os.environ:
-                del os.environ["INSTAGRAM_ACCESS_TOKEN"]
-                
-    except Exception as e:
-        return {
-            "data": {},
-            "error": f"Failed to get conversation: {str(e)}",
-            "successful": False
-        }
+    _, page_info = await _resolve_page_token(async_get_instagram_user_id, async_get_page_for_ig_account)
+    
+    if not page_info.get("page_id"):
+        raise ValueError("Could not find Facebook Page ID. Connect your Instagram account to a Facebook Page or set FACEBOOK_PAGE_ID.")
+    
+    params = {"fields": "id,participants,updated_time"}
+    response = await async_make_api_request(
+        "GET", conversation_id, params=params, access_token=page_info["page_access_token"]
+    )
+    
+    return response
 
 
-def get_conversations(
-    make_api_request,
-    get_page_for_ig_account,
-    get_instagram_user_id,
+@tool_result("get conversations")
+async def get_conversations(
+    async_make_api_request,
+    async_get_page_for_ig_account,
+    async_get_instagram_user_id,
     page_id: Optional[str] = None,
     limit: Optional[int] = None,
     graph_api_version: Optional[str] = None,
@@ -73,160 +88,92 @@ def get_conversations(
     List Instagram DM conversations to find conversation IDs.
     Returns conversation objects with 'id' field and 'participants' array.
     """
-    try:
-        ig_user_id = get_instagram_user_id(None)
-        page_info = get_page_for_ig_account(ig_user_id)
-        
-        if page_id:
-            page_info["page_id"] = page_id
-        
-        page_id_value = page_info.get("page_id")
-        page_access_token = page_info.get("page_access_token")
-        
-        if not page_id_value:
-            raise ValueError("Could not find Facebook Page ID. Set FACEBOOK_PAGE_ID.")
-        
-        if not page_access_token:
-            raise ValueError("Page Access Token is required. Run: uv run instagram-mcp/get_page_token.py")
-        
-        # Use page token
-        original_token = os.environ.get("INSTAGRAM_ACCESS_TOKEN")
-        os.environ["INSTAGRAM_ACCESS_TOKEN"] = page_access_token
-        
-        try:
-            params = {
-                "platform": "instagram",
-                "fields": "id,participants,updated_time"
-            }
-            if limit:
-                params["limit"] = limit
-            
-            response = make_api_request("GET", f"{page_id_value}/conversations", params=params)
-            
-            return {
-                "data": response,
-                "error": "",
-                "successful": True
-            }
-        finally:
-            if original_token:
-                os.environ["INSTAGRAM_ACCESS_TOKEN"] = original_token
-            elif "INSTAGRAM_ACCESS_TOKEN" in os.environ:
-                del os.environ["INSTAGRAM_ACCESS_TOKEN"]
-                
-    except Exception as e:
-        return {
-            "data": {},
-            "error": f"Failed to get conversations: {str(e)}",
-            "successful": False
-        }
+    _, page_info = await _resolve_page_token(async_get_instagram_user_id, async_get_page_for_ig_account)
+    
+    page_id_value = page_id or page_info.get("page_id")
+    if not page_id_value:
+        raise ValueError("Could not find Facebook Page ID. Set FACEBOOK_PAGE_ID.")
+    
+    params = {
+        "platform": "instagram",
+        "fields": "id,participants,updated_time",
+        **({"limit": limit} if limit else {})
+    }
+    
+    response = await async_make_api_request(
+        "GET", f"{page_id_value}/conversations", params=params, access_token=page_info["page_access_token"]
+    )
+    
+    return response
 
 
-def list_all_conversations(
-    make_api_request,
-    get_page_for_ig_account,
-    get_instagram_user_id,
+@tool_result("list conversations", empty=list, paging=True, hints=_LIST_CONVERSATIONS_ERROR_HINTS)
+async def list_all_conversations(
+    async_make_api_request,
+    async_get_page_for_ig_account,
+    async_get_instagram_user_id,
     load_tokens,
     limit: int = 25,
     after: Optional[str] = None,
     graph_api_version: Optional[str] = None,
     ig_user_id: Optional[str] = None,
-) -> Dict[str, Any]:
+) -> Union[ToolResult, Dict[str, Any]]:
     """
     List all Instagram DM conversations for the authenticated user.
     This is the recommended function for getting conversations.
     """
-    try:
-        # Load stored tokens
-        stored_tokens = load_tokens()
-        page_token = stored_tokens.get("page_access_token")
-        page_id = stored_tokens.get("facebook_page_id")
-        
-        # Fall back to environment variables
-        if not page_token:
-            page_token = os.environ.get("INSTAGRAM_PAGE_ACCESS_TOKEN")
-        if not page_id:
-            page_id = os.environ.get("FACEBOOK_PAGE_ID")
-        
-        # Try auto-detection as last resort
-        if not page_token or not page_id:
-            user_id = get_instagram_user_id(ig_user_id)
-            page_info = get_page_for_ig_account(user_id)
-            if not page_token:
-                page_token = page_info.get("page_access_token")
-            if not page_id:
-                page_id = page_info.get("page_id")
-        
+    # Load stored tokens
+    stored_tokens = load_tokens()
+    page_token = stored_tokens.get("page_access_token")
+    page_id = stored_tokens.get("facebook_page_id")
+    
+    # Fall back to environment variables
+    if not page_token:
+        page_token = os.environ.get("INSTAGRAM_PAGE_ACCESS_TOKEN")
+    if not page_id:
+        page_id = os.environ.get("FACEBOOK_PAGE_ID")
+    
+    # Try auto-detection as last resort
+    if not page_token or not page_id:
+        user_id = await async_get_instagram_user_id(ig_user_id)
+        page_info = await async_get_page_for_ig_account(user_id)
         if not page_token:
-            return {
-                "data": [],
-                "paging": {},
-                "error": "Page Access Token is required. Run: uv run instagram-mcp/get_page_token.py",
-                "successful": False
-            }
-        
+            page_token = page_info.get("page_access_token")
         if not page_id:
-            return {
-                "data": [],
-                "paging": {},
-                "error": "Facebook Page ID not found. Ensure Instagram is connected to a Facebook Page.",
-                "successful": False
-            }
-        
-        # Use page token
-        original_token = os.environ.get("INSTAGRAM_ACCESS_TOKEN")
-        os.environ["INSTAGRAM_ACCESS_TOKEN"] = page_token
-        
-        try:
-            params = {
-                "platform": "instagram",
-                "fields": "id,participants,updated_time",
-                "limit": limit
-            }
-            
-            if after:
-                params["after"] = after
-            
-            response = make_api_request("GET", f"{page_id}/conversations", params=params)
-            
-            conversations_data = response.get("data", [])
-            
-            if not conversations_data:
-                return {
-                    "data": [],
-                    "paging": response.get("paging", {}),
-                    "error": "No conversations found.",
-                    "successful": True
-                }
-            
-            return {
-                "data": conversations_data,
-                "paging": response.get("paging", {}),
-                "error": "",
-                "successful": True
-            }
-        finally:
-            if original_token:
-                os.environ["INSTAGRAM_ACCESS_TOKEN"] = original_token
-            elif "INSTAGRAM_ACCESS_TOKEN" in os.environ:
-                del os.environ["INSTAGRAM_ACCESS_TOKEN"]
-                
-    except Exception as e:
-        error_msg = str(e)
-        if "permission" in error_msg.lower() or "access" in error_msg.lower():
-            error_msg += " Ensure your access token has 'pages_messaging' permission."
-        return {
-            "data": [],
-            "paging": {},
-            "error": f"Failed to list conversations: {error_msg}",
-            "successful": False
-        }
+            page_id = page_info.get("page_id")
+    
+    if not page_token:
+        return ToolResult.failure(
+            "Page Access Token is required. Run: uv run instagram-mcp/get_page_token.py", data=[], paging={}
+        )
+    
+    if not page_id:
+        return ToolResult.failure(
+            "Facebook Page ID not found. Ensure Instagram is connected to a Facebook Page.", data=[], paging={}
+        )
+    
+    params = {
+        "platform": "instagram",
+        "fields": "id,participants,updated_time",
+        "limit": limit,
+        **({"after": after} if after else {})
+    }
+    
+    response = await async_make_api_request(
+        "GET", f"{page_id}/conversations", params=params, access_token=page_token
+    )
+    
+    if not response.get("data"):
+        return ToolResult([], paging=response.get("paging") or {}, error="No conversations found.")
+    
+    return response
 
 
-def list_all_messages(
-    make_api_request,
-    get_page_for_ig_account,
-    get_instagram_user_id,
+@tool_result("list messages", empty=list, paging=True)
+async def list_all_messages(
+    async_make_api_request,
+    async_get_page_for_ig_account,
+    async_get_instagram_user_id,
     conversation_id: str,
     limit: int = 25,
     after: Optional[str] = None,
@@ -235,59 +182,27 @@ def list_all_messages(
     """
     List all messages from a specific Instagram DM conversation.
     """
-    try:
-        ig_user_id = get_instagram_user_id(None)
-        page_info = get_page_for_ig_account(ig_user_id)
-        page_token = page_info.get("page_access_token")
-        
-        if not page_token:
-            return {
-                "data": [],
-                "paging": {},
-                "error": "Page Access Token required. Run: uv run instagram-mcp/get_page_token.py",
-                "successful": False
-            }
-        
-        # Use page token
-        original_token = os.environ.get("INSTAGRAM_ACCESS_TOKEN")
-        os.environ["INSTAGRAM_ACCESS_TOKEN"] = page_token
-        
-        try:
-            params = {
-                "fields": "id,message,from,created_time,attachments",
-                "limit": limit
-            }
-            
-            if after:
-                params["after"] = after
-            
-            response = make_api_request("GET", f"{conversation_id}/messages", params=params)
-            
-            return {
-                "data": response.get("data", []),
-                "paging": response.get("paging", {}),
-                "error": "",
-                "successful": True
-            }
-        finally:
-            if original_token:
-                os.environ["INSTAGRAM_ACCESS_TOKEN"] = original_token
-            elif "INSTAGRAM_ACCESS_TOKEN" in os.environ:
-                del os.environ["INSTAGRAM_ACCESS_TOKEN"]
-                
-    except Exception as e:
-        return {
-            "data": [],
-            "paging": {},
-            "error": f"Failed to list messages: {str(e)}",
-            "successful": False
-        }
+    _, page_info = await _resolve_page_token(async_get_instagram_user_id, async_get_page_for_ig_account)
+    page_token = page_info["page_access_token"]
+    
+    params = {
+        "fields": "id,message,from,created_time,attachments",
+        "limit": limit,
+        **({"after": after} if after else {})
+    }
+    
+    response = await async_make_api_request(
+        "GET", f"{conversation_id}/messages", params=params, access_token=page_token
+    )
+    
+    return response
 
 
-def send_text_message(
-    make_api_request,
-    get_page_for_ig_account,
-    get_instagram_user_id,
+@tool_result("send text message", hints=_SEND_MESSAGE_ERROR_HINTS)
+async def send_text_message(
+    async_make_api_request,
+    async_get_page_for_ig_account,
+    async_get_instagram_user_id,
     recipient_id: str,
     text: str,
     ig_user_id: Optional[str] = None,
@@ -298,66 +213,31 @@ def send_text_message(
     Send a text message to an Instagram user via DM.
     Note: Can only message users who have messaged you first or interacted with your content.
     """
-    import json as json_module
+    user_id, page_info = await _resolve_page_token(
+        async_get_instagram_user_id, async_get_page_for_ig_account, ig_user_id
+    )
+    page_token = page_info["page_access_token"]
     
-    try:
-        user_id = get_instagram_user_id(ig_user_id)
-        page_info = get_page_for_ig_account(user_id)
-        page_token = page_info.get("page_access_token")
-        
-        if not page_token:
-            return {
-                "data": {},
-                "error": "Page Access Token required. Run: uv run instagram-mcp/get_page_token.py",
-                "successful": False
-            }
-        
-        # Use page token
-        original_token = os.environ.get("INSTAGRAM_ACCESS_TOKEN")
-        os.environ["INSTAGRAM_ACCESS_TOKEN"] = page_token
-        
-        try:
-            params = {
-                "recipient": json_module.dumps({"id": recipient_id}),
-                "message": json_module.dumps({"text": text})
-            }
-            
-            if reply_to_message_id:
-                params["message"] = json_module.dumps({"text": text, "reply_to": {"message_id": reply_to_message_id}})
-            
-            response = make_api_request("POST", f"{user_id}/messages", data=params)
-            
-            return {
-                "data": response,
-                "error": "",
-                "successful": True
-            }
-        finally:
-            if original_token:
-                os.environ["INSTAGRAM_ACCESS_TOKEN"] = original_token
-            elif "INSTAGRAM_ACCESS_TOKEN" in os.environ:
-                del os.environ["INSTAGRAM_ACCESS_TOKEN"]
-                
-    except Exception as e:
-        error_msg = str(e)
-        if "(#3)" in error_msg or "does not have the capability" in error_msg.lower():
-            error_msg += " The recipient must message you first."
-        elif "(#100)" in error_msg:
-            error_msg += " The recipient hasn't messaged you first or recipient_id is incorrect."
-        elif "permission" in error_msg.lower():
-            error_msg += " Ensure 'pages_messaging' and 'instagram_manage_messages' permissions."
-        
-        return {
-            "data": {},
-            "error": f"Failed to send text message: {error_msg}",
-            "successful": False
-        }
+    params = {
+        "recipient": json_compat.dumps({"id": recipient_id}),
+        "message": json_compat.dumps({"text": text})
+    }
+    
+    if reply_to_message_id:
+        params["message"] = json_compat.dumps({"text": text, "reply_to": {"message_id": reply_to_message_id}})
+    
+    response = await async_make_api_request(
+        "POST", f"{user_id}/messages", data=params, access_token=page_token
+    )
+    
+    return response
 
 
-def send_image(
-    make_api_request,
-    get_page_for_ig_account,
-    get_instagram_user_id,
+@tool_result("send image")
+async def send_image(
+    async_make_api_request,
+    async_get_page_for_ig_account,
+    async_get_instagram_user_id,
     recipient_id: str,
     image_url: str,
     ig_user_id: Optional[str] = None,
@@ -366,55 +246,28 @@ def send_image(
     """
     Send an image via Instagram DM to a specific user.
     """
-    import json as json_module
+    user_id, page_info = await _resolve_page_token(
+        async_get_instagram_user_id, async_get_page_for_ig_account, ig_user_id
+    )
+    page_token = page_info["page_access_token"]
     
-    try:
-        user_id = get_instagram_user_id(ig_user_id)
-        page_info = get_page_for_ig_account(user_id)
-        page_token = page_info.get("page_access_token")
-        
-        if not page_token:
-            return {
-                "data": {},
-                "error": "Page Access Token required. Run: uv run instagram-mcp/get_page_token.py",
-                "successful": False
-            }
-        
-        # Use page token
-        original_token = os.environ.get("INSTAGRAM_ACCESS_TOKEN")
-        os.environ["INSTAGRAM_ACCESS_TOKEN"] = page_token
-        
-        try:
-            params = {
-                "recipient": json_module.dumps({"id": recipient_id}),
-                "message": json_module.dumps({"attachment": {"type": "image", "payload": {"url": image_url}}})
-            }
-            
-            response = make_api_request("POST", f"{user_id}/messages", data=params)
-            
-            return {
-                "data": response,
-                "error": "",
-                "successful": True
-            }
-        finally:
-            if original_token:
-                os.environ["INSTAGRAM_ACCESS_TOKEN"] = original_token
-            elif "INSTAGRAM_ACCESS_TOKEN" in os.environ:
-                del os.environ["INSTAGRAM_ACCESS_TOKEN"]
-                
-    except Exception as e:
-        return {
-            "data": {},
-            "error": f"Failed to send image: {str(e)}",
-            "successful": False
-        }
+    params = {
+        "recipient": json_compat.dumps({"id": recipient_id}),
+        "message": json_compat.dumps({"attachment": {"type": "image", "payload": {"url": image_url}}})
+    }
+    
+    response = await async_make_api_request(
+        "POST", f"{user_id}/messages", data=params, access_token=page_token
+    )
+    
+    return response
 
 
-def mark_seen(
-    make_api_request,
-    get_page_for_ig_account,
-    get_instagram_user_id,
+@tool_result("mark messages as seen", hints=_MARK_SEEN_ERROR_HINTS)
+async def mark_seen(
+    async_make_api_request,
+    async_get_page_for_ig_account,
+    async_get_instagram_user_id,
     recipient_id: str,
     ig_user_id: Optional[str] = None,
     graph_api_version: Optional[str] = None,
@@ -422,52 +275,18 @@ def mark_seen(
     """
     Mark Instagram DM messages as read/seen for a specific user.
     """
-    import json as json_module
+    user_id, page_info = await _resolve_page_token(
+        async_get_instagram_user_id, async_get_page_for_ig_account, ig_user_id
+    )
+    page_token = page_info["page_access_token"]
     
-    try:
-        user_id = get_instagram_user_id(ig_user_id)
-        page_info = get_page_for_ig_account(user_id)
-        page_token = page_info.get("page_access_token")
-        
-        if not page_token:
-            return {
-                "data": {},
-                "error": "Page Access Token required. Run: uv run instagram-mcp/get_page_token.py",
-                "successful": False
-            }
-        
-        # Use page token
-        original_token = os.environ.get("INSTAGRAM_ACCESS_TOKEN")
-        os.environ["INSTAGRAM_ACCESS_TOKEN"] = page_token
-        
-        try:
-            params = {
-                "recipient": json_module.dumps({"id": recipient_id}),
-                "sender_action": "mark_seen"
-            }
-            
-            response = make_api_request("POST", f"{user_id}/messages", data=params)
-            
-            return {
-                "data": response,
-                "error": "",
-                "successful": True
-            }
-        finally:
-            if original_token:
-                os.environ["INSTAGRAM_ACCESS_TOKEN"] = original_token
-            elif "INSTAGRAM_ACCESS_TOKEN" in os.environ:
-                del os.environ["INSTAGRAM_ACCESS_TOKEN"]
-                
-    except Exception as e:
-        error_msg = str(e)
-        if "500" in error_msg or "internal server error" in error_msg.lower():
-            error_msg += " The sender_action feature may not be supported for this account."
-        elif "permission" in error_msg.lower():
-            error_msg += " Generate a token with 'instagram_manage_messages' permission."
-        
-        return {
-            "data": {},
-            "error": f"Failed to mark messages as seen: {error_msg}",
-            "successful": False
-        }
+    params = {
+        "recipient": json_compat.dumps({"id": recipient_id}),
+        "sender_action": "mark_seen"
+    }
+    
+    response = await async_make_api_request(
+        "POST", f"{user_id}/messages", data=params, access_token=page_token
+    )
+    
+    return response
@@ -5,15 +5,283 @@ Tools for creating and publishing media content:
 - Media containers (photos, videos, reels)
 - Carousel posts
 - Publishing and status checking
+
+The publishers wait for container processing with asyncio.sleep, so several
+containers can be polled concurrently on the server's event loop.
 """
 
+import asyncio
+import re
 import time
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Union
+from urllib.parse import urlencode
+
+from src import json_compat
+from src.cache import TTLCache
+from src.ratelimit import TokenBucket
+from src.results import ToolResult, tool_result
+
+# Status polling starts short so small images publish quickly, then backs off
+# so long video processing does not spend the hourly call quota on re-checks.
+INITIAL_POLL_DELAY = 0.5
+MAX_POLL_DELAY = 5
+
+# How long create_post waits for processing; matches the ~124s of its original
+# 15 checks backing off from 3s to 10s, so long videos still get published
+CREATE_POST_MAX_WAIT = 125
+
+# Container status checks closer together than this reuse the last response.
+# Containers that can no longer change state are cached until evicted; FINISHED is
+# not one of them because it becomes PUBLISHED once the container is published.
+STATUS_CACHE_TTL = 0.5
+_FINAL_STATUSES = frozenset({"ERROR", "EXPIRED", "PUBLISHED"})
+
+_EXPIRED_ERROR = "Media container has expired. Create a new one."
+_POST_STATUS_ERROR_HINTS = ((re.compile(r"timeout", re.IGNORECASE), " (request timed out; try again in a few moments)"),)
+_status_cache = TTLCache(maxsize=4096, ttl=STATUS_CACHE_TTL)
+
+# Containers seen FINISHED; the publishers skip polling for these. A FINISHED
+# container can only become PUBLISHED or EXPIRED (after 24 hours).
+_finished_containers = TTLCache(maxsize=1024, ttl=86400)
+
+# Publishing calls are held to the Graph API's 200 calls per hour locally, so a
+# busy server waits here instead of polling against a throttled account.
+# Below RATE_LIMIT_LOW_WATER remaining calls, status polls use the longest delay.
+RATE_LIMIT_CALLS_PER_HOUR = 200
+RATE_LIMIT_LOW_WATER = 20
+_rate_limiter = TokenBucket(rate=RATE_LIMIT_CALLS_PER_HOUR / 3600, capacity=RATE_LIMIT_CALLS_PER_HOUR)
+
+# Calls without a deadline of their own wait at most this long for the rate limiter
+RATE_LIMIT_MAX_WAIT = 45
+_RATE_LIMITED_ERROR = "Rate limited: the hourly Graph API call budget is used up. Try again later."
+
+# Child containers created at once when the batch request could not create them
+CHILD_CREATE_WORKERS = 10
+
+# Media URLs must be absolute http(s) URLs with a host; anything else is rejected before any request
+_URL_RE = re.compile(r"https?://[^\s/?#]+\S*", re.IGNORECASE)
+
+
+def _check_urls(**urls: Any) -> None:
+    """Raise ValueError for the first set URL (or URL in a list) that is not a valid http(s) URL."""
+    for name, value in urls.items():
+        for url in value if isinstance(value, list) else (value,):
+            if url and not _URL_RE.fullmatch(url):
+                raise ValueError(f"invalid {name}: {url!r}")
+
+
+def _join(value: Any) -> str:
+    """Comma-join a list of IDs; an already-joined string passes through."""
+    return value if isinstance(value, str) else ",".join(value)
+
+
+def _json_list(value: Any) -> Any:
+    """JSON-encode a list; strings pass through."""
+    return json_compat.dumps(value) if isinstance(value, list) else value
+
+
+# Optional POST {user_id}/media fields in request order, with their encoder
+_MEDIA_FIELDS = (
+    ("image_url", None),
+    ("video_url", None),
+    ("caption", None),
+    ("content_type", None),
+    ("cover_url", None),
+    ("is_carousel_item", None),
+    ("children", _join),
+    ("location_id", None),
+    ("user_tags", _json_list),
+    ("thumb_offset", None),
+    ("share_to_feed", None),
+    ("audio_name", None),
+    ("collaborators", _join),
+)
 
+# Fields where 0 / False are meaningful; the others are sent only when truthy
+_KEEP_FALSY = frozenset({"thumb_offset", "share_to_feed"})
 
-def create_media_container(
-    make_api_request,
-    get_instagram_user_id,
+
+def _media_params(media_type: str, **values: Any) -> Dict[str, Any]:
+    """Build POST {user_id}/media params from media_type and the optional fields that were set."""
+    return {
+        "media_type": media_type,
+        **{
+            name: encode(value) if encode else value
+            for name, encode in _MEDIA_FIELDS
+            if (value := values.get(name)) is not None and (value or name in _KEEP_FALSY)
+        },
+    }
+
+
+def _child_container_params(media_type: str, url: str) -> Dict[str, Any]:
+    """Params for one carousel child container."""
+    url_field = "video_url" if media_type == "VIDEO" else "image_url"
+    return {"media_type": media_type, "is_carousel_item": True, url_field: url}
+
+
+def _build_batch_payload(user_id: str, child_params: List[Dict[str, Any]]) -> List[Dict[str, str]]:
+    """Build one batch POST {user_id}/media sub-request per child container."""
+    return [
+        {
+            "method": "POST",
+            "relative_url": f"{user_id}/media",
+            "body": urlencode({k: str(v).lower() if isinstance(v, bool) else v for k, v in params.items()}),
+        }
+        for params in child_params
+    ]
+
+
+async def _acquire(n: int = 1, deadline: Optional[float] = None) -> None:
+    """
+    Take n rate limiter tokens, waiting at most until deadline (a time.monotonic() value,
+    default RATE_LIMIT_MAX_WAIT from now). Raises instead of waiting past it.
+    """
+    timeout = RATE_LIMIT_MAX_WAIT if deadline is None else max(0.0, deadline - time.monotonic())
+    if not await _rate_limiter.async_acquire(n, timeout=timeout):
+        raise RuntimeError(_RATE_LIMITED_ERROR)
+
+
+async def _create_child_container(async_make_api_request, user_id: str, params: Dict[str, Any]) -> str:
+    """Create one carousel child container and return its creation_id."""
+    url = params.get("image_url") or params.get("video_url")
+    await _acquire()
+    try:
+        result = await async_make_api_request("POST", f"{user_id}/media", data=params)
+    except Exception as e:
+        raise ValueError(f"Failed to create child media container for {url}: {e}") from e
+    creation_id = result.get("id")
+    if not creation_id:
+        raise ValueError(f"Failed to create child media container for {url}.")
+    return creation_id
+
+
+async def _create_child_containers(
+    async_make_api_request,
+    async_make_batch_request,
+    user_id: str,
+    child_params: List[Dict[str, Any]],
+) -> List[str]:
+    """
+    Create carousel child containers with one batch call, preserving order.
+    Children the batch did not create (or all of them, if the batch call fails) are
+    created with concurrent individual requests.
+    """
+    await _acquire(len(child_params))
+    try:
+        items = await async_make_batch_request(_build_batch_payload(user_id, child_params))
+    except Exception:
+        items = []
+    items = list(items) + [{"code": None, "body": {}}] * (len(child_params) - len(items))
+    
+    # Sub-requests the API never answered were not made; their retries are charged individually
+    _rate_limiter.refund(sum(1 for item in items if item["code"] is None))
+    
+    children = [item["body"].get("id") if item["code"] == 200 else None for item in items]
+    missing = [i for i, creation_id in enumerate(children) if not creation_id]
+    if missing:
+        limit = asyncio.Semaphore(CHILD_CREATE_WORKERS)
+        
+        async def create(i: int) -> str:
+            async with limit:
+                return await _create_child_container(async_make_api_request, user_id, child_params[i])
+        
+        created = await asyncio.gather(*[create(i) for i in missing])
+        for i, creation_id in zip(missing, created):
+            children[i] = creation_id
+    return children
+
+
+async def _get_container_status(
+    async_make_api_request,
+    creation_id: str,
+    deadline: Optional[float] = None,
+) -> Dict[str, Any]:
+    """GET {creation_id}?fields=status_code, reusing a recent or final response from _status_cache."""
+    status_data = _status_cache.get(creation_id)
+    if status_data is None:
+        await _acquire(deadline=deadline)
+        status_data = await async_make_api_request("GET", creation_id, params={"fields": "status_code"})
+        status_code = (status_data.get("status_code") or "").upper()
+        _status_cache.set(creation_id, status_data, ttl=None if status_code in _FINAL_STATUSES else STATUS_CACHE_TTL)
+        if status_code == "FINISHED":
+            _finished_containers.set(creation_id, True)
+    return status_data
+
+
+def _final_status_result(status_data: Dict[str, Any]) -> Optional[ToolResult]:
+    """Result for a container in a final state (ERROR, EXPIRED, PUBLISHED), or None if it can still be published."""
+    status_code = (status_data.get("status_code") or "").upper()
+    if status_code == "ERROR":
+        return ToolResult.failure(
+            f"Media container failed processing: {status_data.get('status', 'Unknown error')}",
+            data=status_data,
+        )
+    if status_code == "EXPIRED":
+        return ToolResult.failure(_EXPIRED_ERROR, data=status_data)
+    if status_code == "PUBLISHED":
+        return ToolResult(status_data, extra={"message": "Media was already published"})
+    return None
+
+
+def _track_new_container(response: Dict[str, Any]) -> None:
+    """Record a just-created container as IN_PROGRESS, so the first status poll waits instead of re-checking at once."""
+    creation_id = response.get("id")
+    if creation_id:
+        _status_cache.set(creation_id, {"status_code": "IN_PROGRESS", "id": creation_id})
+
+
+def _forget_container(creation_id: str) -> None:
+    """Drop cached state for a container this server has just published."""
+    _status_cache.pop(creation_id)
+    _finished_containers.pop(creation_id)
+
+
+async def _check_and_publish(
+    async_make_batch_request,
+    user_id: str,
+    creation_id: str,
+    deadline: Optional[float] = None,
+) -> ToolResult:
+    """
+    Re-check a FINISHED container and publish it in one batch round trip.
+    The publish sub-request depends on the check, so a container that expired in
+    between is reported without another request.
+    """
+    await _acquire(2, deadline)
+    check, publish = await async_make_batch_request([
+        {
+            "method": "GET",
+            "name": "check",
+            "relative_url": f"{creation_id}?fields=status_code",
+            "omit_response_on_success": False,
+        },
+        {
+            "method": "POST",
+            "relative_url": f"{user_id}/media_publish",
+            "body": urlencode({"creation_id": creation_id}),
+            "depends_on": "check",
+        },
+    ])
+    
+    if publish["code"] == 200:
+        _forget_container(creation_id)
+        return ToolResult(publish["body"])
+    
+    _finished_containers.pop(creation_id)
+    status_code = (check["body"].get("status_code") or "").upper()
+    if status_code == "EXPIRED":
+        return ToolResult.failure(_EXPIRED_ERROR, data=check["body"])
+    message = (publish["body"].get("error") or check["body"].get("error") or {}).get("message")
+    return ToolResult.failure(
+        f"Failed to publish media: {message or 'container status ' + (status_code or 'unknown')}",
+        data=check["body"],
+    )
+
+
+@tool_result("create media container")
+async def create_media_container(
+    async_make_api_request,
+    async_get_instagram_user_id,
     image_url: Optional[str] = None,
     video_url: Optional[str] = None,
     caption: Optional[str] = None,
@@ -34,57 +302,45 @@ def create_media_container(
     
     Returns: creation_id to use in subsequent calls
     """
-    try:
-        user_id = get_instagram_user_id(ig_user_id)
-        
-        # Validate that either image_url or video_url is provided
-        if not image_url and not video_url:
-            raise ValueError("Either image_url or video_url must be provided")
-        
-        # Determine media type if not provided
-        if not media_type:
-            if video_url:
-                media_type = "VIDEO"
-            elif image_url:
-                media_type = "IMAGE"
-        else:
-            media_type = media_type.upper()
-            if media_type not in ["IMAGE", "VIDEO"]:
-                raise ValueError(f"media_type must be 'IMAGE' or 'VIDEO', not '{media_type}'")
-        
-        params = {"media_type": media_type}
-        
-        if image_url:
-            params["image_url"] = image_url
+    # Validate that either image_url or video_url is provided
+    if not image_url and not video_url:
+        raise ValueError("Either image_url or video_url must be provided")
+    _check_urls(image_url=image_url, video_url=video_url, cover_url=cover_url)
+    
+    user_id = await async_get_instagram_user_id(ig_user_id)
+    
+    # Determine media type if not provided
+    if not media_type:
         if video_url:
-            params["video_url"] = video_url
-        if caption:
-            params["caption"] = caption
-        if content_type:
-            params["content_type"] = content_type
-        if cover_url:
-            params["cover_url"] = cover_url
-        if is_carousel_item:
-            params["is_carousel_item"] = True
-        
-        response = make_api_request("POST", f"{user_id}/media", data=params)
-        
-        return {
-            "data": response,
-            "error": "",
-            "successful": True
-        }
-    except Exception as e:
-        return {
-            "data": {},
-            "error": f"Failed to create media container: {str(e)}",
-            "successful": False
-        }
+            media_type = "VIDEO"
+        elif image_url:
+            media_type = "IMAGE"
+    else:
+        media_type = media_type.upper()
+        if media_type not in ["IMAGE", "VIDEO"]:
+            raise ValueError(f"media_type must be 'IMAGE' or 'VIDEO', not '{media_type}'")
+    
+    params = _media_params(
+        media_type,
+        image_url=image_url,
+        video_url=video_url,
+        caption=caption,
+        content_type=content_type,
+        cover_url=cover_url,
+        is_carousel_item=bool(is_carousel_item),
+    )
+    
+    await _acquire()
+    response = await async_make_api_request("POST", f"{user_id}/media", data=params)
+    _track_new_container(response)
+    
+    return response
 
 
-def post_ig_user_media(
-    make_api_request,
-    get_instagram_user_id,
+@tool_result("create media container")
+async def post_ig_user_media(
+    async_make_api_request,
+    async_get_instagram_user_id,
     image_url: Optional[str] = None,
     video_url: Optional[str] = None,
     caption: Optional[str] = None,
@@ -107,71 +363,52 @@ def post_ig_user_media(
     
     Returns: creation_id to use in subsequent calls
     """
-    import json
+    # Validate inputs
+    if not image_url and not video_url and not children:
+        raise ValueError("Either image_url, video_url, or children must be provided")
+    _check_urls(image_url=image_url, video_url=video_url, cover_url=cover_url)
     
-    try:
-        user_id = get_instagram_user_id(ig_user_id)
-        
-        # Validate inputs
-        if not image_url and not video_url and not children:
-            raise ValueError("Either image_url, video_url, or children must be provided")
-        
-        # Determine media type if not provided
-        if not media_type:
-            if video_url:
-                media_type = "VIDEO"
-            elif image_url:
-                media_type = "IMAGE"
-            elif children:
-                media_type = "CAROUSEL"
-        else:
-            media_type = media_type.upper()
-        
-        params = {"media_type": media_type}
-        
-        if image_url:
-            params["image_url"] = image_url
+    user_id = await async_get_instagram_user_id(ig_user_id)
+    
+    # Determine media type if not provided
+    if not media_type:
         if video_url:
-            params["video_url"] = video_url
-        if caption:
-            params["caption"] = caption
-        if cover_url:
-            params["cover_url"] = cover_url
-        if is_carousel_item is True:
-            params["is_carousel_item"] = True
-        if children:
-            params["children"] = ",".join(children) if isinstance(children, list) else children
-        if location_id:
-            params["location_id"] = location_id
-        if user_tags:
-            params["user_tags"] = json.dumps(user_tags) if isinstance(user_tags, list) else user_tags
-        if thumb_offset is not None:
-            params["thumb_offset"] = thumb_offset
-        if share_to_feed is not None:
-            params["share_to_feed"] = share_to_feed
-        if audio_name:
-            params["audio_name"] = audio_name
-        if collaborators:
-            params["collaborators"] = ",".join(collaborators) if isinstance(collaborators, list) else collaborators
-        
-        response = make_api_request("POST", f"{user_id}/media", data=params)
-        
-        return {
-            "data": response,
-            "error": "",
-            "successful": True
-        }
-    except Exception as e:
-        return {
-            "data": {},
-            "error": f"Failed to create media container: {str(e)}",
-            "successful": False
-        }
+            media_type = "VIDEO"
+        elif image_url:
+            media_type = "IMAGE"
+        elif children:
+            media_type = "CAROUSEL"
+    else:
+        media_type = media_type.upper()
+    
+    params = _media_params(
+        media_type,
+        image_url=image_url,
+        video_url=video_url,
+        caption=caption,
+        cover_url=cover_url,
+        is_carousel_item=is_carousel_item is True,
+        children=children,
+        location_id=location_id,
+        user_tags=user_tags,
+        thumb_offset=thumb_offset,
+        share_to_feed=share_to_feed,
+        audio_name=audio_name,
+        collaborators=collaborators,
+    )
+    
+    await _acquire()
+    response = await async_make_api_request("POST", f"{user_id}/media", data=params)
+    _track_new_container(response)
+    
+    return response
 
 
-def create_carousel_container(
-    make_api_request,
-    get_instagram_user_id,
+@tool_result("create carousel container")
+async def create_carousel_container(
+    async_make_api_request,
+    async_make_batch_request,
+    async_get_instagram_user_id,
     children: Optional[List[str]] = None,
     child_image_urls: Optional[List[str]] = None,
     child_video_urls: Optional[List[str]] = None,
@@ -187,64 +424,38 @@ def create_carousel_container(
     2. Call this with the container IDs as 'children'
     3. Use CREATE_POST to publish the carousel
     """
-    try:
-        user_id = get_instagram_user_id(ig_user_id)
-        
-        if children and (child_image_urls or child_video_urls):
-            raise ValueError("Provide either children OR child_image_urls/child_video_urls, not both.")
-        
-        # Create child containers if URLs are provided
-        if not children:
-            child_image_urls = child_image_urls or []
-            child_video_urls = child_video_urls or []
-            if not child_image_urls and not child_video_urls:
-                raise ValueError("Provide children or at least one child_image_urls/child_video_urls.")
-            
-            children = []
-            
-            # Create image child containers
-            for url in child_image_urls:
-                params = {"media_type": "IMAGE", "is_carousel_item": True, "image_url": url}
-                result = make_api_request("POST", f"{user_id}/media", data=params)
-                creation_id = result.get("id")
-                if not creation_id:
-                    raise ValueError("Failed to create child media container.")
-                children.append(creation_id)
-            
-            # Create video child containers
-            for url in child_video_urls:
-                params = {"media_type": "VIDEO", "is_carousel_item": True, "video_url": url}
-                result = make_api_request("POST", f"{user_id}/media", data=params)
-                creation_id = result.get("id")
-                if not creation_id:
-                    raise ValueError("Failed to create child media container.")
-                children.append(creation_id)
-        
-        params = {
-            "media_type": "CAROUSEL",
-            "children": ",".join(children)
-        }
-        
-        if caption:
-            params["caption"] = caption
-        
-        response = make_api_request("POST", f"{user_id}/media", data=params)
+    if children and (child_image_urls or child_video_urls):
+        raise ValueError("Provide either children OR child_image_urls/child_video_urls, not both.")
+    _check_urls(child_image_urls=child_image_urls, child_video_urls=child_video_urls)
+    
+    user_id = await async_get_instagram_user_id(ig_user_id)
+    
+    # Create child containers if URLs are provided
+    if not children:
+        child_image_urls = child_image_urls or []
+        child_video_urls = child_video_urls or []
+        if not child_image_urls and not child_video_urls:
+            raise ValueError("Provide children or at least one child_image_urls/child_video_urls.")
         
-        return {
-            "data": response,
-            "error": "",
-            "successful": True
-        }
-    except Exception as e:
-        return {
-            "data": {},
-            "error": f"Failed to create carousel container: {str(e)}",
-            "successful": False
-        }
+        # Create image then video child containers in a single batch round trip
+        child_params = [_child_container_params("IMAGE", url) for url in child_image_urls]
+        child_params += [_child_container_params("VIDEO", url) for url in child_video_urls]
+        children = await _create_child_containers(
+            async_make_api_request, async_make_batch_request, user_id, child_params
+        )
+    
+    params = _media_params("CAROUSEL", children=children, caption=caption)
+    
+    await _acquire()
+    response = await async_make_api_request("POST", f"{user_id}/media", data=params)
+    _track_new_container(response)
+    
+    return response
 
 
-def get_post_status(
-    make_api_request,
+@tool_result("get post status", hints=_POST_STATUS_ERROR_HINTS)
+async def get_post_status(
+    async_make_api_request,
     creation_id: str,
     graph_api_version: Optional[str] = None,
 ) -> Dict[str, Any]:
@@ -258,164 +469,140 @@ def get_post_status(
     - IN_PROGRESS: Still processing
     - PUBLISHED: Already published
     """
-    try:
-        response = make_api_request(
-            "GET",
-            f"{creation_id}",
-            params={"fields": "status_code"}
-        )
-        
-        return {
-            "data": response,
-            "error": "",
-            "successful": True
-        }
-    except Exception as e:
-        error_msg = str(e)
-        if "timeout" in error_msg.lower():
-            return {
-                "data": {},
-                "error": f"Request timed out while checking post status. Try again in a few moments. Error: {error_msg}",
-                "successful": False
-            }
-        return {
-            "data": {},
-            "error": f"Failed to get post status: {error_msg}",
-            "successful": False
-        }
+    return await _get_container_status(async_make_api_request, creation_id)
 
 
-def create_post(
-    make_api_request,
-    get_instagram_user_id,
+@tool_result("create post")
+async def create_post(
+    async_make_api_request,
+    async_get_instagram_user_id,
     creation_id: str,
     graph_api_version: Optional[str] = None,
     ig_user_id: Optional[str] = None,
-) -> Dict[str, Any]:
+) -> Union[ToolResult, Dict[str, Any]]:
     """
     Publish a media container to Instagram.
-    Automatically waits for container to be ready with exponential backoff.
+    Automatically waits up to CREATE_POST_MAX_WAIT seconds for container to be ready
+    with exponential backoff.
     """
-    try:
-        user_id = get_instagram_user_id(ig_user_id)
-        
-        # Check status first and wait if needed
-        max_retries = 15
-        retry_delay = 3
-        
-        for attempt in range(max_retries):
-            status_data = make_api_request("GET", creation_id, params={"fields": "status_code"})
-            status_code = status_data.get("status_code")
-            
-            if status_code == "FINISHED":
-                break
-            if status_code == "ERROR":
-                return {
-                    "data": {},
-                    "error": "Media container processing failed",
-                    "successful": False
-                }
-            
-            if attempt < max_retries - 1:
-                time.sleep(retry_delay)
-                retry_delay = min(retry_delay * 1.5, 10)
-        
-        # Publish the media
-        response = make_api_request(
-            "POST",
-            f"{user_id}/media_publish",
-            data={"creation_id": creation_id}
-        )
+    user_id = await async_get_instagram_user_id(ig_user_id)
+    
+    # Check status first and wait if needed; a container already seen FINISHED is published directly.
+    # Final states are cached without expiry, so the first check answers them without a request.
+    retry_delay = INITIAL_POLL_DELAY
+    deadline = time.monotonic() + CREATE_POST_MAX_WAIT
+    while not _finished_containers.get(creation_id):
+        status_data = await _get_container_status(async_make_api_request, creation_id, deadline)
+        final = _final_status_result(status_data)
+        if final is not None:
+            return final
+        if (status_data.get("status_code") or "").upper() == "FINISHED":
+            break
         
-        return {
-            "data": response,
-            "error": "",
-            "successful": True
-        }
-    except Exception as e:
-        return {
-            "data": {},
-            "error": f"Failed to create post: {str(e)}",
-            "successful": False
-        }
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return ToolResult.failure(
+                f"Media container did not finish processing within {CREATE_POST_MAX_WAIT}s. "
+                "Use GET_POST_STATUS to check manually.",
+                data={"creation_id": creation_id},
+            )
+        await asyncio.sleep(min(retry_delay, remaining))
+        retry_delay = min(retry_delay * 2, MAX_POLL_DELAY)
+    
+    # Publish the media
+    await _acquire(deadline=deadline)
+    response = await async_make_api_request(
+        "POST",
+        f"{user_id}/media_publish",
+        data={"creation_id": creation_id}
+    )
+    _forget_container(creation_id)
+    
+    return response
 
 
-def post_ig_user_media_publish(
-    make_api_request,
-    get_instagram_user_id,
+@tool_result("publish media")
+async def post_ig_user_media_publish(
+    async_make_api_request,
+    async_make_batch_request,
+    async_get_instagram_user_id,
     creation_id: str,
     max_wait_seconds: int = 45,
     poll_interval_seconds: int = 3,
     graph_api_version: Optional[str] = None,
     ig_user_id: Optional[str] = None,
-) -> Dict[str, Any]:
+) -> Union[ToolResult, Dict[str, Any]]:
     """
     Publish a media container with automatic status polling.
     Automatically waits for container to finish processing.
+    Status checks start INITIAL_POLL_DELAY apart and double up to poll_interval_seconds
+    (at most MAX_POLL_DELAY). Once FINISHED, a final status check and the publish
+    go out together in one batch request.
     Rate limited to 25 posts per 24 hours.
     """
-    try:
-        user_id = get_instagram_user_id(ig_user_id)
-        
-        max_wait = min(max_wait_seconds or 45, 45)
-        poll_interval = poll_interval_seconds or 3
-        max_retries = max_wait // poll_interval if poll_interval > 0 else 15
-        
-        start_time = time.time()
-        for attempt in range(max_retries):
-            elapsed = time.time() - start_time
-            if elapsed >= max_wait:
-                return {
-                    "data": {},
-                    "error": f"Media container did not finish processing within {max_wait} seconds.",
-                    "successful": False
-                }
-            
-            status_data = make_api_request("GET", creation_id, params={"fields": "status_code"})
-            status_code = status_data.get("status_code", "").upper()
-            
-            if status_code == "FINISHED":
-                response = make_api_request(
-                    "POST",
-                    f"{user_id}/media_publish",
-                    data={"creation_id": creation_id}
-                )
-                return {
-                    "data": response,
-                    "error": "",
-                    "successful": True
-                }
-            elif status_code == "ERROR":
-                return {
-                    "data": status_data,
-                    "error": f"Media container failed processing: {status_data.get('status', 'Unknown error')}",
-                    "successful": False
-                }
-            elif status_code == "EXPIRED":
-                return {
-                    "data": status_data,
-                    "error": "Media container has expired. Create a new one.",
-                    "successful": False
-                }
-            elif status_code == "PUBLISHED":
-                return {
-                    "data": status_data,
-                    "error": "",
-                    "successful": True,
-                    "message": "Media was already published"
-                }
-            
-            time.sleep(poll_interval)
-        
-        return {
-            "data": {"creation_id": creation_id},
-            "error": f"Timeout after {max_wait}s. Use GET_POST_STATUS to check manually.",
-            "successful": False
-        }
+    user_id = await async_get_instagram_user_id(ig_user_id)
+    
+    # Zero or negative inputs fall back to sane bounds instead of a tight polling loop
+    max_wait = max(1, min(max_wait_seconds or 45, 45))
+    max_delay = min(max(poll_interval_seconds or 3, 1), MAX_POLL_DELAY)
+    delay = INITIAL_POLL_DELAY
+    
+    deadline = time.monotonic() + max_wait
+    if _finished_containers.get(creation_id):
+        return await _check_and_publish(async_make_batch_request, user_id, creation_id, deadline)
+    
+    while True:
+        status_data = await _get_container_status(async_make_api_request, creation_id, deadline)
+        final = _final_status_result(status_data)
+        if final is not None:
+            return final
+        if (status_data.get("status_code") or "").upper() == "FINISHED":
+            return await _check_and_publish(async_make_batch_request, user_id, creation_id, deadline)
         
-    except Exception as e:
-        return {
-            "data": {},
-            "error": f"Failed to publish media: {str(e)}",
-            "successful": False
-        }
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+        await asyncio.sleep(min(delay, remaining))
+        delay = max_delay if _rate_limiter.tokens < RATE_LIMIT_LOW_WATER else min(delay * 2, max_delay)
+    
+    return ToolResult.failure(
+        f"Timeout after {max_wait}s. Use GET_POST_STATUS to check manually.",
+        data={"creation_id": creation_id},
+    )
+
+
+@tool_result("publish media")
+async def publish_many(
+    async_make_api_request,
+    async_make_batch_request,
+    async_get_instagram_user_id,
+    creation_ids: List[str],
+    max_wait_seconds: int = 45,
+    poll_interval_seconds: int = 3,
+    graph_api_version: Optional[str] = None,
+    ig_user_id: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Publish several media containers concurrently.
+    
+    Each container is polled and published like POST_IG_USER_MEDIA_PUBLISH, so the
+    whole call waits about as long as the slowest container. 'data' maps each
+    creation_id to its POST_IG_USER_MEDIA_PUBLISH result.
+    """
+    user_id = await async_get_instagram_user_id(ig_user_id)
+    
+    results = await asyncio.gather(*[
+        post_ig_user_media_publish(
+            async_make_api_request,
+            async_make_batch_request,
+            async_get_instagram_user_id,
+            creation_id,
+            max_wait_seconds=max_wait_seconds,
+            poll_interval_seconds=poll_interval_seconds,
+            graph_api_version=graph_api_version,
+            ig_user_id=user_id,
+        )
+        for creation_id in creation_ids
+    ])
+    
+    return {creation_id: result.to_dict() for creation_id, result in zip(creation_ids, results)}
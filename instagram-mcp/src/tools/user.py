@@ -8,12 +8,54 @@ Tools for retrieving user profile information:
 - Username lookup
 """
 
-from typing import Optional, Dict, Any
+import re
+from typing import Optional, Dict, Any, Union
+from urllib.parse import urlencode
 
+from src.cache import TTLCache
+from src.results import ToolResult, tool_result
 
-def get_user_info(
-    make_api_request,
-    get_instagram_user_id,
+# Default fields requested when the caller does not pass any
+_DEFAULT_USER_INFO_FIELDS = "id,username,website,biography,profile_picture_url,followers_count,follows_count,media_count"
+_DEFAULT_USER_MEDIA_FIELDS = "id,caption,media_type,media_url,permalink,thumbnail_url,timestamp,username"
+_DEFAULT_STORY_FIELDS = "id,media_type,media_url,permalink,timestamp"
+_DEFAULT_TAGGED_MEDIA_FIELDS = "id,caption,media_type,media_url,permalink,timestamp,username"
+_DEFAULT_PUBLISHING_LIMIT_FIELDS = "quota_usage,config"
+_DEFAULT_LIVE_MEDIA_FIELDS = "id,media_type,media_url,timestamp,permalink"
+
+# business_discovery field expansion; the username goes between prefix and suffix
+_BD_PREFIX = "business_discovery.username("
+_BD_SUFFIX = "){id,username,name,profile_picture_url,biography,followers_count,follows_count,media_count}"
+
+_FIELD_AVAILABILITY_NOTE = " Note: Some fields may not be available for all account types."
+_USER_INFO_ERROR_HINTS = ((re.compile(r"nonexisting field|#100", re.IGNORECASE), _FIELD_AVAILABILITY_NOTE),)
+
+# Profile info changes rarely; reuse it for a minute across tool calls
+_user_info_cache = TTLCache(maxsize=128, ttl=60)
+
+
+def _batch_get(endpoint: str, params: Dict[str, Any]) -> Dict[str, str]:
+    """Build a GET sub-request for the Graph API batch endpoint."""
+    return {"method": "GET", "relative_url": f"{endpoint}?{urlencode(params)}"}
+
+
+def _batch_result(item: Dict[str, Any], action: str, paged: bool = True) -> ToolResult:
+    """Convert one batch response entry into the standard tool result shape."""
+    body = item["body"]
+    if item["code"] == 200:
+        if not paged:
+            return ToolResult(body)
+        return ToolResult.page(body)
+    message = body.get("error", {}).get("message") or f"HTTP {item['code']}"
+    if not paged:
+        return ToolResult.failure(f"Failed to {action}: {message}")
+    return ToolResult.failure(f"Failed to {action}: {message}", data=[], paging={})
+
+
+@tool_result("get user info", hints=_USER_INFO_ERROR_HINTS)
+async def get_user_info(
+    async_make_api_request,
+    async_get_instagram_user_id,
     graph_api_version: Optional[str] = None,
     ig_user_id: Optional[str] = None,
 ) -> Dict[str, Any]:
@@ -23,36 +65,25 @@ def get_user_info(
     Returns: username, name, biography, profile_picture_url, 
              followers_count, follows_count, media_count, website
     """
-    try:
-        user_id = get_instagram_user_id(ig_user_id)
-        
-        response = make_api_request(
+    user_id = await async_get_instagram_user_id(ig_user_id)
+    cache_key = (user_id, _DEFAULT_USER_INFO_FIELDS)
+    
+    response = _user_info_cache.get(cache_key)
+    if response is None:
+        response = await async_make_api_request(
             "GET",
             f"{user_id}",
-            params={
-                "fields": "id,username,website,biography,profile_picture_url,followers_count,follows_count,media_count"
-            }
+            params={"fields": _DEFAULT_USER_INFO_FIELDS}
         )
-        
-        return {
-            "data": response,
-            "error": "",
-            "successful": True
-        }
-    except Exception as e:
-        error_msg = str(e)
-        if "nonexisting field" in error_msg.lower() or "#100" in error_msg:
-            error_msg += " Note: Some fields may not be available for all account types."
-        return {
-            "data": {},
-            "error": f"Failed to get user info: {error_msg}",
-            "successful": False
-        }
+        _user_info_cache.set(cache_key, response)
+    
+    return response
 
 
-def get_user_media(
-    make_api_request,
-    get_instagram_user_id,
+@tool_result("get user media", empty=list, paging=True)
+async def get_user_media(
+    async_make_api_request,
+    async_get_instagram_user_id,
     limit: int = 25,
     after: Optional[str] = None,
     graph_api_version: Optional[str] = None,
@@ -61,36 +92,18 @@ def get_user_media(
     """
     Get Instagram user's media (posts, photos, videos).
     """
-    try:
-        user_id = get_instagram_user_id(ig_user_id)
-        
-        params = {}
-        if limit:
-            params["limit"] = limit
-        if after:
-            params["after"] = after
-        
-        response = make_api_request("GET", f"{user_id}/media", params=params)
-        
-        return {
-            "data": response.get("data", []),
-            "paging": response.get("paging", {}),
-            "error": "",
-            "successful": True
-        }
-    except Exception as e:
-        return {
-            "data": [],
-            "paging": {},
-            "error": f"Failed to get user media: {str(e)}",
-            "successful": False
-        }
+    user_id = await async_get_instagram_user_id(ig_user_id)
+    
+    params = {k: v for k, v in (("limit", limit), ("after", after)) if v}
+    
+    return await async_make_api_request("GET", f"{user_id}/media", params=params)
 
 
-def get_ig_user_media(
-    make_api_request,
-    get_instagram_user_id,
-    fields: str = "id,caption,media_type,media_url,permalink,thumbnail_url,timestamp,username",
+@tool_result("get user media", empty=list, paging=True)
+async def get_ig_user_media(
+    async_make_api_request,
+    async_get_instagram_user_id,
+    fields: Optional[str] = None,
     limit: int = 25,
     after: Optional[str] = None,
     before: Optional[str] = None,
@@ -103,45 +116,21 @@ def get_ig_user_media(
     Get Instagram user's media collection with custom fields and filtering.
     Returns media objects with 'id' field for use in other tools.
     """
-    try:
-        user_id = get_instagram_user_id(ig_user_id)
-        
-        params = {
-            "fields": fields or "id,caption,media_type,media_url,permalink,thumbnail_url,timestamp,username"
-        }
-        
-        if limit:
-            params["limit"] = limit
-        if after:
-            params["after"] = after
-        if before:
-            params["before"] = before
-        if since:
-            params["since"] = since
-        if until:
-            params["until"] = until
-        
-        response = make_api_request("GET", f"{user_id}/media", params=params)
-        
-        return {
-            "data": response.get("data", []),
-            "paging": response.get("paging", {}),
-            "error": "",
-            "successful": True
-        }
-    except Exception as e:
-        return {
-            "data": [],
-            "paging": {},
-            "error": f"Failed to get user media: {str(e)}",
-            "successful": False
-        }
+    user_id = await async_get_instagram_user_id(ig_user_id)
+    
+    params = {
+        "fields": fields or _DEFAULT_USER_MEDIA_FIELDS,
+        **{k: v for k, v in (("limit", limit), ("after", after), ("before", before), ("since", since), ("until", until)) if v}
+    }
+    
+    return await async_make_api_request("GET", f"{user_id}/media", params=params)
 
 
-def get_ig_user_stories(
-    make_api_request,
-    get_instagram_user_id,
-    fields: str = "id,media_type,media_url,permalink,timestamp",
+@tool_result("get user stories", empty=list, paging=True)
+async def get_ig_user_stories(
+    async_make_api_request,
+    async_get_instagram_user_id,
+    fields: Optional[str] = None,
     limit: Optional[int] = None,
     after: Optional[str] = None,
     before: Optional[str] = None,
@@ -152,41 +141,21 @@ def get_ig_user_stories(
     Get active story media objects for an Instagram Business or Creator account.
     Note: Stories are only available for 24 hours after posting.
     """
-    try:
-        user_id = get_instagram_user_id(ig_user_id)
-        
-        params = {
-            "fields": fields or "id,media_type,media_url,permalink,timestamp"
-        }
-        
-        if limit:
-            params["limit"] = limit
-        if after:
-            params["after"] = after
-        if before:
-            params["before"] = before
-        
-        response = make_api_request("GET", f"{user_id}/stories", params=params)
-        
-        return {
-            "data": response.get("data", []),
-            "paging": response.get("paging", {}),
-            "error": "",
-            "successful": True
-        }
-    except Exception as e:
-        return {
-            "data": [],
-            "paging": {},
-            "error": f"Failed to get user stories: {str(e)}",
-            "successful": False
-        }
+    user_id = await async_get_instagram_user_id(ig_user_id)
+    
+    params = {
+        "fields": fields or _DEFAULT_STORY_FIELDS,
+        **{k: v for k, v in (("limit", limit), ("after", after), ("before", before)) if v}
+    }
+    
+    return await async_make_api_request("GET", f"{user_id}/stories", params=params)
 
 
-def get_ig_user_tags(
-    make_api_request,
-    get_instagram_user_id,
-    fields: str = "id,caption,media_type,media_url,permalink,timestamp,username",
+@tool_result("get user tags", empty=list, paging=True)
+async def get_ig_user_tags(
+    async_make_api_request,
+    async_get_instagram_user_id,
+    fields: Optional[str] = None,
     limit: int = 25,
     after: Optional[str] = None,
     before: Optional[str] = None,
@@ -196,41 +165,21 @@ def get_ig_user_tags(
     """
     Get Instagram media where the user has been tagged by other users.
     """
-    try:
-        user_id = get_instagram_user_id(ig_user_id)
-        
-        params = {
-            "fields": fields or "id,caption,media_type,media_url,permalink,timestamp,username"
-        }
-        
-        if limit:
-            params["limit"] = limit
-        if after:
-            params["after"] = after
-        if before:
-            params["before"] = before
-        
-        response = make_api_request("GET", f"{user_id}/tags", params=params)
-        
-        return {
-            "data": response.get("data", []),
-            "paging": response.get("paging", {}),
-            "error": "",
-            "successful": True
-        }
-    except Exception as e:
-        return {
-            "data": [],
-            "paging": {},
-            "error": f"Failed to get user tags: {str(e)}",
-            "successful": False
-        }
+    user_id = await async_get_instagram_user_id(ig_user_id)
+    
+    params = {
+        "fields": fields or _DEFAULT_TAGGED_MEDIA_FIELDS,
+        **{k: v for k, v in (("limit", limit), ("after", after), ("before", before)) if v}
+    }
+    
+    return await async_make_api_request("GET", f"{user_id}/tags", params=params)
 
 
-def get_ig_user_content_publishing_limit(
-    make_api_request,
-    get_instagram_user_id,
-    fields: str = "quota_usage,config",
+@tool_result("get content publishing limit", empty=list)
+async def get_ig_user_content_publishing_limit(
+    async_make_api_request,
+    async_get_instagram_user_id,
+    fields: Optional[str] = None,
     graph_api_version: Optional[str] = None,
     ig_user_id: Optional[str] = None,
 ) -> Dict[str, Any]:
@@ -238,32 +187,22 @@ def get_ig_user_content_publishing_limit(
     Get an Instagram Business Account's current content publishing usage.
     Use this to monitor quota usage and avoid hitting rate limits.
     """
-    try:
-        user_id = get_instagram_user_id(ig_user_id)
-        
-        response = make_api_request(
-            "GET",
-            f"{user_id}/content_publishing_limit",
-            params={"fields": fields or "quota_usage,config"}
-        )
-        
-        return {
-            "data": response.get("data", []),
-            "error": "",
-            "successful": True
-        }
-    except Exception as e:
-        return {
-            "data": [],
-            "error": f"Failed to get content publishing limit: {str(e)}",
-            "successful": False
-        }
+    user_id = await async_get_instagram_user_id(ig_user_id)
+    
+    response = await async_make_api_request(
+        "GET",
+        f"{user_id}/content_publishing_limit",
+        params={"fields": fields or _DEFAULT_PUBLISHING_LIMIT_FIELDS}
+    )
+    
+    return response.get("data") or []
 
 
-def get_ig_user_live_media(
-    make_api_request,
-    get_instagram_user_id,
-    fields: str = "id,media_type,media_url,timestamp,permalink",
+@tool_result("get live media", empty=list, paging=True)
+async def get_ig_user_live_media(
+    async_make_api_request,
+    async_get_instagram_user_id,
+    fields: Optional[str] = None,
     graph_api_version: Optional[str] = None,
     ig_user_id: Optional[str] = None,
 ) -> Dict[str, Any]:
@@ -271,81 +210,86 @@ def get_ig_user_live_media(
     Get live media objects during an active Instagram broadcast.
     Returns the live video media ID and metadata.
     """
-    try:
-        user_id = get_instagram_user_id(ig_user_id)
-        
-        response = make_api_request(
-            "GET",
-            f"{user_id}/live_media",
-            params={"fields": fields or "id,media_type,media_url,timestamp,permalink"}
-        )
-        
-        return {
-            "data": response.get("data", []),
-            "paging": response.get("paging", {}),
-            "error": "",
-            "successful": True
-        }
-    except Exception as e:
-        return {
-            "data": [],
-            "paging": {},
-            "error": f"Failed to get live media: {str(e)}",
-            "successful": False
-        }
+    user_id = await async_get_instagram_user_id(ig_user_id)
+    
+    return await async_make_api_request(
+        "GET",
+        f"{user_id}/live_media",
+        params={"fields": fields or _DEFAULT_LIVE_MEDIA_FIELDS}
+    )
 
 
-def get_user_by_username(
-    make_api_request,
-    get_instagram_user_id,
+@tool_result("get user by username")
+async def get_user_by_username(
+    async_make_api_request,
+    async_get_instagram_user_id,
     username: str,
     ig_user_id: Optional[str] = None,
     graph_api_version: Optional[str] = None,
-) -> Dict[str, Any]:
+) -> Union[ToolResult, Dict[str, Any]]:
     """
     Find an Instagram user's ID by their username using Business Discovery API.
     IMPORTANT: Only works for Business or Creator accounts, not personal accounts.
     """
-    try:
-        user_id = get_instagram_user_id(ig_user_id)
-        
-        # Remove @ if present
-        clean_username = username.lstrip("@")
-        
-        response = make_api_request(
-            "GET",
-            f"{user_id}",
-            params={
-                "fields": f"business_discovery.username({clean_username}){{id,username,name,profile_picture_url,biography,followers_count,follows_count,media_count}}"
-            }
-        )
-        
-        if "business_discovery" in response:
-            user_info = response["business_discovery"]
-            return {
-                "data": {
-                    "instagram_user_id": user_info.get("id"),
-                    "username": user_info.get("username"),
-                    "name": user_info.get("name"),
-                    "profile_picture_url": user_info.get("profile_picture_url"),
-                    "biography": user_info.get("biography"),
-                    "followers_count": user_info.get("followers_count"),
-                    "follows_count": user_info.get("follows_count"),
-                    "media_count": user_info.get("media_count")
-                },
-                "error": "",
-                "successful": True
-            }
-        else:
-            return {
-                "data": {},
-                "error": "User not found or account is not a Business/Creator account",
-                "successful": False
-            }
-        
-    except Exception as e:
+    user_id = await async_get_instagram_user_id(ig_user_id)
+    
+    # Remove @ if present
+    clean_username = username.lstrip("@")
+    
+    response = await async_make_api_request(
+        "GET",
+        f"{user_id}",
+        params={"fields": _BD_PREFIX + clean_username + _BD_SUFFIX}
+    )
+    
+    if "business_discovery" in response:
+        user_info = response["business_discovery"]
         return {
-            "data": {},
-            "error": f"Failed to get user by username: {str(e)}",
-            "successful": False
+            "instagram_user_id": user_info.get("id"),
+            "username": user_info.get("username"),
+            "name": user_info.get("name"),
+            "profile_picture_url": user_info.get("profile_picture_url"),
+            "biography": user_info.get("biography"),
+            "followers_count": user_info.get("followers_count"),
+            "follows_count": user_info.get("follows_count"),
+            "media_count": user_info.get("media_count")
         }
+    return ToolResult.failure("User not found or account is not a Business/Creator account")
+
+
+@tool_result("get user overview")
+async def get_user_overview(
+    async_make_batch_request,
+    async_get_instagram_user_id,
+    media_limit: int = 25,
+    graph_api_version: Optional[str] = None,
+    ig_user_id: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Get profile info, recent media, active stories, and tagged media in one batched API call.
+    Each section has the same shape as the corresponding single tool's result.
+    """
+    user_id = await async_get_instagram_user_id(ig_user_id)
+    
+    items = await async_make_batch_request([
+        _batch_get(f"{user_id}", {
+            "fields": _DEFAULT_USER_INFO_FIELDS
+        }),
+        _batch_get(f"{user_id}/media", {
+            "fields": _DEFAULT_USER_MEDIA_FIELDS,
+            "limit": media_limit or 25
+        }),
+        _batch_get(f"{user_id}/stories", {"fields": _DEFAULT_STORY_FIELDS}),
+        _batch_get(f"{user_id}/tags", {
+            "fields": _DEFAULT_TAGGED_MEDIA_FIELDS,
+            "limit": media_limit or 25
+        }),
+    ])
+    info, media, stories, tags = items
+    
+    return {
+        "info": _batch_result(info, "get user info", paged=False).to_dict(),
+        "media": _batch_result(media, "get user media").to_dict(),
+        "stories": _batch_result(stories, "get user stories").to_dict(),
+        "tags": _batch_result(tags, "get user tags").to_dict(),
+    }
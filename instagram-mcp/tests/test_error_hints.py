@@ -0,0 +1,66 @@
+"""
+Error hint priority for Graph API error messages.
+
+Graph API errors start with a "(#code)" prefix, so hints must be chosen in
+priority order rather than by the leftmost match in the message.
+
+Run from instagram-mcp/: python -m unittest discover tests
+"""
+
+import unittest
+
+from src.results import error_hint
+from src.tools import insights, messaging
+
+
+class InsightsErrorHintTests(unittest.TestCase):
+    def test_user_insights_invalid_metric_gets_metrics_hint(self):
+        msg = "(#100) metric[0] must be one of the following values: reach, follower_count, website_clicks"
+        self.assertIn("Valid metrics:", error_hint(msg, insights._USER_INSIGHTS_ERROR_HINTS))
+
+    def test_user_insights_metric_type_gets_metric_type_hint(self):
+        msg = "(#100) The following metrics (accounts_engaged) should be specified with parameter metric_type=total_value"
+        self.assertIn("metric_type='total_value'", error_hint(msg, insights._USER_INSIGHTS_ERROR_HINTS))
+
+    def test_user_insights_permission_error_gets_permission_hint(self):
+        msg = "(#10) Application does not have permission for this action"
+        self.assertEqual(error_hint(msg, insights._USER_INSIGHTS_ERROR_HINTS), insights._PERMISSION_HINT)
+
+    def test_post_insights_impressions_gets_impressions_hint(self):
+        msg = "(#100) The impressions metric is no longer supported for media created after July 2, 2024"
+        self.assertEqual(error_hint(msg, insights._POST_INSIGHTS_ERROR_HINTS), insights._IMPRESSIONS_HINT)
+
+    def test_media_insights_impressions_gets_impressions_hint(self):
+        msg = "(#100) The impressions metric is no longer supported for media created after July 2, 2024"
+        self.assertEqual(error_hint(msg, insights._MEDIA_INSIGHTS_ERROR_HINTS), insights._IMPRESSIONS_HINT)
+
+    def test_media_insights_invalid_metric_gets_metrics_hint(self):
+        msg = "(#100) metric[0] must be one of the following values: reach, likes, comments, shares, saved"
+        self.assertIn("Common valid metrics:", error_hint(msg, insights._MEDIA_INSIGHTS_ERROR_HINTS))
+
+    def test_unrelated_error_gets_no_hint(self):
+        self.assertEqual(error_hint("Invalid OAuth access token.", insights._MEDIA_INSIGHTS_ERROR_HINTS), "")
+
+
+class MessagingErrorHintTests(unittest.TestCase):
+    def test_send_message_capability_wins_over_100_prefix(self):
+        msg = "(#100) This Page does not have the capability to send messages to this user"
+        self.assertEqual(
+            error_hint(msg, messaging._SEND_MESSAGE_ERROR_HINTS),
+            " The recipient must message you first.",
+        )
+
+    def test_send_message_100_gets_recipient_hint(self):
+        msg = "(#100) No matching user found"
+        self.assertEqual(
+            error_hint(msg, messaging._SEND_MESSAGE_ERROR_HINTS),
+            " The recipient hasn't messaged you first or recipient_id is incorrect.",
+        )
+
+    def test_mark_seen_server_error_gets_sender_action_hint(self):
+        msg = "500 Server Error: Internal Server Error for url: https://graph.facebook.com/v21.0/me/messages"
+        self.assertIn("sender_action", error_hint(msg, messaging._MARK_SEEN_ERROR_HINTS))
+
+
+if __name__ == "__main__":
+    unittest.main()
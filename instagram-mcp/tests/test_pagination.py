@@ -0,0 +1,81 @@
+"""
+Async cursor pagination with next-page prefetch.
+
+Run from instagram-mcp/: python -m unittest discover tests
+"""
+
+import asyncio
+import unittest
+
+from src.pagination import iter_pages
+
+
+class FakePagedApi:
+    """async_make_api_request serving pages of an edge by 'after' cursor, recording each request."""
+
+    def __init__(self, pages):
+        self.pages = pages
+        self.requests = []
+        self.cancelled = []
+
+    async def __call__(self, method, endpoint, params=None, **kwargs):
+        after = (params or {}).get("after")
+        self.requests.append((endpoint, dict(params or {})))
+        index = int(after) if after else 0
+        try:
+            # Yield to the event loop like a real request, so a prefetch can be left pending
+            await asyncio.sleep(0)
+            await asyncio.sleep(0)
+        except asyncio.CancelledError:
+            self.cancelled.append(index)
+            raise
+        response = {"data": self.pages[index]}
+        if index + 1 < len(self.pages):
+            response["paging"] = {"cursors": {"after": str(index + 1)}, "next": f"https://graph/?after={index + 1}"}
+        return response
+
+
+def collect(agen, stop_after=None):
+    async def run():
+        pages = []
+        async for page in agen:
+            pages.append(page)
+            # Process the page; this lets the prefetch of the next one start
+            await asyncio.sleep(0)
+            if stop_after is not None and len(pages) >= stop_after:
+                break
+        await agen.aclose()
+        return pages
+    return asyncio.run(run())
+
+
+class IterPagesTests(unittest.TestCase):
+    def test_pages_are_yielded_in_order(self):
+        api = FakePagedApi([[1, 2], [3], [4, 5]])
+        pages = collect(iter_pages(api, "123/comments", {"limit": 2}))
+        self.assertEqual(pages, [[1, 2], [3], [4, 5]])
+        self.assertEqual(
+            [params for _, params in api.requests],
+            [{"limit": 2}, {"limit": 2, "after": "1"}, {"limit": 2, "after": "2"}],
+        )
+
+    def test_max_pages_stops_without_prefetching_more(self):
+        api = FakePagedApi([[1], [2], [3]])
+        pages = collect(iter_pages(api, "123/comments", max_pages=2))
+        self.assertEqual(pages, [[1], [2]])
+        self.assertEqual(len(api.requests), 2)
+
+    def test_pending_prefetch_is_cancelled_when_consumer_stops(self):
+        api = FakePagedApi([[1], [2], [3]])
+        pages = collect(iter_pages(api, "123/comments"), stop_after=1)
+        self.assertEqual(pages, [[1]])
+        self.assertEqual(api.cancelled, [1])
+
+    def test_empty_response_yields_empty_page(self):
+        async def empty(method, endpoint, params=None, **kwargs):
+            return {}
+        self.assertEqual(collect(iter_pages(empty, "123/tags")), [[]])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,105 @@
+"""
+Container status caching in the publishing tools.
+
+Final container states are cached without expiry, other states for
+STATUS_CACHE_TTL seconds, and a published container is forgotten.
+
+Run from instagram-mcp/: python -m unittest discover tests
+"""
+
+import asyncio
+import types
+import unittest
+from unittest import mock
+
+from src.ratelimit import TokenBucket
+from src.tools import publishing
+
+
+class FakeClock:
+    """Stand-in for the time module whose monotonic() only moves when advanced."""
+
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
+
+
+class FakeApi:
+    """async_make_api_request that answers status checks with status_code and records every call."""
+
+    def __init__(self, status_code: str):
+        self.status_code = status_code
+        self.calls = []
+
+    async def __call__(self, method, endpoint, params=None, data=None, **kwargs):
+        self.calls.append((method, endpoint))
+        if method == "GET":
+            return {"status_code": self.status_code, "id": endpoint}
+        return {"id": "media-1"}
+
+
+async def fake_get_instagram_user_id(ig_user_id=None):
+    return ig_user_id or "user-1"
+
+
+class ContainerStatusCacheTests(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        patches = [
+            mock.patch("src.cache.time", types.SimpleNamespace(monotonic=self.clock.monotonic)),
+            mock.patch.object(publishing, "_rate_limiter", TokenBucket(rate=1, capacity=100)),
+        ]
+        for patcher in patches:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        publishing._status_cache.clear()
+        publishing._finished_containers.clear()
+        self.addCleanup(publishing._status_cache.clear)
+        self.addCleanup(publishing._finished_containers.clear)
+
+    def get_status(self, api, creation_id="container-1"):
+        return asyncio.run(publishing._get_container_status(api, creation_id))
+
+    def test_final_state_is_served_from_cache_without_request(self):
+        api = FakeApi("EXPIRED")
+        self.get_status(api)
+        self.clock.advance(3600)
+        self.assertEqual(self.get_status(api)["status_code"], "EXPIRED")
+        self.assertEqual(len(api.calls), 1)
+
+    def test_create_post_answers_cached_expired_container_without_requests(self):
+        publishing._status_cache.set("container-1", {"status_code": "EXPIRED"}, ttl=None)
+        api = FakeApi("FINISHED")
+        result = asyncio.run(publishing.create_post(api, fake_get_instagram_user_id, "container-1"))
+        self.assertFalse(result.successful)
+        self.assertEqual(result.error, publishing._EXPIRED_ERROR)
+        self.assertEqual(api.calls, [])
+
+    def test_finished_expires_after_status_cache_ttl(self):
+        api = FakeApi("FINISHED")
+        self.get_status(api)
+        self.clock.advance(publishing.STATUS_CACHE_TTL / 2)
+        self.get_status(api)
+        self.assertEqual(len(api.calls), 1)
+
+        self.clock.advance(publishing.STATUS_CACHE_TTL)
+        self.get_status(api)
+        self.assertEqual(len(api.calls), 2)
+        self.assertTrue(publishing._finished_containers.get("container-1"))
+
+    def test_published_container_is_forgotten(self):
+        api = FakeApi("FINISHED")
+        result = asyncio.run(publishing.create_post(api, fake_get_instagram_user_id, "container-1"))
+        self.assertTrue(result.successful)
+        self.assertEqual(api.calls, [("GET", "container-1"), ("POST", "user-1/media_publish")])
+        self.assertIsNone(publishing._status_cache.get("container-1"))
+        self.assertIsNone(publishing._finished_containers.get("container-1"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,116 @@
+"""
+Token bucket used to rate limit the publishing tools.
+
+The bucket may go into debt (callers then wait for the refill), but never
+further than a caller's timeout allows.
+
+Run from instagram-mcp/: python -m unittest discover tests
+"""
+
+import asyncio
+import types
+import unittest
+from unittest import mock
+
+from src.ratelimit import TokenBucket
+from src.tools import publishing
+
+
+class FakeClock:
+    """Stand-in for the time module: monotonic() only moves when advanced or slept on."""
+
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+        self.sleeps = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+    async def async_sleep(self, seconds: float) -> None:
+        self.sleep(seconds)
+
+
+class TokenBucketTests(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        patches = [
+            mock.patch("src.ratelimit.time", types.SimpleNamespace(monotonic=self.clock.monotonic, sleep=self.clock.sleep)),
+            mock.patch("src.ratelimit.asyncio", types.SimpleNamespace(sleep=self.clock.async_sleep)),
+        ]
+        for patcher in patches:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        # Two tokens, one added every two seconds
+        self.bucket = TokenBucket(rate=0.5, capacity=2)
+
+    def test_reserve_goes_into_debt(self):
+        self.assertEqual(self.bucket._reserve(2), 0.0)
+        self.assertEqual(self.bucket._reserve(1), 2.0)
+        self.assertEqual(self.bucket._reserve(1), 4.0)
+        self.assertEqual(self.bucket.tokens, -2)
+
+    def test_debt_is_paid_back_by_refill(self):
+        self.bucket._reserve(3)
+        self.clock.now += 3
+        self.assertEqual(self.bucket.tokens, 0.5)
+        self.clock.now += 60
+        self.assertEqual(self.bucket.tokens, 2)
+
+    def test_reserve_over_timeout_takes_nothing(self):
+        self.bucket._reserve(2)
+        self.assertIsNone(self.bucket._reserve(1, timeout=1))
+        self.assertEqual(self.bucket.tokens, 0)
+        self.assertEqual(self.bucket._reserve(1, timeout=2), 2.0)
+
+    def test_refund_returns_tokens_up_to_capacity(self):
+        self.bucket._reserve(3)
+        self.bucket.refund(2)
+        self.assertEqual(self.bucket.tokens, 1)
+        self.bucket.refund(5)
+        self.assertEqual(self.bucket.tokens, 2)
+
+    def test_acquire_sleeps_for_the_debt(self):
+        self.assertTrue(self.bucket.acquire(3))
+        self.assertEqual(self.clock.sleeps, [2.0])
+
+    def test_async_acquire_sleeps_for_the_debt(self):
+        self.assertTrue(asyncio.run(self.bucket.async_acquire(3)))
+        self.assertEqual(self.clock.sleeps, [2.0])
+
+    def test_async_acquire_over_timeout_returns_false_without_waiting(self):
+        self.bucket._reserve(2)
+        self.assertFalse(asyncio.run(self.bucket.async_acquire(1, timeout=1)))
+        self.assertEqual(self.clock.sleeps, [])
+        self.assertEqual(self.bucket.tokens, 0)
+
+
+class PublishingRateLimitTests(unittest.TestCase):
+    def test_drained_limiter_fails_instead_of_waiting(self):
+        calls = []
+
+        async def fake_request(method, endpoint, params=None, data=None, **kwargs):
+            calls.append((method, endpoint))
+            return {"status_code": "IN_PROGRESS"}
+
+        async def fake_get_instagram_user_id(ig_user_id=None):
+            return "user-1"
+
+        drained = TokenBucket(rate=publishing.RATE_LIMIT_CALLS_PER_HOUR / 3600, capacity=publishing.RATE_LIMIT_CALLS_PER_HOUR)
+        # Ten calls in debt: the next token is further away than the publish deadline
+        drained._reserve(publishing.RATE_LIMIT_CALLS_PER_HOUR + 10)
+        with mock.patch.object(publishing, "_rate_limiter", drained):
+            result = asyncio.run(publishing.post_ig_user_media_publish(
+                fake_request, None, fake_get_instagram_user_id, "container-rate-limited",
+            ))
+        self.assertFalse(result.successful)
+        self.assertIn("Rate limited", result.error)
+        self.assertEqual(calls, [])
+        self.assertLess(drained.tokens, -9)
+
+
+if __name__ == "__main__":
+    unittest.main()